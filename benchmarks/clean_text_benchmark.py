@@ -0,0 +1,70 @@
+"""
+Micro-benchmark for clean_text on the sample job files in data/.
+
+Run from the repository root:
+
+    python -m benchmarks.clean_text_benchmark
+"""
+import argparse
+import re
+import timeit
+from typing import Callable, List
+import pandas as pd
+from src.utils.helpers import load_saved_jobs
+from src.utils.text import clean_series, clean_text, clean_texts
+
+def legacy_clean_text(text: str) -> str:
+    """The original implementation: two uncompiled re.sub calls per value."""
+    if not isinstance(text, str):
+        return str(text)
+
+    text = re.sub(r'\s+', ' ', text)
+    text = re.sub(r'[^\w\s.,$]', '', text)
+    return text.strip()
+
+def sample_values(data_dir: str, repeat: int) -> List[str]:
+    """Every field value of every saved job, repeated to get a measurable workload."""
+    values = [str(value) for job in load_saved_jobs(data_dir) for value in job.values()]
+    if not values:
+        raise SystemExit(f"No saved jobs found in {data_dir}")
+    return values * repeat
+
+def best_time(func: Callable[[], object], number: int) -> float:
+    """Best of five timings of number calls, in seconds per call."""
+    return min(timeit.repeat(func, number=number, repeat=5)) / number
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark clean_text on the sample data')
+    parser.add_argument('--data-dir', default='data', help='Directory with saved job files')
+    parser.add_argument('--repeat', type=int, default=50, help='Times to repeat the sample values')
+    parser.add_argument('--number', type=int, default=3, help='Calls per timing')
+    args = parser.parse_args()
+
+    values = sample_values(args.data_dir, args.repeat)
+    series = pd.Series(values)
+    expected = [legacy_clean_text(value) for value in values]
+    assert [clean_text(value) for value in values] == expected
+    assert clean_texts(values) == expected
+    assert clean_series(series).tolist() == expected
+
+    candidates = {
+        'legacy clean_text': lambda: [legacy_clean_text(value) for value in values],
+        'clean_text': lambda: [clean_text(value) for value in values],
+        'clean_texts': lambda: clean_texts(values),
+        'clean_series': lambda: clean_series(series),
+        'pandas .str (legacy regexes)': lambda: (
+            series.str.replace(r'\s+', ' ', regex=True)
+            .str.replace(r'[^\w\s.,$]', '', regex=True)
+            .str.strip()
+        ),
+    }
+
+    print(f"{len(values)} values ({len(set(values))} distinct) from {args.data_dir}")
+    baseline = None
+    for name, func in candidates.items():
+        seconds = best_time(func, args.number)
+        baseline = baseline or seconds
+        print(f"{name:<30} {seconds * 1000:8.2f} ms  {baseline / seconds:5.1f}x")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,117 @@
+"""
+Benchmark notification matching against many saved-search terms, and
+routing to many subscribers.
+
+Run from the repository root:
+
+    python -m benchmarks.matcher_benchmark
+"""
+import argparse
+import random
+import timeit
+from typing import Callable, Dict, List
+from src.utils.helpers import load_saved_jobs
+from src.utils.matching import CriteriaMatcher
+from src.utils.subscriptions import Subscriber, SubscriptionIndex
+
+def legacy_matches_criteria(config: Dict, job: Dict) -> bool:
+    """The original JobNotifier._matches_criteria: a substring scan per term."""
+    title = job.get('title', '').lower()
+    description = job.get('description', '').lower()
+    for keyword in config.get('keywords', []):
+        if keyword.lower() in title or keyword.lower() in description:
+            return True
+    location = job.get('location', '').lower()
+    for loc in config.get('locations', []):
+        if loc.lower() in location:
+            return True
+    company = job.get('company', '').lower()
+    for comp in config.get('companies', []):
+        if comp.lower() in company:
+            return True
+    return False
+
+def sample_config(jobs: List[Dict], terms: int, seed: int) -> Dict:
+    """Config of made-up terms, a few of them taken from the jobs so some match."""
+    rng = random.Random(seed)
+    words = [word for job in jobs for word in str(job.get('title', '')).split() if len(word) > 3]
+
+    def made_up(count: int) -> List[str]:
+        return [''.join(rng.choice('abcdefghijklmnopqrstuvwxyz') for _ in range(rng.randint(4, 12)))
+                for _ in range(count)]
+
+    keywords = made_up(terms) + rng.sample(words, min(3, len(words)))
+    rng.shuffle(keywords)
+    return {'keywords': keywords, 'locations': made_up(terms // 4), 'companies': made_up(terms // 4)}
+
+def sample_subscribers(config: Dict, count: int, seed: int) -> List[Subscriber]:
+    """Subscribers with a few rules each, drawn from the sample config's terms."""
+    rng = random.Random(seed)
+    return [
+        Subscriber(f'team-{number}', f'team-{number}@example.com',
+                   keywords=rng.sample(config['keywords'], 3),
+                   locations=rng.sample(config['locations'], 1),
+                   companies=rng.sample(config['companies'], 1))
+        for number in range(count)
+    ]
+
+def best_time(func: Callable[[], object], number: int) -> float:
+    """Best of five timings of number calls, in seconds per call."""
+    return min(timeit.repeat(func, number=number, repeat=5)) / number
+
+def report(candidates: Dict[str, Callable[[], object]], number: int) -> None:
+    """Print the time of each candidate and its speedup over the first."""
+    baseline = None
+    for name, func in candidates.items():
+        seconds = best_time(func, number)
+        baseline = baseline or seconds
+        print(f"{name:<30} {seconds * 1000:8.2f} ms  {baseline / seconds:5.1f}x")
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark notification matching')
+    parser.add_argument('--data-dir', default='data', help='Directory with saved job files')
+    parser.add_argument('--repeat', type=int, default=20, help='Times to repeat the sample jobs')
+    parser.add_argument('--terms', type=int, default=400, help='Keywords in the config')
+    parser.add_argument('--subscribers', type=int, default=1000, help='Subscribers to route jobs to')
+    parser.add_argument('--number', type=int, default=1, help='Calls per timing')
+    args = parser.parse_args()
+
+    sample = [{key: value if isinstance(value, str) else '' for key, value in job.items()}
+              for job in load_saved_jobs(args.data_dir)]
+    if not sample:
+        raise SystemExit(f"No saved jobs found in {args.data_dir}")
+    jobs = sample * args.repeat
+    config = sample_config(sample, args.terms, seed=1)
+    matcher = CriteriaMatcher.from_config(config)
+    assert [matcher.is_match(job) for job in jobs] == [legacy_matches_criteria(config, job) for job in jobs]
+
+    candidates = {
+        'legacy _matches_criteria': lambda: [legacy_matches_criteria(config, job) for job in jobs],
+        'CriteriaMatcher.is_match': lambda: [matcher.is_match(job) for job in jobs],
+        'CriteriaMatcher.matches': lambda: [matcher.matches(job) for job in jobs],
+    }
+
+    print(f"{len(jobs)} jobs, {sum(map(len, config.values()))} terms")
+    report(candidates, args.number)
+
+    subscribers = sample_subscribers(config, args.subscribers, seed=2)
+    matchers = [(subscriber.subscriber_id, CriteriaMatcher(**subscriber.rules())) for subscriber in subscribers]
+    index = SubscriptionIndex(subscribers)
+    routed = jobs[:len(sample)]
+
+    def per_subscriber() -> List[Dict]:
+        routes = []
+        for job in routed:
+            matched = ((subscriber_id, matcher.matches(job)) for subscriber_id, matcher in matchers)
+            routes.append({subscriber_id: rules for subscriber_id, rules in matched if rules})
+        return routes
+
+    assert [index.route(job) for job in routed] == per_subscriber()
+    print(f"\n{len(routed)} jobs routed to {len(subscribers)} subscribers")
+    report({
+        'matcher per subscriber': per_subscriber,
+        'SubscriptionIndex.route': lambda: [index.route(job) for job in routed],
+    }, args.number)
+
+if __name__ == '__main__':
+    main()
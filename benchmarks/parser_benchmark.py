@@ -0,0 +1,112 @@
+"""
+Micro-benchmark for the parser backends on Indeed result pages built from the
+sample job files in data/.
+
+Run from the repository root:
+
+    python -m benchmarks.parser_benchmark
+"""
+import argparse
+import html
+import time
+import timeit
+from typing import Callable, List
+from bs4 import BeautifulSoup
+from src.scrapers.job_scraper import IndeedScraper
+from src.scrapers.page_parser import ParsePool
+from src.scrapers.parsers import available_parsers
+from src.utils.helpers import load_saved_jobs
+
+def results_page(jobs: List[dict]) -> str:
+    """An Indeed-style search results page listing the given jobs."""
+    cards = ''.join(
+        '<div class="job_seen_beacon"><table><tr><td class="resultContent">'
+        f'<h2 class="jobTitle css-1h4a4n5"><a href="/rc/clk?jk={index:016x}&amp;from=serp">'
+        f'<span title="{html.escape(str(job.get("title", "")))}">{html.escape(str(job.get("title", "")))}</span></a></h2>'
+        f'<span class="companyName">{html.escape(str(job.get("company", "")))}</span>'
+        f'<div class="companyLocation">{html.escape(str(job.get("location", "")))}</div>'
+        f'<div class="salary-snippet">{html.escape(str(job.get("salary", "")))}</div>'
+        '</td></tr></table></div>'
+        for index, job in enumerate(jobs)
+    )
+    return f'<html><head><title>Jobs</title></head><body><div id="mosaic">{cards}</div></body></html>'
+
+def legacy_extract(scraper: IndeedScraper, page: str) -> List[dict]:
+    """The original path: BeautifulSoup on html.parser and find() calls per card."""
+    soup = BeautifulSoup(page, 'html.parser')
+    jobs = []
+    for card in soup.find_all('div', class_='job_seen_beacon'):
+        title_elem = card.find('h2', class_='jobTitle')
+        jobs.append({
+            'title': title_elem.text.strip(),
+            'company': card.find('span', class_='companyName').text.strip(),
+            'location': card.find('div', class_='companyLocation').text.strip(),
+            'url': title_elem.find('a', href=True)['href'],
+        })
+    return jobs
+
+def best_time(func: Callable[[], object], number: int) -> float:
+    """Best of five timings of number calls, in seconds per call."""
+    return min(timeit.repeat(func, number=number, repeat=5)) / number
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the parser backends on a results page')
+    parser.add_argument('--data-dir', default='data', help='Directory with saved job files')
+    parser.add_argument('--cards', type=int, default=15, help='Job cards per results page')
+    parser.add_argument('--number', type=int, default=50, help='Pages parsed per timing')
+    parser.add_argument('--pool-workers', type=int, default=0,
+                        help='Also time parsing --pool-pages pages in a ParsePool of this many processes')
+    parser.add_argument('--pool-pages', type=int, default=2000, help='Pages parsed for the pool timing')
+    args = parser.parse_args()
+
+    jobs = load_saved_jobs(args.data_dir)
+    if not jobs:
+        raise SystemExit(f"No saved jobs found in {args.data_dir}")
+    page = results_page((jobs * (args.cards // len(jobs) + 1))[:args.cards])
+
+    def extract(scraper: IndeedScraper) -> List[dict]:
+        doc = scraper.parser.parse(page)
+        return [scraper._extract_job_data(card) for card in scraper.extractor.items(scraper.parser, doc)]
+
+    scrapers = {name: IndeedScraper(parser=name, use_cache=False) for name in available_parsers()}
+    expected = extract(scrapers['bs4'])
+    assert all(extract(scraper) == expected for scraper in scrapers.values())
+
+    candidates = {'legacy (html.parser + find)': lambda: legacy_extract(scrapers['bs4'], page)}
+    candidates.update({name: (lambda scraper=scraper: extract(scraper)) for name, scraper in scrapers.items()})
+
+    print(f"{args.cards} cards per page, {len(page)} bytes")
+    baseline = None
+    for name, func in candidates.items():
+        seconds = best_time(func, args.number)
+        baseline = baseline or seconds
+        print(f"{name:<30} {seconds * 1000:8.2f} ms  {baseline / seconds:5.1f}x")
+
+    if args.pool_workers:
+        pool_throughput(page, args.pool_workers, args.pool_pages)
+
+def pool_throughput(page: str, workers: int, pages: int) -> None:
+    """Pages per second parsed in the calling thread and in a ParsePool, per backend."""
+    print(f"\n{pages} results pages, {workers} worker processes")
+    with ParsePool(workers) as pool:
+        for name in available_parsers():
+            page_parser = IndeedScraper(parser=name, use_cache=False).page_parser
+            # Start the workers and warm their caches before timing
+            for future in [pool.submit(page_parser.parse_results_page, page) for _ in range(workers)]:
+                future.result()
+
+            start = time.perf_counter()
+            for _ in range(pages):
+                page_parser.parse_results_page(page)
+            inline = time.perf_counter() - start
+
+            start = time.perf_counter()
+            futures = [pool.submit(page_parser.parse_results_page, page) for _ in range(pages)]
+            for future in futures:
+                future.result()
+            pooled = time.perf_counter() - start
+
+            print(f"{name:<30} {pages / inline:8.0f} pages/s inline  {pages / pooled:8.0f} pages/s pooled")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+"""
+Benchmark a notifier run's startup and save against the size of its history:
+the old last_notified.json rewrite versus SeenLog, with and without a Bloom filter.
+
+Run from the repository root:
+
+    python -m benchmarks.seen_log_benchmark
+"""
+import argparse
+import json
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, List
+from src.utils.seen_log import SeenLog
+
+def legacy_run(path: Path, batch: List[str]) -> None:
+    """Load the whole JSON dict, check and add a batch, and rewrite it with indent=2."""
+    with open(path, 'r') as f:
+        notified = json.load(f)
+    for key in batch:
+        if key not in notified:
+            notified[key] = datetime.now().isoformat()
+    with open(path, 'w') as f:
+        json.dump(notified, f, indent=2)
+
+def seen_log_run(path: Path, batch: List[str], bloom_capacity=None) -> None:
+    """Open the log, check and add a batch, and append it."""
+    log = SeenLog(str(path), ttl_days=None, bloom_capacity=bloom_capacity)
+    for key in batch:
+        if key not in log:
+            log.add(key)
+    log.flush()
+
+def timed(run: Callable[[List[str]], None], batches: List[List[str]]) -> float:
+    """Mean seconds per run over the batches."""
+    start = time.perf_counter()
+    for batch in batches:
+        run(batch)
+    return (time.perf_counter() - start) / len(batches)
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark notified-job history storage')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 100000, 500000], help='History sizes')
+    parser.add_argument('--batch', type=int, default=50, help='New jobs per run')
+    parser.add_argument('--runs', type=int, default=5, help='Runs to average')
+    args = parser.parse_args()
+
+    now = datetime.now().isoformat(timespec='seconds')
+    print(f"{'history':>8} {'legacy json':>12} {'SeenLog':>10} {'+ bloom':>10}")
+    for size in args.sizes:
+        history = [f'indeed:{number:016x}' for number in range(size)]
+        batches = [[f'linkedin:{run}-{number}' for number in range(args.batch)] for run in range(args.runs)]
+        with tempfile.TemporaryDirectory() as tmp:
+            legacy_path = Path(tmp) / 'last_notified.json'
+            legacy_path.write_text(json.dumps({key: now for key in history}, indent=2))
+            log_path = Path(tmp) / 'seen.txt'
+            log_path.write_text(''.join(f"{now}\t{key}\n" for key in history))
+            bloom_path = Path(tmp) / 'bloom.txt'
+            bloom_path.write_text(log_path.read_text())
+            SeenLog(str(bloom_path), ttl_days=None, bloom_capacity=2 * size)
+
+            legacy = timed(lambda batch: legacy_run(legacy_path, batch), batches)
+            plain = timed(lambda batch: seen_log_run(log_path, batch), batches)
+            bloom = timed(lambda batch: seen_log_run(bloom_path, batch, 2 * size), batches)
+        print(f"{size:>8} {legacy * 1000:>9.1f} ms {plain * 1000:>7.1f} ms {bloom * 1000:>7.1f} ms")
+
+if __name__ == '__main__':
+    main()
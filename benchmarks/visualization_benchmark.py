@@ -0,0 +1,64 @@
+"""
+Benchmark the data preparation behind JobVisualizer's charts, without rendering:
+one pd.DataFrame(jobs) per plot as before, versus the visualizer's shared frame
+and memoized aggregates.
+
+Run from the repository root:
+
+    python -m benchmarks.visualization_benchmark
+"""
+import argparse
+import tempfile
+import timeit
+from typing import Dict, List
+import pandas as pd
+from src.utils.helpers import load_saved_jobs
+from src.utils.visualization import JobVisualizer
+
+def legacy_aggregates(jobs: List[Dict]) -> list:
+    """The counts the bar and pie plots used to compute, each from its own DataFrame."""
+    return [
+        pd.DataFrame(jobs)['company'].value_counts().head(10),
+        pd.DataFrame(jobs)['location'].value_counts().head(10),
+        pd.DataFrame(jobs)['job_type'].value_counts(),
+    ]
+
+def shared_aggregates(visualizer: JobVisualizer, jobs: List[Dict]) -> list:
+    """The same counts from the visualizer's shared, memoized state."""
+    visualizer.clear_cache()
+    return [
+        visualizer._value_counts(jobs, 'company').head(10),
+        visualizer._value_counts(jobs, 'location').head(10),
+        visualizer._value_counts(jobs, 'job_type'),
+    ]
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark visualization data preparation')
+    parser.add_argument('--data-dir', default='data', help='Directory with saved job files')
+    parser.add_argument('--repeat', type=int, default=200, help='Times to repeat the sample jobs')
+    parser.add_argument('--number', type=int, default=3, help='Calls per timing')
+    args = parser.parse_args()
+
+    jobs = load_saved_jobs(args.data_dir) * args.repeat
+    if not jobs:
+        raise SystemExit(f"No saved jobs found in {args.data_dir}")
+
+    with tempfile.TemporaryDirectory() as output_dir:
+        visualizer = JobVisualizer(output_dir)
+        for legacy_counts, shared_counts in zip(legacy_aggregates(jobs), shared_aggregates(visualizer, jobs)):
+            assert legacy_counts.to_dict() == shared_counts.to_dict()
+        legacy = min(timeit.repeat(lambda: legacy_aggregates(jobs), number=args.number, repeat=5)) / args.number
+        shared = min(timeit.repeat(lambda: shared_aggregates(visualizer, jobs),
+                                   number=args.number, repeat=5)) / args.number
+        frame = visualizer.frame(jobs)
+        cached = min(timeit.repeat(lambda: visualizer._value_counts(jobs, 'company'), number=100, repeat=5)) / 100
+
+    print(f"{len(jobs)} jobs")
+    print(f"{'DataFrame per plot':<30} {legacy * 1000:8.2f} ms")
+    print(f"{'shared frame, first build':<30} {shared * 1000:8.2f} ms")
+    print(f"{'memoized counts':<30} {cached * 1000:8.3f} ms")
+    print(f"frame memory: {frame.memory_usage(deep=True).sum() / 1e6:.1f} MB "
+          f"vs {pd.DataFrame(jobs).memory_usage(deep=True).sum() / 1e6:.1f} MB untyped")
+
+if __name__ == '__main__':
+    main()
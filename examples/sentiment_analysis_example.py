@@ -29,7 +29,7 @@ def analyze_job_postings(scraper, max_pages: int = 2):
     
     return job_postings
 
-def generate_sentiment_visualizations(visualizer, job_postings, output_dir: Path):
+def generate_sentiment_visualizations(visualizer, sentiment_analyzer, job_postings, output_dir: Path):
     """Generate various sentiment analysis visualizations."""
     logger.info("\nGenerating sentiment visualizations...")
     
@@ -47,14 +47,11 @@ def generate_sentiment_visualizations(visualizer, job_postings, output_dir: Path
             save_path=str(output_dir / f"wordcloud_{sentiment}.png")
         )
     
-    # 3. Sentiment by company
-    companies = set(job['company'] for job in job_postings)
-    for company in companies:
-        company_jobs = [job for job in job_postings if job['company'] == company]
-        company_analysis = sentiment_analyzer.analyze_company_sentiment(company_jobs)
+    # 3. Sentiment by company, aggregated for all companies in one pass
+    for company_analysis in sentiment_analyzer.analyze_companies(job_postings).values():
         visualizer.plot_company_sentiment(
             company_analysis,
-            save_path=str(output_dir / f"company_sentiment_{company}.png")
+            save_path=str(output_dir / f"company_sentiment_{company_analysis['company']}.png")
         )
     
     # 4. Sentiment score distribution
@@ -85,7 +82,7 @@ def main():
             return
 
         # Generate visualizations
-        generate_sentiment_visualizations(visualizer, job_postings, output_dir)
+        generate_sentiment_visualizations(visualizer, sentiment_analyzer, job_postings, output_dir)
 
         # Print summary
         logger.info("\nAnalysis Summary:")
@@ -66,4 +66,4 @@ if __name__ == "__main__":
     
     # Save the data
     from src.utils.helpers import save_to_json
-    save_to_json(jobs, f"data/sample_jobs_{os.path.basename(__file__)}_{os.getpid()}.json") 
\ No newline at end of file
+    save_to_json(jobs, "sample_jobs")
\ No newline at end of file
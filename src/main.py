@@ -1,10 +1,19 @@
 import argparse
 import logging
-from typing import List, Dict
+from typing import Iterator, List, Dict, Optional
 from urllib.parse import quote
 from datetime import datetime
 from src.scrapers.job_scraper import IndeedScraper, LinkedInScraper
-from src.utils.helpers import save_to_json, save_to_csv, validate_url
+from src.scrapers.page_parser import ParsePool
+from src.scrapers.seen_index import SeenJobIndex
+from src.utils.dedup import MinHashDeduplicator
+from src.utils.job_store import JobStore
+from src.utils.pipeline import build_pipeline
+from src.utils.sentiment_analyzer import SentimentAnalyzer
+from src.utils.sentiment_cache import get_sentiment_cache
+from src.utils.helpers import (
+    JsonLinesWriter, iter_json_lines, json_lines_path, save_to_json, save_to_csv, save_to_parquet, validate_url
+)
 from src.utils.visualization import JobVisualizer
 
 # Configure logging
@@ -14,23 +23,35 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-def scrape_jobs(
+def iter_jobs(
     platform: str,
     search_query: str,
     location: str,
     max_pages: int = 5,
-    output_format: str = 'json'
-) -> List[Dict]:
-    """Scrape job listings from specified platform."""
+    use_cache: bool = True,
+    seen_index: Optional[SeenJobIndex] = None,
+    deduplicator: Optional[MinHashDeduplicator] = None,
+    parse_pool: Optional[ParsePool] = None
+) -> Iterator[Dict]:
+    """Yield job listings from specified platform as they are scraped.
+    
+    When seen_index is given, only postings not seen by earlier runs are
+    returned and pagination stops once a page is mostly known. A
+    deduplicator drops near-duplicates of postings it has already seen.
+    With a parse_pool, pages are parsed in worker processes while the
+    next ones are fetched.
+    """
     # URL encode the query parameters
     encoded_query = quote(search_query)
     encoded_location = quote(location)
     
     if platform.lower() == 'indeed':
-        scraper = IndeedScraper()
+        scraper = IndeedScraper(use_cache=use_cache, seen_index=seen_index, deduplicator=deduplicator,
+                                parse_pool=parse_pool)
         base_url = f"https://www.indeed.com/jobs?q={encoded_query}&l={encoded_location}"
     elif platform.lower() == 'linkedin':
-        scraper = LinkedInScraper()
+        scraper = LinkedInScraper(use_cache=use_cache, seen_index=seen_index, deduplicator=deduplicator,
+                                  parse_pool=parse_pool)
         base_url = f"https://www.linkedin.com/jobs/search/?keywords={encoded_query}&location={encoded_location}"
     else:
         raise ValueError(f"Unsupported platform: {platform}")
@@ -39,7 +60,29 @@ def scrape_jobs(
         raise ValueError(f"Invalid URL format: {base_url}")
 
     logger.info(f"Scraping {platform} for '{search_query}' in {location}")
-    jobs = scraper.scrape_job_listings(base_url, max_pages)
+    yield from scraper.iter_job_listings(base_url, max_pages)
+
+def scrape_jobs(
+    platform: str,
+    search_query: str,
+    location: str,
+    max_pages: int = 5,
+    output_format: str = 'json',
+    use_cache: bool = True,
+    seen_index: Optional[SeenJobIndex] = None,
+    deduplicator: Optional[MinHashDeduplicator] = None,
+    parse_pool: Optional[ParsePool] = None
+) -> List[Dict]:
+    """Scrape job listings from specified platform.
+    
+    When seen_index is given, only postings not seen by earlier runs are
+    returned and pagination stops once a page is mostly known. A
+    deduplicator drops near-duplicates of postings it has already seen.
+    With a parse_pool, pages are parsed in worker processes while the
+    next ones are fetched.
+    """
+    jobs = list(iter_jobs(platform, search_query, location, max_pages, use_cache, seen_index, deduplicator,
+                          parse_pool))
     logger.info(f"Found {len(jobs)} jobs")
 
     return jobs
@@ -54,30 +97,95 @@ def main():
                       help='Location to search for jobs')
     parser.add_argument('--max-pages', type=int, default=5,
                       help='Maximum number of pages to scrape')
-    parser.add_argument('--output-format', choices=['json', 'csv'], default='json',
-                      help='Output format for the scraped data')
+    parser.add_argument('--output-format', choices=['json', 'csv', 'jsonl', 'parquet'], default='json',
+                      help='Output format for the scraped data; jsonl streams jobs as they are scraped')
+    parser.add_argument('--output-file',
+                      help='JSON Lines file to write or resume (jsonl only)')
+    parser.add_argument('--sentiment', action='store_true',
+                      help='Attach sentiment analysis to each job (jsonl only)')
     parser.add_argument('--visualize', action='store_true',
                       help='Generate visualizations of the scraped data')
+    parser.add_argument('--no-cache', action='store_true',
+                      help='Bypass the on-disk HTTP response cache')
+    parser.add_argument('--incremental', action='store_true',
+                      help='Only scrape postings not seen by earlier runs')
+    parser.add_argument('--seen-index', default='data/seen_jobs.txt',
+                      help='File tracking already scraped postings for --incremental')
+    parser.add_argument('--dedup', action='store_true',
+                      help='Drop near-duplicate postings, e.g. reposts with a new requisition number')
+    parser.add_argument('--store',
+                      help='SQLite job store to upsert scraped jobs into, e.g. data/jobs.sqlite3; '
+                           'visualizations then cover every stored job for the platform')
+    parser.add_argument('--parse-workers', type=int, default=0,
+                      help='Parse pages in this many worker processes while the next pages are fetched '
+                           '(default: parse in the scraping thread)')
 
     args = parser.parse_args()
 
+    parse_pool = ParsePool(args.parse_workers) if args.parse_workers > 0 else None
     try:
-        # Scrape jobs
-        jobs = scrape_jobs(
-            args.platform,
-            args.query,
-            args.location,
-            args.max_pages,
-            args.output_format
-        )
+        seen_index = SeenJobIndex(args.seen_index) if args.incremental else None
+        store = JobStore(args.store) if args.store else None
+        deduplicator = MinHashDeduplicator() if args.dedup else None
 
-        # Save data
-        filename = f"{args.platform}_{args.query}_{args.location}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        if args.output_format == 'json':
-            filepath = save_to_json(jobs, filename)
+        if args.output_format == 'jsonl':
+            # Stream jobs to disk as they are scraped; re-running resumes the same file
+            filepath = args.output_file or json_lines_path(f"{args.platform}_{args.query}_{args.location}")
+            analyzer = None
+            if args.sentiment:
+                analyzer = SentimentAnalyzer(cache=None if args.no_cache else get_sentiment_cache())
+            pipeline = build_pipeline(
+                iter_jobs(
+                    args.platform,
+                    args.query,
+                    args.location,
+                    args.max_pages,
+                    use_cache=not args.no_cache,
+                    seen_index=seen_index,
+                    deduplicator=deduplicator,
+                    parse_pool=parse_pool
+                ),
+                analyzer=analyzer
+            )
+            with JsonLinesWriter(filepath) as writer:
+                def sink(job: Dict) -> None:
+                    writer.write(job)
+                    if store:
+                        store.add(job)
+                pipeline.run(sink)
+            logger.info(f"Streamed {writer.written} new jobs to {filepath}")
+            jobs = list(iter_json_lines(filepath)) if args.visualize else []
         else:
-            filepath = save_to_csv(jobs, filename)
-        logger.info(f"Data saved to {filepath}")
+            # Scrape jobs
+            jobs = scrape_jobs(
+                args.platform,
+                args.query,
+                args.location,
+                args.max_pages,
+                args.output_format,
+                use_cache=not args.no_cache,
+                seen_index=seen_index,
+                deduplicator=deduplicator,
+                parse_pool=parse_pool
+            )
+
+            # Save data
+            filename = f"{args.platform}_{args.query}_{args.location}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            if args.output_format == 'json':
+                filepath = save_to_json(jobs, filename)
+            elif args.output_format == 'parquet':
+                filepath = save_to_parquet(jobs, filename)
+            else:
+                filepath = save_to_csv(jobs, filename)
+            logger.info(f"Data saved to {filepath}")
+            if store:
+                store.upsert_many(jobs)
+
+        if store:
+            store.flush()
+            logger.info(f"Job store {args.store} now holds {len(store)} jobs")
+            if args.visualize:
+                jobs = store.query(source=args.platform)
 
         # Generate visualizations if requested
         if args.visualize and jobs:
@@ -92,6 +200,9 @@ def main():
     except Exception as e:
         logger.error(f"Error occurred: {str(e)}")
         raise
+    finally:
+        if parse_pool:
+            parse_pool.close()
 
 if __name__ == '__main__':
     main() 
\ No newline at end of file
@@ -0,0 +1,180 @@
+import re
+from typing import Any, Dict, Iterable, List, Optional, Union
+import logging
+from src.scrapers.parsers import ParserBackend, Selector
+
+logger = logging.getLogger(__name__)
+
+# Compound selectors of a descendant selector; quoted attribute values may hold spaces
+_COMPOUND = re.compile(r'(?:[^\s\[]+|\[[^\]]*\])+')
+
+FieldSpec = Union[str, Dict[str, Any]]
+
+class Field:
+    """
+    One field of a site spec, e.g. {'selector': 'h2.jobTitle a[href]', 'attr': 'href'}.
+
+    Spec keys:
+        selector: Descendant CSS selector of compound selectors (tag, one class, id, attributes)
+        attr: Take this attribute instead of the element's text
+        index: Take the n-th match instead of the first
+        all: Take every match, as a list
+        contains: Only consider matches whose text contains this, ignoring case
+        default: Value when nothing matches (None, or [] with all)
+        required: A listing missing this field is dropped
+
+    A bare string is shorthand for {'selector': string}.
+    """
+
+    __slots__ = ('name', 'path', 'target', 'ancestors', 'attr', 'index', 'all', 'contains', 'default',
+                 'required', 'first_only')
+
+    def __init__(self, name: str, spec: FieldSpec):
+        if isinstance(spec, str):
+            spec = {'selector': spec}
+        unknown = set(spec) - {'selector', 'attr', 'index', 'all', 'contains', 'default', 'required'}
+        if unknown or 'selector' not in spec:
+            raise ValueError(f"Invalid spec for field {name!r}: {spec!r}")
+
+        self.path = tuple(Selector.from_css(part) for part in _COMPOUND.findall(spec['selector']))
+        if not self.path:
+            raise ValueError(f"Empty selector for field {name!r}")
+        self.name = name
+        self.target = self.path[-1]
+        self.ancestors = self.path[-2::-1]
+        self.attr = spec.get('attr')
+        self.index = spec.get('index', 0)
+        self.all = spec.get('all', False)
+        self.contains = spec['contains'].lower() if spec.get('contains') else None
+        self.default = spec.get('default', [] if self.all else None)
+        self.required = spec.get('required', False)
+        # Whether the first match alone decides the value
+        self.first_only = not (self.index or self.all or self.contains)
+
+    def value(self, parser: ParserBackend, matches: Iterable[Any]) -> Any:
+        """The field's value given its matching elements in document order."""
+        values = []
+        skipped = 0
+        for element in matches:
+            text = None
+            if self.contains is not None:
+                text = parser.text(element).strip()
+                if self.contains not in text.lower():
+                    continue
+            if skipped < self.index:
+                skipped += 1
+                continue
+
+            if self.attr:
+                value = parser.attr(element, self.attr)
+            else:
+                value = text if text is not None else parser.text(element).strip()
+            if not self.all:
+                return value
+            values.append(value)
+        return values if values else self.default
+
+class FieldGroup:
+    """
+    Fields read from the same node, compiled into one extractor.
+
+    With a native selector engine (selectolax, lxml) each field is a single
+    compiled query, which beats classifying the elements of one walk in Python.
+    On BeautifulSoup, where every find() is a Python traversal, all fields are
+    matched in a single walk of the node's subtree.
+    """
+
+    def __init__(self, fields: Dict[str, FieldSpec]):
+        self.fields = [Field(name, spec) for name, spec in fields.items()]
+        self.targets: List[Selector] = list(dict.fromkeys(field.target for field in self.fields))
+        self.required = [field.name for field in self.fields if field.required]
+        # Fields by target tag, so each element of a walk is only tested against plausible selectors
+        self._by_tag: Dict[Optional[str], List[Field]] = {}
+        for field in self.fields:
+            self._by_tag.setdefault(field.target.tag, []).append(field)
+        self._untagged = self._by_tag.pop(None, [])
+
+    def _walk(self, parser: ParserBackend, node: Any) -> Dict[str, List[Any]]:
+        """Elements matching each field, from a single walk of node's subtree."""
+        matches: Dict[str, List[Any]] = {field.name: [] for field in self.fields}
+        for element in parser.select_any(node, self.targets):
+            candidates = self._by_tag.get(parser.tag(element), [])
+            if self._untagged:
+                candidates = candidates + self._untagged
+            for field in candidates:
+                if parser.matches(element, field.target) and (
+                        not field.ancestors or parser.has_ancestors(element, field.ancestors)):
+                    matches[field.name].append(element)
+        return matches
+
+    def extract(self, parser: ParserBackend, node: Any) -> Dict[str, Any]:
+        """
+        Evaluate every field against node's descendants.
+
+        Args:
+            parser (ParserBackend): Backend that parsed node
+            node (Any): Element or document to extract from
+
+        Returns:
+            Dict[str, Any]: Value of each field in spec order, or its default when nothing matched
+        """
+        if not self.fields:
+            return {}
+        if parser.native_selectors:
+            values = {}
+            for field in self.fields:
+                if field.first_only:
+                    match = parser.select_path_one(node, field.path)
+                    values[field.name] = field.value(parser, [match] if match is not None else [])
+                else:
+                    values[field.name] = field.value(parser, parser.select_path(node, field.path))
+            return values
+
+        matches = self._walk(parser, node)
+        return {field.name: field.value(parser, matches[field.name]) for field in self.fields}
+
+    def missing(self, values: Dict[str, Any]) -> List[str]:
+        """Required fields without a value."""
+        return [name for name in self.required if values.get(name) in (None, '', [])]
+
+class SiteExtractor:
+    """
+    Extractor compiled from a site spec: plain data describing where a site
+    keeps each field of its result cards and job pages.
+
+    Spec keys:
+        name: Site name
+        source: Value of the 'source' field of its listings
+        listing: {'item': selector of one result card, 'fields': {name: field spec}}
+        detail: {'fields': {name: field spec}} read from a job page
+        next_page: Field spec of the next results page's URL
+    """
+
+    def __init__(self, spec: Dict[str, Any]):
+        unknown = set(spec) - {'name', 'source', 'listing', 'detail', 'next_page'}
+        if unknown:
+            raise ValueError(f"Unknown keys in site spec: {', '.join(sorted(unknown))}")
+        self.name = spec.get('name', '')
+        self.source = spec.get('source')
+
+        listing = spec.get('listing', {})
+        self.item = Selector.from_css(listing['item']) if listing.get('item') else None
+        self.listing = FieldGroup(listing.get('fields', {}))
+        self.detail = FieldGroup(spec.get('detail', {}).get('fields', {}))
+        self.pagination = FieldGroup({'next_page': spec['next_page']} if spec.get('next_page') else {})
+
+    def items(self, parser: ParserBackend, doc: Any) -> List[Any]:
+        """Result cards on a search results page."""
+        return parser.select(doc, self.item) if self.item is not None else []
+
+    def extract_listing(self, parser: ParserBackend, card: Any) -> Dict[str, Any]:
+        """Listing fields of one result card."""
+        return self.listing.extract(parser, card)
+
+    def extract_details(self, parser: ParserBackend, doc: Any) -> Dict[str, Any]:
+        """Detail fields of a job page."""
+        return self.detail.extract(parser, doc)
+
+    def next_page(self, parser: ParserBackend, doc: Any) -> Optional[str]:
+        """Next results page link as it appears on the page, or None."""
+        return self.pagination.extract(parser, doc).get('next_page')
@@ -0,0 +1,73 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, TypeVar
+from urllib.parse import urlparse
+import logging
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+class ConcurrentFetcher:
+    """Fetch many URLs in parallel while staying polite to each host."""
+
+    def __init__(self, max_workers: int = 8, per_host_limit: int = 3, min_host_interval: float = 0.5):
+        """
+        Args:
+            max_workers (int): Total number of worker threads
+            per_host_limit (int): Maximum number of in-flight requests per host
+            min_host_interval (float): Minimum seconds between request starts on one host
+        """
+        self.max_workers = max_workers
+        self.per_host_limit = per_host_limit
+        self.min_host_interval = min_host_interval
+        self._lock = threading.Lock()
+        self._host_slots: Dict[str, threading.Semaphore] = {}
+        self._next_start: Dict[str, float] = {}
+
+    def _get_host_slots(self, host: str) -> threading.Semaphore:
+        """Get the semaphore that caps concurrency for a host."""
+        with self._lock:
+            if host not in self._host_slots:
+                self._host_slots[host] = threading.BoundedSemaphore(self.per_host_limit)
+            return self._host_slots[host]
+
+    def _wait_for_turn(self, host: str) -> None:
+        """Space out request starts on a host by min_host_interval."""
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start.get(host, now))
+            self._next_start[host] = start + self.min_host_interval
+
+        if start > now:
+            time.sleep(start - now)
+
+    def _fetch_one(self, url: str, fetch: Callable[[str], Optional[T]]) -> Optional[T]:
+        """Fetch a single URL inside its host's concurrency budget."""
+        host = urlparse(url).netloc.lower()
+        with self._get_host_slots(host):
+            self._wait_for_turn(host)
+            try:
+                return fetch(url)
+            except Exception as e:
+                logger.error(f"Error fetching {url}: {str(e)}")
+                return None
+
+    def fetch_all(self, urls: List[str], fetch: Callable[[str], Optional[T]]) -> List[Optional[T]]:
+        """
+        Fetch all URLs concurrently.
+
+        Args:
+            urls (List[str]): URLs to fetch
+            fetch (Callable): Function that fetches and parses a single URL
+
+        Returns:
+            List[Optional[T]]: Results in the same order as urls, None for failures
+        """
+        if not urls:
+            return []
+
+        workers = min(self.max_workers, len(urls))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(lambda url: self._fetch_one(url, fetch), urls))
@@ -0,0 +1,126 @@
+import asyncio
+import atexit
+import concurrent.futures
+import threading
+from typing import Any, Coroutine, Dict, Optional, TypeVar
+
+import aiohttp
+import requests
+from requests.structures import CaseInsensitiveDict
+
+T = TypeVar('T')
+
+class HttpResponse:
+    """Response returned by AsyncHttpClient, mirroring the parts of requests.Response we use."""
+
+    def __init__(self, url: str, status_code: int, text: str, headers: Dict[str, str]):
+        self.url = url
+        self.status_code = status_code
+        self.text = text
+        self.headers = CaseInsensitiveDict(headers)
+
+    def raise_for_status(self) -> None:
+        """Raise requests.HTTPError for 4xx/5xx responses."""
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} Error for url: {self.url}", response=self)
+
+class AsyncHttpClient:
+    """
+    asyncio HTTP client with a shared, size-limited connection pool.
+
+    The client owns an event loop running on a background thread, so synchronous
+    code can call `run()` from any thread while all requests share one aiohttp
+    session and its keep-alive connections. Coroutines that use the client must
+    be executed on that loop (via `run()` or `submit()`).
+    """
+
+    def __init__(self, limit: int = 100, limit_per_host: int = 10, timeout: float = 30):
+        """
+        Args:
+            limit (int): Maximum number of open connections overall
+            limit_per_host (int): Maximum number of open connections per host
+            timeout (float): Default total timeout per request in seconds
+        """
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.timeout = timeout
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._lock = threading.Lock()
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """Start the background event loop on first use."""
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=self._loop.run_forever,
+                    name='http-client-loop',
+                    daemon=True
+                )
+                self._thread.start()
+            return self._loop
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Create the pooled session lazily; only ever called on the client loop."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.limit, limit_per_host=self.limit_per_host)
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
+        return self._session
+
+    async def get(self, url: str, headers: Optional[Dict[str, str]] = None,
+                  timeout: Optional[float] = None) -> HttpResponse:
+        """
+        Perform a GET request through the shared connection pool.
+
+        Transport errors are raised as requests exceptions so callers can keep
+        handling requests.RequestException.
+        """
+        session = await self._get_session()
+        request_timeout = aiohttp.ClientTimeout(total=timeout) if timeout else None
+        try:
+            async with session.get(url, headers=headers, timeout=request_timeout) as response:
+                text = await response.text(errors='replace')
+                return HttpResponse(str(response.url), response.status, text, dict(response.headers))
+        except asyncio.TimeoutError as e:
+            raise requests.Timeout(f"Request to {url} timed out") from e
+        except aiohttp.ClientError as e:
+            raise requests.ConnectionError(str(e)) from e
+
+    def submit(self, coro: Coroutine[Any, Any, T]) -> concurrent.futures.Future:
+        """Schedule a coroutine on the client loop and return a concurrent future."""
+        return asyncio.run_coroutine_threadsafe(coro, self._ensure_loop())
+
+    def run(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Run a coroutine on the client loop and block until it completes."""
+        return self.submit(coro).result()
+
+    def close(self) -> None:
+        """Close the pooled session and stop the background loop."""
+        with self._lock:
+            loop, self._loop = self._loop, None
+        if loop is None:
+            return
+
+        if self._session is not None:
+            asyncio.run_coroutine_threadsafe(self._session.close(), loop).result()
+            self._session = None
+        loop.call_soon_threadsafe(loop.stop)
+        self._thread.join()
+        loop.close()
+
+_default_client: Optional[AsyncHttpClient] = None
+_default_client_lock = threading.Lock()
+
+def get_http_client() -> AsyncHttpClient:
+    """Get the process-wide HTTP client shared by all scrapers."""
+    global _default_client
+    with _default_client_lock:
+        if _default_client is None:
+            _default_client = AsyncHttpClient()
+            atexit.register(_default_client.close)
+        return _default_client
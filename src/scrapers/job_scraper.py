@@ -1,15 +1,25 @@
-<<<<<<< HEAD
 import requests
 from bs4 import BeautifulSoup
 from fake_useragent import UserAgent
-import time
-from typing import Dict, List, Optional
+from collections import deque
+from typing import Any, AsyncIterator, Callable, Deque, Dict, Iterator, List, Optional, Tuple, Type
+import concurrent.futures
 import logging
-from urllib.parse import urljoin
-from datetime import datetime
 from src.utils.sentiment_analyzer import SentimentAnalyzer
-from src.utils.helpers import clean_text
-import random
+from src.utils.sentiment_cache import get_sentiment_cache
+from src.utils.helpers import load_saved_jobs, normalize_company
+from src.utils.dedup import MinHashDeduplicator
+from src.utils.urls import job_key
+from src.utils.pipeline import build_pipeline
+from src.scrapers.fetcher import ConcurrentFetcher
+from src.scrapers.http_client import HttpResponse, get_http_client
+from src.scrapers.page_parser import JobPageParser, LinkedInPageParser, ParsePool
+from src.scrapers.parsers import ParserBackend, get_parser
+from src.scrapers import site_specs
+from src.scrapers.rate_limiter import THROTTLE_STATUS_CODES, RateLimiter, get_rate_limiter
+from src.scrapers.response_cache import ResponseCache, get_response_cache
+from src.scrapers.seen_index import SeenJobIndex
+import asyncio
 
 # Configure logging
 logging.basicConfig(
@@ -19,33 +29,137 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 class BaseScraper:
-    def __init__(self):
+    """Base class for job scrapers."""
+    
+    # Freshness lifetimes for cached search result and job detail pages
+    search_cache_ttl = 3600
+    detail_cache_ttl = 86400
+    
+    def __init__(self, rate_limiter: Optional[RateLimiter] = None,
+                 cache: Optional[ResponseCache] = None, use_cache: bool = True,
+                 parser: Optional[str] = None):
         self.ua = UserAgent()
-        self.session = requests.Session()
+        self.http = get_http_client()
+        self.rate_limiter = rate_limiter or get_rate_limiter()
+        self.cache = (cache or get_response_cache()) if use_cache else None
+        # Listing and detail pages are parsed with the fastest installed backend
+        self.parser: ParserBackend = get_parser(parser)
+        self._update_headers()
     
-    def _get_headers(self) -> Dict[str, str]:
-        return {
+    def _update_headers(self):
+        """Update headers with a new random user agent."""
+        self.headers = {
             'User-Agent': self.ua.random,
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
+            'Accept-Encoding': 'gzip, deflate, br',
+            'DNT': '1',
             'Connection': 'keep-alive',
+            'Upgrade-Insecure-Requests': '1',
+            'Sec-Fetch-Dest': 'document',
+            'Sec-Fetch-Mode': 'navigate',
+            'Sec-Fetch-Site': 'none',
+            'Sec-Fetch-User': '?1',
+            'Cache-Control': 'max-age=0'
         }
     
-    def _make_request(self, url: str) -> BeautifulSoup:
-        try:
-            response = self.session.get(url, headers=self._get_headers())
-            response.raise_for_status()
-            return BeautifulSoup(response.text, 'lxml')
-        except Exception as e:
-            logger.error(f"Error making request to {url}: {str(e)}")
-            raise
+    async def _fetch(self, url: str, headers: Dict[str, str], timeout: float, cache_ttl: float) -> HttpResponse:
+        """Fetch a URL through the response cache and the host's rate limit."""
+        entry = self.cache.get(url) if self.cache else None
+        if entry and entry.is_fresh(cache_ttl):
+            return entry.to_response()
+        if entry:
+            headers = {**headers, **entry.validators()}
+        
+        await self.rate_limiter.acquire_async(url)
+        response = await self.http.get(url, headers=headers, timeout=timeout)
+        self.rate_limiter.record_response(url, response.status_code, response.headers.get('Retry-After'))
+        
+        if self.cache:
+            if response.status_code == 304 and entry:
+                self.cache.refresh(url, entry, response.headers)
+                return entry.to_response()
+            if response.status_code == 200:
+                self.cache.put(url, response)
+        
+        return response
+    
+    async def _get_html_async(self, url: str) -> Optional[str]:
+        """Get a page's HTML with retry mechanism."""
+        max_retries = 3
+        retry_delay = 5
+        
+        for attempt in range(max_retries):
+            response = None
+            try:
+                # Update headers with new user agent for each request
+                self._update_headers()
+                
+                response = await self._fetch(url, self.headers, timeout=10, cache_ttl=self.search_cache_ttl)
+                response.raise_for_status()
+                
+                if response.status_code == 200:
+                    return response.text
+                
+            except requests.RequestException as e:
+                logger.error(f"Attempt {attempt + 1}/{max_retries} failed for URL {url}: {str(e)}")
+                if attempt < max_retries - 1:
+                    # Throttled responses already paused the host in the rate limiter
+                    if response is None or response.status_code not in THROTTLE_STATUS_CODES:
+                        await asyncio.sleep(retry_delay)
+                        retry_delay *= 2  # Exponential backoff
+                else:
+                    raise
+    
+    async def _get_soup_async(self, url: str) -> BeautifulSoup:
+        """Get BeautifulSoup object from URL with retry mechanism."""
+        return BeautifulSoup(await self._get_html_async(url) or '', 'lxml')
+    
+    def _get_soup(self, url: str) -> BeautifulSoup:
+        """Blocking wrapper around _get_soup_async."""
+        return self.http.run(self._get_soup_async(url))
+    
+    def _extract_job_data(self, job_element: Any) -> Dict:
+        """Extract job data from a job element parsed by self.parser."""
+        raise NotImplementedError("Subclasses must implement _extract_job_data")
 
-class JobScraper:
-    def __init__(self, base_url: str):
+class JobScraper(BaseScraper):
+    # Selector spec of the site's pages (see site_specs); subclasses set their own
+    site_spec: Optional[Dict] = None
+    page_parser_class: Type[JobPageParser] = JobPageParser
+    # Listings per results page, for sites paginated with a start offset
+    page_size = 10
+    
+    def __init__(self, base_url: str, max_workers: int = 8, per_host_limit: int = 3,
+                 rate_limiter: Optional[RateLimiter] = None,
+                 cache: Optional[ResponseCache] = None, use_cache: bool = True,
+                 seen_index: Optional[SeenJobIndex] = None, known_page_threshold: float = 0.8,
+                 deduplicator: Optional[MinHashDeduplicator] = None, parser: Optional[str] = None,
+                 site_spec: Optional[Dict] = None, parse_pool: Optional[ParsePool] = None,
+                 prefetch_pages: int = 1, fetch_details: bool = True):
+        super().__init__(rate_limiter, cache, use_cache, parser)
         self.base_url = base_url
-        self.sentiment_analyzer = SentimentAnalyzer()
-        self.ua = UserAgent()
-        self.session = requests.Session()
+        # Pages are parsed by a picklable page parser, in process when there is
+        # no parse pool, while this scraper keeps all network state
+        self.page_parser = self.page_parser_class(base_url, site_spec or self.site_spec, self.parser.name)
+        self.extractor = self.page_parser.extractor
+        self.parse_pool = parse_pool
+        # With a parse pool, results pages this far ahead are fetched while earlier ones parse
+        self.prefetch_pages = prefetch_pages
+        self.sentiment_analyzer = SentimentAnalyzer(cache=get_sentiment_cache() if use_cache else None)
+        # Incremental mode: skip known postings and stop once a page is mostly known
+        self.seen_index = seen_index
+        self.known_page_threshold = known_page_threshold
+        # Near-duplicate postings are dropped before any detail fetch or scoring
+        self.deduplicator = deduplicator
+        # Without detail pages, listings carry only what their result cards show
+        self.fetch_details = fetch_details
+        # Request pacing is handled by the rate limiter, the fetcher only caps concurrency
+        self.fetcher = ConcurrentFetcher(
+            max_workers=max_workers,
+            per_host_limit=per_host_limit,
+            min_host_interval=0
+        )
         
     def _get_headers(self) -> Dict[str, str]:
         """Get headers for HTTP requests."""
@@ -61,64 +175,21 @@ class JobScraper:
             'TE': 'Trailers'
         }
     
-    def _make_request(self, url: str) -> Optional[requests.Response]:
+    async def _make_request_async(self, url: str) -> Optional[HttpResponse]:
         """Make an HTTP request with retries and delays."""
-=======
-import logging
-import time
-import random
-from typing import List, Dict
-from bs4 import BeautifulSoup
-import requests
-from fake_useragent import UserAgent
-from utils.helpers import clean_text
-
-logger = logging.getLogger(__name__)
-
-class BaseScraper:
-    """Base class for job scrapers."""
-    
-    def __init__(self):
-        self.ua = UserAgent()
-        self.session = requests.Session()
-        self._update_headers()
-    
-    def _update_headers(self):
-        """Update headers with a new random user agent."""
-        self.headers = {
-            'User-Agent': self.ua.random,
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'DNT': '1',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-            'Sec-Fetch-Dest': 'document',
-            'Sec-Fetch-Mode': 'navigate',
-            'Sec-Fetch-Site': 'none',
-            'Sec-Fetch-User': '?1',
-            'Cache-Control': 'max-age=0'
-        }
-    
-    def _get_soup(self, url: str) -> BeautifulSoup:
-        """Get BeautifulSoup object from URL with retry mechanism."""
->>>>>>> 8ea1b89381d322c3402bc9fb04a78c0131bbf2e5
         max_retries = 3
         retry_delay = 5
         
         for attempt in range(max_retries):
             try:
-<<<<<<< HEAD
                 headers = self._get_headers()
-                response = requests.get(url, headers=headers, timeout=30)
+                response = await self._fetch(url, headers, timeout=30, cache_ttl=self.detail_cache_ttl)
                 
                 if response.status_code == 200:
-                    time.sleep(random.uniform(2, 5))  # Random delay between requests
                     return response
-                elif response.status_code == 403:
-                    logger.warning(f"Rate limited on attempt {attempt + 1}, waiting {retry_delay} seconds")
-                    time.sleep(retry_delay)
-                    retry_delay *= 2  # Exponential backoff
+                elif response.status_code in THROTTLE_STATUS_CODES:
+                    # The rate limiter pauses this host before the next attempt
+                    logger.warning(f"Rate limited on attempt {attempt + 1} for URL: {url}")
                 else:
                     logger.error(f"Error {response.status_code} for URL: {url}")
                     return None
@@ -126,75 +197,257 @@ class BaseScraper:
             except requests.RequestException as e:
                 logger.error(f"Request failed on attempt {attempt + 1}: {str(e)}")
                 if attempt < max_retries - 1:
-                    time.sleep(retry_delay)
+                    await asyncio.sleep(retry_delay)
                     retry_delay *= 2
                 else:
                     return None
         
         return None
     
-    def _extract_job_details(self, soup: BeautifulSoup, job_url: str) -> Dict:
-        """Extract job details from a job listing page."""
-        # This is a template method that should be overridden for specific job sites
-        return {
-            'title': '',
-            'company': '',
-            'location': '',
-            'description': '',
-            'posted_date': '',
-            'job_type': '',
-            'salary': '',
-            'url': job_url,
-            'scraped_date': datetime.now().isoformat()
-        }
+    def _make_request(self, url: str) -> Optional[HttpResponse]:
+        """Blocking wrapper around _make_request_async."""
+        return self.http.run(self._make_request_async(url))
     
-    def _extract_job_listings(self, soup: BeautifulSoup) -> List[Dict]:
-        """Extract job listings from a search results page."""
-        # This is a template method that should be overridden for specific job sites
-        return []
+    def _extract_job_details(self, doc: Any, job_url: str) -> Dict:
+        """Extract job details from a job listing page parsed by self.parser."""
+        return self.page_parser.details(doc, job_url)
     
-    def _get_next_page_url(self, soup: BeautifulSoup) -> Optional[str]:
+    def _extract_job_listings(self, doc: Any) -> List[Dict]:
+        """Extract job listings from a search results page parsed by self.parser."""
+        return self.page_parser.listings(doc)
+    
+    def _extract_job_data(self, job_element: Any) -> Dict:
+        """Extract one listing from a result card, or {} if it lacks a required field."""
+        if not self.extractor:
+            return super()._extract_job_data(job_element)
+        return self.page_parser.listing(job_element)
+    
+    def _get_next_page_url(self, doc: Any) -> Optional[str]:
         """Find the URL for the next page of results."""
-        # This is a template method that should be overridden for specific job sites
-        return None
+        return self.page_parser.next_page_url(doc)
+    
+    def _parse_results_page(self, html: str) -> Tuple[List[Dict], Optional[str]]:
+        """Listings and next page URL of a results page, parsed in the parse pool if there is one."""
+        if self.parse_pool:
+            return self.parse_pool.run(self.page_parser.parse_results_page, html)
+        return self.page_parser.parse_results_page(html)
+    
+    async def _fetch_results_page_async(self, url: str) -> Tuple[List[Dict], Optional[str]]:
+        """Fetch a results page and parse it in the parse pool without blocking the client loop."""
+        html = await self._get_html_async(url)
+        return await asyncio.wrap_future(self.parse_pool.submit(self.page_parser.parse_results_page, html or ''))
+    
+    def _results_pages(self, page_urls: List[str]) -> Iterator[Callable[[], Tuple[List[Dict], Optional[str]]]]:
+        """
+        Yield, per page, a function returning its listings and next page URL.
+        
+        With a parse pool the next prefetch_pages pages are fetched and parsed
+        while the caller handles the current one; without one each page is
+        fetched and parsed when its function is called.
+        """
+        if not self.parse_pool:
+            for url in page_urls:
+                yield lambda url=url: self.page_parser.parse_results_page(self.http.run(self._get_html_async(url)) or '')
+            return
+        
+        pending: Deque[concurrent.futures.Future] = deque()
+        try:
+            for url in page_urls:
+                pending.append(self.http.submit(self._fetch_results_page_async(url)))
+                if len(pending) > self.prefetch_pages:
+                    yield pending.popleft().result
+            while pending:
+                yield pending.popleft().result
+        finally:
+            # Stopping early, e.g. on a mostly known page, abandons pages fetched ahead
+            for future in pending:
+                future.cancel()
+    
+    def _iter_offset_listings(self, url: str, max_pages: int,
+                              fetch_details: Optional[bool] = None) -> Iterator[Dict]:
+        """Yield listings from results pages addressed by a start offset, page by page."""
+        if fetch_details is None:
+            fetch_details = self.fetch_details
+        page_urls = [f"{url}&start={page * self.page_size}" for page in range(max_pages)]
+        try:
+            for page, page_result in enumerate(self._results_pages(page_urls)):
+                try:
+                    page_jobs, _ = page_result()
+                    new_jobs, page_mostly_known = self._filter_seen(page_jobs)
+                    page_jobs = self._drop_duplicates(new_jobs)
+                    if fetch_details:
+                        self.add_details(page_jobs)
+                    logger.info(f"Scraped page {page + 1} of {max_pages}")
+                    
+                except Exception as e:
+                    logger.error(f"Error scraping page {page + 1}: {str(e)}")
+                    continue
+                
+                yield from self._yield_marking_seen(page_jobs, new_jobs)
+                if page_mostly_known:
+                    logger.info(f"Page {page + 1} is mostly already seen, stopping")
+                    break
+        finally:
+            self._flush_seen()
     
     def scrape_job_listings(self, start_url: str, max_pages: int = 5) -> List[Dict]:
         """Scrape job listings from multiple pages."""
-        all_jobs = []
+        return list(self.iter_job_listings(start_url, max_pages))
+    
+    def iter_job_listings(self, start_url: str, max_pages: int = 5,
+                          fetch_details: Optional[bool] = None) -> Iterator[Dict]:
+        """
+        Yield job listings page by page as they are scraped.
+        
+        Args:
+            start_url (str): First results page
+            max_pages (int): Maximum number of results pages to scrape
+            fetch_details (bool, optional): Merge in each listing's detail page;
+                defaults to the scraper's fetch_details. Turn it off when a
+                pipeline details stage fetches them instead.
+        """
+        if fetch_details is None:
+            fetch_details = self.fetch_details
         current_url = start_url
         pages_scraped = 0
         
-        while current_url and pages_scraped < max_pages:
-            logger.info(f"Scraping page {pages_scraped + 1}: {current_url}")
-            response = self._make_request(current_url)
-            if not response:
-                break
-            
-            soup = BeautifulSoup(response.text, 'lxml')
-            jobs = self._extract_job_listings(soup)
-            
-            # Scrape individual job details
-            for job in jobs:
-                job_url = job.get('url')
-                if job_url:
-                    job_details = self.scrape_job_details(job_url)
-                    if job_details:
-                        job.update(job_details)
+        try:
+            while current_url and pages_scraped < max_pages:
+                logger.info(f"Scraping page {pages_scraped + 1}: {current_url}")
+                response = self._make_request(current_url)
+                if not response:
+                    break
+                
+                jobs, next_url = self._parse_results_page(response.text)
+                new_jobs, page_mostly_known = self._filter_seen(jobs)
+                jobs = self._drop_duplicates(new_jobs)
+                
+                if fetch_details:
+                    self.add_details(jobs)
+                
+                yield from self._yield_marking_seen(jobs, new_jobs)
+                if page_mostly_known:
+                    logger.info(f"Page {pages_scraped + 1} is mostly already seen, stopping")
+                    break
+                current_url = next_url
+                pages_scraped += 1
+        finally:
+            self._flush_seen()
+    
+    async def aiter_job_listings(self, start_url: str, max_pages: int = 5) -> AsyncIterator[Dict]:
+        """
+        Async variant of iter_job_listings for consumers running their own event loop.
+        
+        Pages are scraped on a worker thread, so the caller's loop keeps running
+        while requests are in flight.
+        """
+        loop = asyncio.get_running_loop()
+        jobs = self.iter_job_listings(start_url, max_pages)
+        done = object()
+        try:
+            while True:
+                job = await loop.run_in_executor(None, next, jobs, done)
+                if job is done:
+                    break
+                yield job
+        finally:
+            await loop.run_in_executor(None, jobs.close)
+    
+    def _filter_seen(self, jobs: List[Dict]) -> Tuple[List[Dict], bool]:
+        """
+        Drop postings seen in earlier runs when running incrementally.
+        
+        Args:
+            jobs (List[Dict]): Job listings extracted from one results page
             
-            all_jobs.extend(jobs)
-            current_url = self._get_next_page_url(soup)
-            pages_scraped += 1
+        Returns:
+            Tuple[List[Dict], bool]: New listings, and whether the page was mostly known
+        """
+        if self.seen_index is None or not jobs:
+            return jobs, False
         
-        return all_jobs
+        keys = [job_key(job) for job in jobs]
+        new_jobs = [job for job, key in zip(jobs, keys) if not key or key not in self.seen_index]
+        known_ratio = (len(jobs) - len(new_jobs)) / len(jobs)
+        return new_jobs, known_ratio >= self.known_page_threshold
     
-    def scrape_job_details(self, job_url: str) -> Optional[Dict]:
+    def _yield_marking_seen(self, jobs: List[Dict], new_jobs: List[Dict]) -> Iterator[Dict]:
+        """
+        Yield a page's jobs, recording each in the seen index once the consumer asks for the next.
+        
+        A job is only recorded after the consumer has handled it, so postings of
+        a page that failed, or that a consumer stopped before reaching, are
+        scraped again by the next incremental run.
+        
+        Args:
+            jobs (List[Dict]): Jobs to yield
+            new_jobs (List[Dict]): The page's unseen jobs before near-duplicates were
+                dropped; those are recorded once the whole page has been handled
+        """
+        for job in jobs:
+            yield job
+            self._mark_seen([job])
+        self._mark_seen(new_jobs)
+    
+    def _mark_seen(self, jobs: List[Dict]) -> None:
+        if self.seen_index is not None:
+            self.seen_index.add(key for key in map(job_key, jobs) if key)
+    
+    def _drop_duplicates(self, jobs: List[Dict]) -> List[Dict]:
+        """Drop near-duplicates of postings already scraped, when a deduplicator is set."""
+        if self.deduplicator is None or not jobs:
+            return jobs
+        return self.deduplicator.filter(jobs)
+    
+    def _flush_seen(self) -> None:
+        """Persist postings handled during this run to the seen index."""
+        if self.seen_index is not None:
+            self.seen_index.flush()
+    
+    def add_details(self, jobs: List[Dict]) -> None:
+        """Fetch detail pages for a batch of listings concurrently and merge them in place."""
+        jobs_with_url = [job for job in jobs if job.get('url')]
+        details = self.fetcher.fetch_all(
+            [job['url'] for job in jobs_with_url],
+            self.scrape_job_details
+        )
+        
+        for job, job_details in zip(jobs_with_url, details):
+            if job_details:
+                # Fields the detail page lacks keep the value from the result card
+                job.update({name: value for name, value in job_details.items() if value})
+    
+    def _parse_job_details(self, html: str, job_url: str) -> Dict:
+        """Parse a job listing page into a details dict, in the parse pool if there is one."""
+        if self.parse_pool:
+            return self.parse_pool.run(self.page_parser.parse_job_page, html, job_url)
+        return self.page_parser.parse_job_page(html, job_url)
+    
+    async def scrape_job_details_async(self, job_url: str) -> Optional[Dict]:
         """Scrape detailed information from a single job listing."""
+        response = await self._make_request_async(job_url)
+        if not response:
+            return None
+        
+        if self.parse_pool:
+            return await asyncio.wrap_future(
+                self.parse_pool.submit(self.page_parser.parse_job_page, response.text, job_url)
+            )
+        return self.page_parser.parse_job_page(response.text, job_url)
+    
+    def scrape_job_details(self, job_url: str) -> Optional[Dict]:
+        """
+        Blocking variant of scrape_job_details_async.
+        
+        The request runs on the shared HTTP client while parsing stays on the
+        calling thread, or in the parse pool, so concurrent callers do not
+        serialize on the event loop.
+        """
         response = self._make_request(job_url)
         if not response:
             return None
         
-        soup = BeautifulSoup(response.text, 'lxml')
-        return self._extract_job_details(soup, job_url)
+        return self._parse_job_details(response.text, job_url)
 
     def scrape_jobs(self, max_pages: int = 5) -> List[Dict]:
         """
@@ -206,183 +459,97 @@ class BaseScraper:
         Returns:
             List[Dict]: List of job postings with sentiment analysis
         """
-        job_postings = []
-        job_listings = self.scrape_job_listings(self.base_url)
+        return list(self.iter_jobs(max_pages))
+
+    def iter_jobs(self, max_pages: int = 5) -> Iterator[Dict]:
+        """
+        Yield job postings with sentiment analysis as they are scraped.
+        
+        Listings are cleaned and scored in a background pipeline, so the first
+        posting is available long before the last page has been fetched.
         
-        for job in job_listings:
-            job_data = {
+        Args:
+            max_pages (int): Maximum number of pages to scrape
+            
+        Returns:
+            Iterator[Dict]: Job postings with sentiment analysis
+        """
+        # Detail pages are fetched in their own stage, overlapping with scoring
+        pipeline = build_pipeline(
+            self.iter_job_listings(self.base_url, max_pages, fetch_details=False),
+            analyzer=self.sentiment_analyzer,
+            detail_scraper=self if self.fetch_details else None
+        )
+        for job in pipeline:
+            yield {
                 'title': job.get('title', ''),
                 'company': job.get('company', ''),
                 'location': job.get('location', ''),
                 'description': job.get('description', ''),
                 'url': job.get('url', ''),
-                'sentiment_analysis': self.sentiment_analyzer.analyze_job_description(
-                    job.get('description', '')
-                )
+                'sentiment_analysis': job['sentiment_analysis']
             }
-            job_postings.append(job_data)
-        
-        return job_postings
 
-    def get_company_sentiment_analysis(self, company_name: str) -> Dict:
+    def get_company_sentiment_analysis(self, company_name: str,
+                                       job_postings: Optional[List[Dict]] = None) -> Dict:
         """
         Get sentiment analysis for all job postings from a specific company.
         
         Args:
             company_name (str): Name of the company to analyze
+            job_postings (List[Dict], optional): Already collected postings; defaults
+                to the jobs saved under data/
             
         Returns:
             Dict: Company-level sentiment analysis
         """
-        company_jobs = [job for job in self.scrape_jobs() if job['company'].lower() == company_name.lower()]
+        if job_postings is None:
+            job_postings = load_saved_jobs()
+        
+        company_key = normalize_company(company_name)
+        company_jobs = [job for job in job_postings if normalize_company(job.get('company', '')) == company_key]
         return self.sentiment_analyzer.analyze_company_sentiment(company_jobs)
 
-class IndeedScraper(JobScraper):
-    def __init__(self):
-        super().__init__("https://www.indeed.com")
-
-    def _extract_job_listings(self, soup: BeautifulSoup) -> List[Dict]:
-        """Extract job listings from Indeed search results."""
-        jobs = []
-        job_cards = soup.find_all('div', class_='job_seen_beacon')
+    def get_companies_sentiment_analysis(self, job_postings: Optional[List[Dict]] = None) -> Dict[str, Dict]:
+        """
+        Get sentiment analysis for every company in one pass.
         
-        for card in job_cards:
-            title_elem = card.find('h2', class_='jobTitle')
-            company_elem = card.find('span', class_='companyName')
-            location_elem = card.find('div', class_='companyLocation')
+        Args:
+            job_postings (List[Dict], optional): Already collected postings; defaults
+                to the jobs saved under data/
             
-            if title_elem and title_elem.find('a'):
-                job_url = urljoin(self.base_url, title_elem.find('a')['href'])
-                jobs.append({
-                    'title': title_elem.text.strip(),
-                    'company': company_elem.text.strip() if company_elem else '',
-                    'location': location_elem.text.strip() if location_elem else '',
-                    'url': job_url
-                })
-        
-        return jobs
-    
-    def _extract_job_details(self, soup: BeautifulSoup, job_url: str) -> Dict:
-        """Extract job details from an Indeed job listing."""
-        job_details = {
-            'title': '',
-            'company': '',
-            'location': '',
-            'description': '',
-            'posted_date': '',
-            'job_type': '',
-            'salary': '',
-            'url': job_url,
-            'scraped_date': datetime.now().isoformat()
-        }
-        
-        # Extract job title
-        title_elem = soup.find('h1', class_='jobsearch-JobInfoHeader-title')
-        if title_elem:
-            job_details['title'] = title_elem.text.strip()
-        
-        # Extract company name
-        company_elem = soup.find('div', class_='jobsearch-CompanyInfoContainer')
-        if company_elem:
-            job_details['company'] = company_elem.text.strip()
-        
-        # Extract location
-        location_elem = soup.find('div', class_='jobsearch-JobInfoHeader-subtitle')
-        if location_elem:
-            job_details['location'] = location_elem.text.strip()
-        
-        # Extract job description
-        desc_elem = soup.find('div', id='jobDescriptionText')
-        if desc_elem:
-            job_details['description'] = desc_elem.text.strip()
-        
-        # Extract salary
-        salary_elem = soup.find('div', class_='jobsearch-JobMetadataHeader-item')
-        if salary_elem and 'salary' in salary_elem.text.lower():
-            job_details['salary'] = salary_elem.text.strip()
+        Returns:
+            Dict[str, Dict]: Company-level sentiment analysis keyed by normalized company name
+        """
+        if job_postings is None:
+            job_postings = load_saved_jobs()
         
-        return job_details
+        return self.sentiment_analyzer.analyze_companies(job_postings)
+
+class IndeedScraper(JobScraper):
+    site_spec = site_specs.INDEED
+    page_size = 10
     
-    def _get_next_page_url(self, soup: BeautifulSoup) -> Optional[str]:
-        """Find the URL for the next page of Indeed results."""
-        next_link = soup.find('a', {'aria-label': 'Next Page'})
-        if next_link:
-            return urljoin(self.base_url, next_link['href'])
-        return None
+    def __init__(self, **kwargs):
+        super().__init__("https://www.indeed.com", **kwargs)
+    
+    def iter_job_listings(self, url: str, max_pages: int = 5,
+                          fetch_details: Optional[bool] = None) -> Iterator[Dict]:
+        """Yield job listings from Indeed page by page as they are scraped."""
+        return self._iter_offset_listings(url, max_pages, fetch_details)
 
 class LinkedInScraper(JobScraper):
-    def __init__(self):
-        super().__init__("https://www.linkedin.com")
-
-    def _extract_job_listings(self, soup: BeautifulSoup) -> List[Dict]:
-        """Extract job listings from LinkedIn search results."""
-        jobs = []
-        job_cards = soup.find_all('div', class_='base-card')
-        
-        for card in job_cards:
-            title_elem = card.find('h3', class_='base-search-card__title')
-            company_elem = card.find('h4', class_='base-search-card__subtitle')
-            location_elem = card.find('span', class_='job-search-card__location')
-            
-            if title_elem and title_elem.find('a'):
-                job_url = title_elem.find('a')['href']
-                jobs.append({
-                    'title': title_elem.text.strip(),
-                    'company': company_elem.text.strip() if company_elem else '',
-                    'location': location_elem.text.strip() if location_elem else '',
-                    'url': job_url
-                })
-        
-        return jobs
-    
-    def _extract_job_details(self, soup: BeautifulSoup, job_url: str) -> Dict:
-        """Extract job details from a LinkedIn job listing."""
-        job_details = {
-            'title': '',
-            'company': '',
-            'location': '',
-            'description': '',
-            'posted_date': '',
-            'job_type': '',
-            'salary': '',
-            'url': job_url,
-            'scraped_date': datetime.now().isoformat()
-        }
-        
-        # Extract job title
-        title_elem = soup.find('h1', class_='top-card-layout__title')
-        if title_elem:
-            job_details['title'] = title_elem.text.strip()
-        
-        # Extract company name
-        company_elem = soup.find('a', class_='topcard__org-name-link')
-        if company_elem:
-            job_details['company'] = company_elem.text.strip()
-        
-        # Extract location
-        location_elem = soup.find('span', class_='topcard__flavor--bullet')
-        if location_elem:
-            job_details['location'] = location_elem.text.strip()
-        
-        # Extract job description
-        desc_elem = soup.find('div', class_='show-more-less-html__markup')
-        if desc_elem:
-            job_details['description'] = desc_elem.text.strip()
-        
-        # Extract job type and posted date
-        metadata = soup.find_all('span', class_='description__job-criteria-text')
-        if len(metadata) >= 2:
-            job_details['job_type'] = metadata[0].text.strip()
-            job_details['posted_date'] = metadata[1].text.strip()
-        
-        return job_details
+    site_spec = site_specs.LINKEDIN
+    page_parser_class = LinkedInPageParser
+    page_size = 25
     
-    def _get_next_page_url(self, soup: BeautifulSoup) -> Optional[str]:
-        """Find the URL for the next page of LinkedIn results."""
-        next_link = soup.find('button', {'aria-label': 'Next'})
-        if next_link:
-            return urljoin(self.base_url, next_link['href'])
-        return None
+    def __init__(self, **kwargs):
+        super().__init__("https://www.linkedin.com", **kwargs)
+    
+    def iter_job_listings(self, url: str, max_pages: int = 5,
+                          fetch_details: Optional[bool] = None) -> Iterator[Dict]:
+        """Yield job listings from LinkedIn page by page as they are scraped."""
+        return self._iter_offset_listings(url, max_pages, fetch_details)
 
 if __name__ == "__main__":
     # Example usage
@@ -402,135 +569,3 @@ if __name__ == "__main__":
         max_pages=2
     )
     print(f"Scraped {len(linkedin_jobs)} jobs from LinkedIn") 
-=======
-                # Update headers with new user agent for each request
-                self._update_headers()
-                
-                # Add random delay between requests
-                time.sleep(random.uniform(2, 5))
-                
-                response = self.session.get(url, headers=self.headers, timeout=10)
-                response.raise_for_status()
-                
-                if response.status_code == 200:
-                    return BeautifulSoup(response.text, 'html.parser')
-                
-            except requests.RequestException as e:
-                logger.error(f"Attempt {attempt + 1}/{max_retries} failed for URL {url}: {str(e)}")
-                if attempt < max_retries - 1:
-                    time.sleep(retry_delay)
-                    retry_delay *= 2  # Exponential backoff
-                else:
-                    raise
-    
-    def _extract_job_data(self, job_element: BeautifulSoup) -> Dict:
-        """Extract job data from a job element."""
-        raise NotImplementedError("Subclasses must implement _extract_job_data")
-
-class IndeedScraper(BaseScraper):
-    """Scraper for Indeed job listings."""
-    
-    def _extract_job_data(self, job_element: BeautifulSoup) -> Dict:
-        try:
-            title = job_element.find('h2', class_='jobTitle').text.strip()
-            company = job_element.find('span', class_='companyName').text.strip()
-            location = job_element.find('div', class_='companyLocation').text.strip()
-            salary = job_element.find('div', class_='salary-snippet')
-            salary = salary.text.strip() if salary else 'Not specified'
-            
-            return {
-                'title': clean_text(title),
-                'company': clean_text(company),
-                'location': clean_text(location),
-                'salary': clean_text(salary),
-                'source': 'Indeed'
-            }
-        except Exception as e:
-            logger.error(f"Error extracting job data: {str(e)}")
-            return {}
-    
-    def scrape_job_listings(self, url: str, max_pages: int = 5) -> List[Dict]:
-        """Scrape job listings from Indeed."""
-        jobs = []
-        for page in range(max_pages):
-            try:
-                page_url = f"{url}&start={page * 10}"
-                soup = self._get_soup(page_url)
-                job_elements = soup.find_all('div', class_='job_seen_beacon')
-                
-                for job_element in job_elements:
-                    job_data = self._extract_job_data(job_element)
-                    if job_data:
-                        jobs.append(job_data)
-                
-                logger.info(f"Scraped page {page + 1} of {max_pages}")
-                time.sleep(random.uniform(1, 3))  # Be nice to the server
-                
-            except Exception as e:
-                logger.error(f"Error scraping page {page + 1}: {str(e)}")
-                continue
-        
-        return jobs
-
-class LinkedInScraper(BaseScraper):
-    """Scraper for LinkedIn job listings."""
-    
-    def _extract_job_data(self, job_element: BeautifulSoup) -> Dict:
-        try:
-            title = job_element.find('h3', class_='base-search-card__title').text.strip()
-            company = job_element.find('h4', class_='base-search-card__subtitle').text.strip()
-            location = job_element.find('span', class_='job-search-card__location').text.strip()
-            
-            # Extract job type from title (common patterns)
-            job_type = 'Full-time'  # Default
-            title_lower = title.lower()
-            if any(term in title_lower for term in ['contract', 'contractor']):
-                job_type = 'Contract'
-            elif 'part-time' in title_lower:
-                job_type = 'Part-time'
-            elif 'intern' in title_lower:
-                job_type = 'Internship'
-            elif 'temporary' in title_lower:
-                job_type = 'Temporary'
-            
-            # Try to extract salary information
-            salary = 'Not specified'
-            salary_elem = job_element.find('span', class_='job-search-card__salary-info')
-            if salary_elem:
-                salary = salary_elem.text.strip()
-            
-            return {
-                'title': clean_text(title),
-                'company': clean_text(company),
-                'location': clean_text(location),
-                'salary': clean_text(salary),
-                'job_type': job_type,
-                'source': 'LinkedIn'
-            }
-        except Exception as e:
-            logger.error(f"Error extracting job data: {str(e)}")
-            return {}
-    
-    def scrape_job_listings(self, url: str, max_pages: int = 5) -> List[Dict]:
-        """Scrape job listings from LinkedIn."""
-        jobs = []
-        for page in range(max_pages):
-            try:
-                page_url = f"{url}&start={page * 25}"
-                soup = self._get_soup(page_url)
-                job_elements = soup.find_all('div', class_='base-card')
-                
-                for job_element in job_elements:
-                    job_data = self._extract_job_data(job_element)
-                    if job_data:
-                        jobs.append(job_data)
-                
-                logger.info(f"Scraped page {page + 1} of {max_pages}")
-                time.sleep(random.uniform(1, 3))  # Be nice to the server
-                
-            except Exception as e:
-                logger.error(f"Error scraping page {page + 1}: {str(e)}")
-                continue
-        
-        return jobs 
->>>>>>> 8ea1b89381d322c3402bc9fb04a78c0131bbf2e5
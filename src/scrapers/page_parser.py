@@ -0,0 +1,200 @@
+import concurrent.futures
+import json
+import multiprocessing
+import os
+import threading
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+import logging
+from urllib.parse import urljoin
+from datetime import datetime
+from src.scrapers.extraction import SiteExtractor
+from src.scrapers.parsers import ParserBackend, get_parser
+from src.utils.text import clean_text
+from src.utils.urls import canonicalize_url, job_id
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+@lru_cache(maxsize=32)
+def _compile_spec(spec_json: str) -> SiteExtractor:
+    """Compiled extractor per distinct spec, so worker processes compile each spec once."""
+    return SiteExtractor(json.loads(spec_json))
+
+class JobPageParser:
+    """
+    Turns the HTML of a site's result and job pages into compact job records.
+
+    It holds no network state and pickles as its base URL, spec and backend
+    name, so its methods can run in a ParsePool's worker processes.
+    """
+
+    def __init__(self, base_url: str, site_spec: Optional[Dict] = None, parser: Optional[str] = None):
+        """
+        Args:
+            base_url (str): Site root that relative links are resolved against
+            site_spec (Dict, optional): Selector spec of the site's pages (see site_specs)
+            parser (str, optional): Parser backend name; defaults to the fastest installed
+        """
+        self.base_url = base_url
+        self.site_spec = site_spec
+        self.parser: ParserBackend = get_parser(parser)
+        self.extractor: Optional[SiteExtractor] = _compile_spec(json.dumps(site_spec)) if site_spec else None
+
+    def __getstate__(self) -> Dict:
+        return {'base_url': self.base_url, 'site_spec': self.site_spec, 'parser': self.parser.name}
+
+    def __setstate__(self, state: Dict) -> None:
+        self.__init__(state['base_url'], state['site_spec'], state['parser'])
+
+    def listings(self, doc: Any) -> List[Dict]:
+        """Extract job listings from a search results page parsed by self.parser."""
+        if not self.extractor:
+            return []
+        jobs = (self.listing(card) for card in self.extractor.items(self.parser, doc))
+        return [job for job in jobs if job]
+
+    def listing(self, card: Any) -> Dict:
+        """Extract one listing from a result card, or {} if it lacks a required field."""
+        fields = self.extractor.extract_listing(self.parser, card)
+        missing = self.extractor.listing.missing(fields)
+        if missing:
+            logger.error(f"Error extracting job data: missing {', '.join(missing)}")
+            return {}
+        return self.build_listing(fields)
+
+    def build_listing(self, fields: Dict) -> Dict:
+        """Turn the raw fields of a result card into a job listing."""
+        job = {}
+        for name, value in fields.items():
+            if name == 'url':
+                job['url'] = canonicalize_url(urljoin(self.base_url, value)) if value else ''
+                job['job_id'] = job_id(job['url'])
+            elif isinstance(value, str):
+                job[name] = clean_text(value)
+            else:
+                job[name] = value
+        if self.extractor.source:
+            job['source'] = self.extractor.source
+        return job
+
+    def details(self, doc: Any, job_url: str) -> Dict:
+        """Extract job details from a job listing page parsed by self.parser."""
+        job_details = {
+            'title': '',
+            'company': '',
+            'location': '',
+            'description': '',
+            'posted_date': '',
+            'job_type': '',
+            'salary': '',
+            'url': job_url,
+            'scraped_date': datetime.now().isoformat()
+        }
+        if self.extractor:
+            for name, value in self.extractor.extract_details(self.parser, doc).items():
+                if value is not None:
+                    job_details[name] = value
+        return job_details
+
+    def next_page_url(self, doc: Any) -> Optional[str]:
+        """Find the URL for the next page of results."""
+        next_url = self.extractor.next_page(self.parser, doc) if self.extractor else None
+        return urljoin(self.base_url, next_url) if next_url else None
+
+    def parse_results_page(self, html: str) -> Tuple[List[Dict], Optional[str]]:
+        """
+        Parse a search results page.
+
+        Args:
+            html (str): Page body
+
+        Returns:
+            Tuple[List[Dict], Optional[str]]: Listings on the page and the next page's URL
+        """
+        doc = self.parser.parse(html)
+        return self.listings(doc), self.next_page_url(doc)
+
+    def parse_job_page(self, html: str, job_url: str) -> Dict:
+        """
+        Parse a job listing page.
+
+        Args:
+            html (str): Page body
+            job_url (str): URL the page was fetched from
+
+        Returns:
+            Dict: Job details
+        """
+        return self.details(self.parser.parse(html), job_url)
+
+class LinkedInPageParser(JobPageParser):
+    """LinkedIn pages, whose result cards carry no job type."""
+
+    def build_listing(self, fields: Dict) -> Dict:
+        job = super().build_listing(fields)
+
+        # Extract job type from title (common patterns)
+        job_type = 'Full-time'  # Default
+        title_lower = fields['title'].lower()
+        if any(term in title_lower for term in ['contract', 'contractor']):
+            job_type = 'Contract'
+        elif 'part-time' in title_lower:
+            job_type = 'Part-time'
+        elif 'intern' in title_lower:
+            job_type = 'Internship'
+        elif 'temporary' in title_lower:
+            job_type = 'Temporary'
+        job['job_type'] = job_type
+        return job
+
+class ParsePool:
+    """
+    Process pool that parses pages away from the threads doing network I/O.
+
+    Parsing is CPU-bound and holds the GIL, so with many pages in flight it
+    caps throughput no matter how many fetch threads run. Scrapers given a
+    pool send it page bodies and get back only the extracted records.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        """
+        Args:
+            max_workers (int, optional): Worker processes; defaults to the CPU count
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self._executor: Optional[concurrent.futures.ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def _ensure_executor(self) -> concurrent.futures.ProcessPoolExecutor:
+        """Start the worker processes on first use."""
+        with self._lock:
+            if self._executor is None:
+                # Forking a process that runs the HTTP client's event loop thread is unsafe
+                self._executor = concurrent.futures.ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context('spawn')
+                )
+            return self._executor
+
+    def submit(self, fn: Callable[..., T], *args: Any) -> concurrent.futures.Future:
+        """Run fn(*args) in a worker process; fn and args must be picklable."""
+        return self._ensure_executor().submit(fn, *args)
+
+    def run(self, fn: Callable[..., T], *args: Any) -> T:
+        """Run fn(*args) in a worker process and block until it completes."""
+        return self.submit(fn, *args).result()
+
+    def close(self) -> None:
+        """Shut down the worker processes."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+    def __enter__(self) -> 'ParsePool':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,400 @@
+import re
+import threading
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+import logging
+import lxml.html
+from bs4 import BeautifulSoup
+from lxml import etree
+
+try:
+    # Optional: the fastest backend when installed
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+logger = logging.getLogger(__name__)
+
+# Backends in order of preference when none is requested
+PARSER_PREFERENCE = ('selectolax', 'lxml', 'bs4')
+
+# One part of a compound CSS selector such as div.card#top[data-id="1"]
+_CSS_PART = re.compile(r'''
+    \.(?P<class_>[\w-]+)
+  | \#(?P<id>[\w-]+)
+  | \[(?P<attr>[\w-]+)(?:=(?:"(?P<dq>[^"]*)"|'(?P<sq>[^']*)'|(?P<bare>[\w-]+)))?\]
+''', re.VERBOSE)
+_CSS_TAG = re.compile(r'[\w-]+|\*')
+
+class Selector:
+    """
+    Element selector in BeautifulSoup's find() terms, compiled for every backend.
+
+    Selector('h2', class_='jobTitle') matches what soup.find_all('h2', class_='jobTitle')
+    does, and Selector('a', {'aria-label': 'Next Page'}) or Selector('a', href=True)
+    match on attributes: True requires the attribute, a string requires that value.
+    """
+
+    __slots__ = ('tag', 'attrs', 'css', 'xpath')
+
+    def __init__(self, tag: Optional[str] = None, attrs: Optional[Dict[str, Union[str, bool]]] = None,
+                 class_: Optional[str] = None, id: Optional[str] = None, **kwargs: Union[str, bool]):
+        attrs = {**(attrs or {}), **kwargs}
+        if class_ is not None:
+            attrs['class'] = class_
+        if id is not None:
+            attrs['id'] = id
+        self.tag = tag
+        self.attrs = attrs
+        self.css = self._to_css()
+        self.xpath = './/' + (tag or '*') + ''.join(f'[{predicate}]' for predicate in self._xpath_predicates())
+    
+    @classmethod
+    def from_css(cls, css: str) -> 'Selector':
+        """
+        Parse a compound CSS selector: a tag, at most one class, an id and attributes.
+        
+        Args:
+            css (str): Selector such as 'h2.jobTitle' or 'a[aria-label="Next Page"]'
+            
+        Returns:
+            Selector: The equivalent selector
+        """
+        css = css.strip()
+        tag_match = _CSS_TAG.match(css)
+        tag = tag_match.group() if tag_match and tag_match.group() != '*' else None
+        position = tag_match.end() if tag_match else 0
+        
+        attrs: Dict[str, Union[str, bool]] = {}
+        while position < len(css):
+            part = _CSS_PART.match(css, position)
+            if part is None:
+                raise ValueError(f"Unsupported selector syntax in {css!r} at {css[position:]!r}")
+            if part.group('class_'):
+                if 'class' in attrs:
+                    raise ValueError(f"Only one class per selector is supported: {css!r}")
+                attrs['class'] = part.group('class_')
+            elif part.group('id'):
+                attrs['id'] = part.group('id')
+            else:
+                value = next((v for v in part.group('dq', 'sq', 'bare') if v is not None), True)
+                attrs[part.group('attr')] = value
+            position = part.end()
+        return cls(tag, attrs)
+
+    def _to_css(self) -> str:
+        css = self.tag or '*'
+        for name, value in self.attrs.items():
+            if value is True:
+                css += f'[{name}]'
+            elif name == 'class':
+                css += f'.{value}'
+            elif name == 'id':
+                css += f'#{value}'
+            else:
+                escaped = value.replace('\\', '\\\\').replace('"', '\\"')
+                css += f'[{name}="{escaped}"]'
+        return css
+
+    def _xpath_predicates(self) -> List[str]:
+        predicates = []
+        for name, value in self.attrs.items():
+            if value is True:
+                predicates.append(f'@{name}')
+            elif name == 'class':
+                # Any one of the element's classes, as BeautifulSoup and CSS match it
+                predicates.append(f"contains(concat(' ', normalize-space(@class), ' '), ' {value} ')")
+            else:
+                quote = "'" if '"' in value else '"'
+                predicates.append(f'@{name}={quote}{value}{quote}')
+        return predicates
+    
+    def xpath_test(self) -> str:
+        """XPath boolean testing the context element against this selector."""
+        tests = ([f'self::{self.tag}'] if self.tag else []) + self._xpath_predicates()
+        return '(' + ' and '.join(tests) + ')' if tests else 'true()'
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, Selector) and (self.tag, self.attrs) == (other.tag, other.attrs)
+
+    def __hash__(self) -> int:
+        return hash(self.css)
+
+    def __repr__(self) -> str:
+        return f"Selector({self.css!r})"
+
+class ParserBackend:
+    """
+    HTML parser used by the scrapers to extract listings and details.
+
+    Backends return their own node types; scrapers only handle nodes through
+    these methods, so the same extraction code runs on every backend.
+    """
+
+    name = ''
+    # Whether select() runs a native selector engine; without one, extractors
+    # evaluate all their fields in a single walk instead of one walk each
+    native_selectors = True
+
+    def parse(self, html: Union[str, bytes]) -> Any:
+        """Parse a page into a document node."""
+        raise NotImplementedError
+
+    def select(self, node: Any, selector: Selector) -> List[Any]:
+        """All descendants of node matching selector, in document order."""
+        raise NotImplementedError
+
+    def select_one(self, node: Any, selector: Selector) -> Optional[Any]:
+        """First descendant of node matching selector, or None."""
+        matches = self.select(node, selector)
+        return matches[0] if matches else None
+
+    def text(self, node: Any) -> str:
+        """Text content of node and its descendants."""
+        raise NotImplementedError
+
+    def attr(self, node: Any, name: str) -> Optional[str]:
+        """Value of one of node's attributes, or None."""
+        raise NotImplementedError
+
+    def tag(self, node: Any) -> str:
+        """Tag name of node."""
+        raise NotImplementedError
+
+    def parent(self, node: Any) -> Optional[Any]:
+        """Parent of node, or None at the top of the tree."""
+        raise NotImplementedError
+
+    def first_text(self, node: Any, selector: Selector) -> Optional[str]:
+        """Stripped text of the first match of selector, or None if nothing matches."""
+        match = self.select_one(node, selector)
+        return self.text(match).strip() if match is not None else None
+
+    def matches(self, node: Any, selector: Selector) -> bool:
+        """Whether node itself matches selector."""
+        if selector.tag and self.tag(node) != selector.tag:
+            return False
+        for name, expected in selector.attrs.items():
+            value = self.attr(node, name)
+            if value is None:
+                return False
+            if expected is True:
+                continue
+            if name == 'class' and expected not in value.split():
+                return False
+            if name != 'class' and value != expected:
+                return False
+        return True
+
+    def has_ancestors(self, node: Any, ancestors: Sequence[Selector]) -> bool:
+        """Whether node has ancestors matching ancestors, nearest first, as a CSS descendant selector requires."""
+        for step in ancestors:
+            node = self.parent(node)
+            while node is not None and not self.matches(node, step):
+                node = self.parent(node)
+            if node is None:
+                return False
+        return True
+
+    def select_path(self, node: Any, path: Tuple[Selector, ...]) -> List[Any]:
+        """
+        Descendants of node matching a descendant selector such as 'li.job a[href]'.
+
+        As with CSS, the ancestors in path may lie outside node.
+
+        Args:
+            node (Any): Element or document to search
+            path (Tuple[Selector, ...]): Compound selectors, outermost first
+
+        Returns:
+            List[Any]: Matches in document order
+        """
+        ancestors = path[-2::-1]
+        return [match for match in self.select(node, path[-1])
+                if not ancestors or self.has_ancestors(match, ancestors)]
+
+    def select_path_one(self, node: Any, path: Tuple[Selector, ...]) -> Optional[Any]:
+        """First match of select_path, or None."""
+        matches = self.select_path(node, path)
+        return matches[0] if matches else None
+
+    def select_any(self, node: Any, selectors: Sequence[Selector]) -> List[Any]:
+        """
+        Descendants of node matching any of selectors, in document order.
+
+        Backends find them in a single walk of the tree, where select() would
+        need one walk per selector.
+        """
+        return [descendant for descendant in self.select(node, Selector())
+                if any(self.matches(descendant, selector) for selector in selectors)]
+
+class SelectolaxBackend(ParserBackend):
+    """selectolax's lexbor engine: CSS selectors over a C DOM."""
+
+    name = 'selectolax'
+
+    def parse(self, html: Union[str, bytes]) -> Any:
+        return LexborHTMLParser(html)
+
+    def select(self, node: Any, selector: Selector) -> List[Any]:
+        return node.css(selector.css)
+
+    def select_one(self, node: Any, selector: Selector) -> Optional[Any]:
+        return node.css_first(selector.css)
+
+    def text(self, node: Any) -> str:
+        return node.text()
+
+    def attr(self, node: Any, name: str) -> Optional[str]:
+        return node.attributes.get(name)
+
+    def tag(self, node: Any) -> str:
+        return node.tag
+
+    def parent(self, node: Any) -> Optional[Any]:
+        return node.parent
+
+    def select_path(self, node: Any, path: Tuple[Selector, ...]) -> List[Any]:
+        return node.css(' '.join(selector.css for selector in path))
+
+    def select_path_one(self, node: Any, path: Tuple[Selector, ...]) -> Optional[Any]:
+        return node.css_first(' '.join(selector.css for selector in path))
+
+    def select_any(self, node: Any, selectors: Sequence[Selector]) -> List[Any]:
+        matches = []
+        # lexbor reports a node once for every selector in the group it matches
+        for match in node.css(', '.join(selector.css for selector in selectors)):
+            if not matches or matches[-1] != match:
+                matches.append(match)
+        return matches
+
+class LxmlBackend(ParserBackend):
+    """lxml.html with XPath expressions compiled once per selector."""
+
+    name = 'lxml'
+
+    def __init__(self):
+        self._compiled: Dict[Any, etree.XPath] = {}
+
+    def _xpath(self, selector: Selector) -> etree.XPath:
+        compiled = self._compiled.get(selector)
+        if compiled is None:
+            compiled = self._compiled[selector] = etree.XPath(selector.xpath)
+        return compiled
+
+    def parse(self, html: Union[str, bytes]) -> Any:
+        if not html or not html.strip():
+            html = '<html></html>'
+        try:
+            return lxml.html.document_fromstring(html)
+        except ValueError:
+            # Text that still carries an XML encoding declaration
+            return lxml.html.document_fromstring(html.encode('utf-8'))
+
+    def select(self, node: Any, selector: Selector) -> List[Any]:
+        return self._xpath(selector)(node)
+
+    def text(self, node: Any) -> str:
+        return node.text_content()
+
+    def attr(self, node: Any, name: str) -> Optional[str]:
+        return node.get(name)
+
+    def tag(self, node: Any) -> str:
+        return node.tag
+
+    def parent(self, node: Any) -> Optional[Any]:
+        return node.getparent()
+
+    def select_path(self, node: Any, path: Tuple[Selector, ...]) -> List[Any]:
+        key = ('path',) + path
+        compiled = self._compiled.get(key)
+        if compiled is None:
+            # Ancestors become nested ancestor:: tests, which like CSS may leave node's subtree
+            expression = path[-1].xpath
+            condition = ''
+            for step in path[:-1]:
+                condition = f"ancestor::*[{step.xpath_test()}]" + (f"[{condition}]" if condition else '')
+            if condition:
+                expression += f'[{condition}]'
+            compiled = self._compiled[key] = etree.XPath(expression)
+        return compiled(node)
+
+    def select_any(self, node: Any, selectors: Sequence[Selector]) -> List[Any]:
+        key = tuple(selectors)
+        compiled = self._compiled.get(key)
+        if compiled is None:
+            # One descendant walk testing every selector, instead of one walk each
+            tests = ' or '.join(selector.xpath_test() for selector in selectors)
+            compiled = self._compiled[key] = etree.XPath(f'.//*[{tests}]')
+        return compiled(node)
+
+class BeautifulSoupBackend(ParserBackend):
+    """BeautifulSoup on the lxml tree builder, the slowest but most forgiving backend."""
+
+    name = 'bs4'
+    native_selectors = False
+
+    def parse(self, html: Union[str, bytes]) -> Any:
+        return BeautifulSoup(html, 'lxml')
+
+    def select(self, node: Any, selector: Selector) -> List[Any]:
+        return node.find_all(selector.tag, attrs=selector.attrs)
+
+    def select_one(self, node: Any, selector: Selector) -> Optional[Any]:
+        return node.find(selector.tag, attrs=selector.attrs)
+
+    def text(self, node: Any) -> str:
+        return node.text
+
+    def attr(self, node: Any, name: str) -> Optional[str]:
+        value = node.get(name)
+        # Multi-valued attributes such as class come back as lists
+        return ' '.join(value) if isinstance(value, list) else value
+
+    def tag(self, node: Any) -> str:
+        return node.name
+
+    def parent(self, node: Any) -> Optional[Any]:
+        return node.parent
+
+    def select_any(self, node: Any, selectors: Sequence[Selector]) -> List[Any]:
+        return node.find_all(lambda element: any(self.matches(element, selector) for selector in selectors))
+
+_BACKENDS = {
+    'selectolax': SelectolaxBackend,
+    'lxml': LxmlBackend,
+    'bs4': BeautifulSoupBackend,
+}
+_parsers: Dict[str, ParserBackend] = {}
+_parsers_lock = threading.Lock()
+
+def available_parsers() -> List[str]:
+    """Names of the backends that can be used in this environment, fastest first."""
+    return [name for name in PARSER_PREFERENCE if name != 'selectolax' or LexborHTMLParser is not None]
+
+def get_parser(name: Optional[str] = None) -> ParserBackend:
+    """
+    Get the process-wide parser backend of the given name.
+
+    Args:
+        name (str, optional): 'selectolax', 'lxml' or 'bs4'; defaults to the
+            fastest available. A backend that is not installed falls back to
+            the fastest available one.
+
+    Returns:
+        ParserBackend: Shared backend instance
+    """
+    if name is not None and name not in _BACKENDS:
+        raise ValueError(f"Unknown parser backend {name!r}, expected one of {', '.join(PARSER_PREFERENCE)}")
+
+    available = available_parsers()
+    if name is None:
+        name = available[0]
+    elif name not in available:
+        logger.warning(f"Parser backend {name} is not installed, using {available[0]}")
+        name = available[0]
+
+    with _parsers_lock:
+        if name not in _parsers:
+            _parsers[name] = _BACKENDS[name]()
+        return _parsers[name]
@@ -0,0 +1,154 @@
+import asyncio
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, Optional, Tuple
+from urllib.parse import urlparse
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Requests per second and burst size per site; hosts match on domain suffix
+DEFAULT_RATES: Dict[str, Tuple[float, int]] = {
+    'indeed.com': (0.5, 3),
+    'linkedin.com': (0.25, 2),
+}
+
+THROTTLE_STATUS_CODES = (403, 429)
+
+class TokenBucket:
+    """Token bucket for a single host that slows down when the host pushes back."""
+
+    def __init__(self, rate: float, capacity: int, min_rate: float):
+        self.base_rate = rate
+        self.rate = rate
+        self.min_rate = min_rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated: Optional[float] = None
+        self.throttle_count = 0
+
+    def _refill(self, now: float) -> None:
+        if self.updated is None:
+            self.updated = now
+        elif now > self.updated:
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+
+    def reserve(self, now: float) -> float:
+        """Take one token and return how long the caller must wait before using it."""
+        self._refill(now)
+        self.tokens -= 1
+        deficit = max(0.0, -self.tokens)
+        return max(0.0, self.updated + deficit / self.rate - now)
+
+    def throttle(self, now: float, delay: float) -> None:
+        """Pause the bucket for delay seconds and halve its rate."""
+        self.throttle_count += 1
+        self.rate = max(self.min_rate, self.rate / 2)
+        self.tokens = 1.0
+        self.updated = max(now, self.updated or now) + delay
+
+    def recover(self) -> None:
+        """Step the rate back towards its configured value after a success."""
+        self.throttle_count = 0
+        self.rate = min(self.base_rate, self.rate + self.base_rate * 0.1)
+
+class RateLimiter:
+    """
+    Per-host token-bucket rate limiter shared across scrapers.
+
+    Callers only wait when a host's budget is exhausted. 403/429 responses
+    pause the host (honoring Retry-After when present) and halve its rate,
+    which then recovers gradually on successful responses.
+    """
+
+    def __init__(self, rates: Optional[Dict[str, Tuple[float, int]]] = None,
+                 default_rate: float = 1.0, default_burst: int = 5,
+                 backoff: float = 5.0, max_backoff: float = 300.0,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            rates (Dict[str, Tuple[float, int]]): (requests per second, burst) by domain
+            default_rate (float): Requests per second for hosts not in rates
+            default_burst (int): Burst size for hosts not in rates
+            backoff (float): Initial pause in seconds after a throttled response
+            max_backoff (float): Upper bound for the pause in seconds
+            clock (Callable): Monotonic clock, injectable for tests
+        """
+        self.rates = dict(DEFAULT_RATES if rates is None else rates)
+        self.default_rate = default_rate
+        self.default_burst = default_burst
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._buckets: Dict[str, TokenBucket] = {}
+
+    def _get_bucket(self, url: str) -> TokenBucket:
+        host = urlparse(url).netloc.lower().split(':')[0]
+        if host not in self._buckets:
+            rate, burst = self.default_rate, self.default_burst
+            for domain, domain_rate in self.rates.items():
+                if host == domain or host.endswith('.' + domain):
+                    rate, burst = domain_rate
+                    break
+            self._buckets[host] = TokenBucket(rate, burst, min_rate=rate / 16)
+        return self._buckets[host]
+
+    def reserve(self, url: str) -> float:
+        """Reserve a request slot for url and return the seconds to wait before sending."""
+        with self._lock:
+            return self._get_bucket(url).reserve(self._clock())
+
+    def acquire(self, url: str) -> None:
+        """Block until a request to url is allowed."""
+        delay = self.reserve(url)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self, url: str) -> None:
+        """Wait without blocking the event loop until a request to url is allowed."""
+        delay = self.reserve(url)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def record_response(self, url: str, status_code: int, retry_after: Optional[str] = None) -> None:
+        """Feed a response status back so the limiter can adapt to throttling."""
+        with self._lock:
+            bucket = self._get_bucket(url)
+            if status_code in THROTTLE_STATUS_CODES:
+                delay = _parse_retry_after(retry_after)
+                if delay is None:
+                    delay = min(self.max_backoff, self.backoff * 2 ** bucket.throttle_count)
+                bucket.throttle(self._clock(), delay)
+                logger.warning(f"Throttled by {urlparse(url).netloc} ({status_code}), pausing {delay:.1f} seconds")
+            elif status_code < 400:
+                bucket.recover()
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given either as seconds or as an HTTP date."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+_default_limiter: Optional[RateLimiter] = None
+_default_limiter_lock = threading.Lock()
+
+def get_rate_limiter() -> RateLimiter:
+    """Get the process-wide rate limiter shared by all scrapers."""
+    global _default_limiter
+    with _default_limiter_lock:
+        if _default_limiter is None:
+            _default_limiter = RateLimiter()
+        return _default_limiter
@@ -0,0 +1,181 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional
+import logging
+
+from src.scrapers.http_client import HttpResponse
+from src.utils.urls import canonicalize_url
+
+logger = logging.getLogger(__name__)
+
+class CacheEntry:
+    """A cached response plus the metadata needed to judge and revalidate it."""
+
+    def __init__(self, url: str, status_code: int, headers: Dict[str, str], stored_at: float, text: str):
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.stored_at = stored_at
+        self.text = text
+
+    def is_fresh(self, ttl: float, now: Optional[float] = None) -> bool:
+        """Check whether the entry is younger than ttl seconds."""
+        return ((now or time.time()) - self.stored_at) < ttl
+
+    def validators(self) -> Dict[str, str]:
+        """Conditional request headers for revalidating this entry."""
+        headers = {}
+        if self.headers.get('ETag'):
+            headers['If-None-Match'] = self.headers['ETag']
+        if self.headers.get('Last-Modified'):
+            headers['If-Modified-Since'] = self.headers['Last-Modified']
+        return headers
+
+    def to_response(self) -> HttpResponse:
+        return HttpResponse(self.url, self.status_code, self.text, self.headers)
+
+class ResponseCache:
+    """
+    On-disk HTTP response cache with LRU eviction and conditional revalidation.
+
+    Callers decide freshness by passing a TTL to CacheEntry.is_fresh. Entries are
+    stored under the SHA-256 of their URL as a body file plus a small JSON
+    metadata file. The body file's mtime records the last access, so LRU
+    order survives restarts. Expired entries are kept until evicted so they can
+    be revalidated with ETag/Last-Modified instead of being downloaded again.
+    """
+
+    VALIDATOR_HEADERS = ('ETag', 'Last-Modified', 'Content-Type')
+
+    def __init__(self, cache_dir: str = "data/cache/http", max_bytes: int = 512 * 1024 * 1024):
+        """
+        Args:
+            cache_dir (str): Directory to store cached responses in
+            max_bytes (int): Maximum total size of cached bodies before LRU eviction
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._index: 'OrderedDict[str, int]' = OrderedDict()
+        self._total_bytes = 0
+        self._load_index()
+
+    @staticmethod
+    def _key(url: str) -> str:
+        # Tracking-parameter and parameter-order variants share one entry
+        return hashlib.sha256(canonicalize_url(url).encode('utf-8')).hexdigest()
+
+    def _body_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.body"
+
+    def _meta_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def _load_index(self) -> None:
+        """Rebuild the LRU index from the files on disk, oldest access first."""
+        entries = []
+        for body_path in self.cache_dir.glob('*.body'):
+            stat = body_path.stat()
+            entries.append((stat.st_mtime, body_path.stem, stat.st_size))
+
+        for _, key, size in sorted(entries):
+            self._index[key] = size
+            self._total_bytes += size
+
+    def get(self, url: str) -> Optional[CacheEntry]:
+        """Return the cached entry for url, fresh or stale, or None."""
+        key = self._key(url)
+        with self._lock:
+            if key not in self._index:
+                return None
+            try:
+                with open(self._meta_path(key), 'r', encoding='utf-8') as f:
+                    meta = json.load(f)
+                text = self._body_path(key).read_bytes().decode('utf-8')
+            except (OSError, ValueError) as e:
+                logger.warning(f"Dropping unreadable cache entry for {url}: {str(e)}")
+                self._remove(key)
+                return None
+
+            self._index.move_to_end(key)
+            os.utime(self._body_path(key))
+
+        return CacheEntry(meta['url'], meta['status_code'], meta['headers'], meta['stored_at'], text)
+
+    def put(self, url: str, response: HttpResponse) -> None:
+        """Store a successful response."""
+        key = self._key(url)
+        body = response.text.encode('utf-8')
+        meta = {
+            'url': url,
+            'status_code': response.status_code,
+            'headers': {
+                name: response.headers[name]
+                for name in self.VALIDATOR_HEADERS if name in response.headers
+            },
+            'stored_at': time.time(),
+        }
+
+        with self._lock:
+            if key in self._index:
+                self._total_bytes -= self._index.pop(key)
+            _atomic_write(self._body_path(key), body)
+            _atomic_write(self._meta_path(key), json.dumps(meta).encode('utf-8'))
+            self._index[key] = len(body)
+            self._total_bytes += len(body)
+            self._evict()
+
+    def refresh(self, url: str, entry: CacheEntry, headers: Dict[str, str]) -> None:
+        """Mark a revalidated (304) entry as fresh again, taking updated validators."""
+        for name in self.VALIDATOR_HEADERS:
+            if name in headers:
+                entry.headers[name] = headers[name]
+        entry.stored_at = time.time()
+        meta = {
+            'url': entry.url,
+            'status_code': entry.status_code,
+            'headers': entry.headers,
+            'stored_at': entry.stored_at,
+        }
+
+        key = self._key(url)
+        with self._lock:
+            if key in self._index:
+                _atomic_write(self._meta_path(key), json.dumps(meta).encode('utf-8'))
+
+    def _remove(self, key: str) -> None:
+        self._total_bytes -= self._index.pop(key, 0)
+        for path in (self._body_path(key), self._meta_path(key)):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until the cache fits in max_bytes."""
+        while self._total_bytes > self.max_bytes and self._index:
+            key = next(iter(self._index))
+            self._remove(key)
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+_default_cache: Optional[ResponseCache] = None
+_default_cache_lock = threading.Lock()
+
+def get_response_cache() -> ResponseCache:
+    """Get the process-wide response cache shared by all scrapers."""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = ResponseCache()
+        return _default_cache
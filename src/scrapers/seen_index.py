@@ -0,0 +1,65 @@
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, Optional
+import logging
+from src.utils.seen_log import SeenLog
+
+logger = logging.getLogger(__name__)
+
+class SeenJobIndex:
+    """
+    Persistent set of job identifiers that earlier runs have already scraped.
+
+    Identifiers are kept in a SeenLog, so recording new postings only appends
+    to the file, identifiers not seen within the TTL are forgotten, and the
+    file is compacted as it grows instead of holding every posting ever seen.
+    """
+
+    def __init__(self, path: str = "data/seen_jobs.txt", ttl_days: Optional[float] = 90):
+        """
+        Args:
+            path (str): Path of the index file
+            ttl_days (float, optional): Forget postings first seen longer ago than this;
+                None keeps them forever. Postings still listed after that are scraped again once.
+        """
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._upgrade_plain_index()
+        self._log = SeenLog(str(self.path), ttl_days=ttl_days)
+
+    def _upgrade_plain_index(self) -> None:
+        """Rewrite an index of bare identifiers, one per line, as a log seen now."""
+        if not self.path.exists():
+            return
+        with open(self.path, 'r', encoding='utf-8') as f:
+            first_line = f.readline()
+            if not first_line.strip() or '\t' in first_line:
+                return
+            f.seek(0)
+            job_ids = dict.fromkeys(line.strip() for line in f if line.strip())
+
+        timestamp = datetime.now().isoformat(timespec='seconds')
+        temp_path = self.path.with_name(self.path.name + '.tmp')
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.writelines(f"{timestamp}\t{job_id}\n" for job_id in job_ids)
+        os.replace(temp_path, self.path)
+        logger.info(f"Upgraded {self.path} to a seen log of {len(job_ids)} jobs")
+
+    def __contains__(self, job_id: str) -> bool:
+        return job_id in self._log
+
+    def __len__(self) -> int:
+        return len(self._log)
+
+    def add(self, job_ids: Iterable[str]) -> None:
+        """Mark job identifiers as seen; they are written out on flush()."""
+        with self._lock:
+            for job_id in job_ids:
+                if job_id and job_id not in self._log:
+                    self._log.add(job_id)
+
+    def flush(self) -> None:
+        """Append identifiers added since the last flush to the index file."""
+        self._log.flush()
@@ -0,0 +1,73 @@
+import json
+from pathlib import Path
+from typing import Any, Dict
+from src.scrapers.extraction import SiteExtractor
+
+# Where each site keeps the fields of its result cards and job pages; see
+# SiteExtractor for the format. Listing text fields are cleaned with
+# clean_text, URLs are resolved against the site and canonicalized.
+INDEED = {
+    'name': 'indeed',
+    'source': 'Indeed',
+    'listing': {
+        'item': 'div.job_seen_beacon',
+        'fields': {
+            'title': {'selector': 'h2.jobTitle', 'required': True},
+            'company': {'selector': 'span.companyName', 'required': True},
+            'location': {'selector': 'div.companyLocation', 'required': True},
+            'salary': {'selector': 'div.salary-snippet', 'default': 'Not specified'},
+            'url': {'selector': 'h2.jobTitle a[href]', 'attr': 'href'},
+        },
+    },
+    'detail': {
+        'fields': {
+            'title': 'h1.jobsearch-JobInfoHeader-title',
+            'company': 'div.jobsearch-CompanyInfoContainer',
+            'location': 'div.jobsearch-JobInfoHeader-subtitle',
+            'description': 'div#jobDescriptionText',
+            'salary': {'selector': 'div.jobsearch-JobMetadataHeader-item', 'contains': 'salary'},
+        },
+    },
+    'next_page': {'selector': 'a[aria-label="Next Page"]', 'attr': 'href'},
+}
+
+LINKEDIN = {
+    'name': 'linkedin',
+    'source': 'LinkedIn',
+    'listing': {
+        'item': 'div.base-card',
+        'fields': {
+            'title': {'selector': 'h3.base-search-card__title', 'required': True},
+            'company': {'selector': 'h4.base-search-card__subtitle', 'required': True},
+            'location': {'selector': 'span.job-search-card__location', 'required': True},
+            'salary': {'selector': 'span.job-search-card__salary-info', 'default': 'Not specified'},
+            'url': {'selector': 'a.base-card__full-link[href]', 'attr': 'href'},
+        },
+    },
+    'detail': {
+        'fields': {
+            'title': 'h1.top-card-layout__title',
+            'company': 'a.topcard__org-name-link',
+            'location': 'span.topcard__flavor--bullet',
+            'description': 'div.show-more-less-html__markup',
+            'job_type': {'selector': 'span.description__job-criteria-text', 'index': 0},
+            'posted_date': {'selector': 'span.description__job-criteria-text', 'index': 1},
+        },
+    },
+    'next_page': {'selector': 'button[aria-label="Next"]', 'attr': 'href'},
+}
+
+def load_site_spec(path: str) -> Dict[str, Any]:
+    """
+    Load a site spec from a JSON file, e.g. config/sites/example.json.
+
+    Args:
+        path (str): JSON file holding one spec in the format of INDEED
+
+    Returns:
+        Dict[str, Any]: The spec, checked by compiling it once
+    """
+    with open(Path(path), 'r', encoding='utf-8') as f:
+        spec = json.load(f)
+    SiteExtractor(spec)
+    return spec
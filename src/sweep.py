@@ -0,0 +1,165 @@
+import argparse
+import json
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from itertools import product
+from pathlib import Path
+from typing import Dict, List, Optional
+from src.main import scrape_jobs
+from src.scrapers.page_parser import ParsePool
+from src.scrapers.seen_index import SeenJobIndex
+from src.utils.dedup import MinHashDeduplicator
+from src.utils.helpers import save_to_json, save_to_csv, save_to_parquet
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONCURRENCY = {'indeed': 2, 'linkedin': 1}
+
+def load_matrix(path: str) -> Dict:
+    """
+    Load a sweep matrix from a JSON file.
+
+    The file lists "platforms", "queries" and "locations"; every combination is
+    scraped. Optional keys are "max_pages" and "concurrency", a mapping of
+    platform to the number of searches allowed to run on it at once.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        matrix = json.load(f)
+
+    for key in ('platforms', 'queries', 'locations'):
+        if not matrix.get(key):
+            raise ValueError(f"Sweep matrix {path} must list at least one entry in '{key}'")
+
+    unsupported = set(platform.lower() for platform in matrix['platforms']) - set(DEFAULT_CONCURRENCY)
+    if unsupported:
+        raise ValueError(f"Unsupported platforms in sweep matrix: {', '.join(sorted(unsupported))}")
+
+    return matrix
+
+def run_sweep(
+    matrix: Dict,
+    max_pages: Optional[int] = None,
+    use_cache: bool = True,
+    seen_index: Optional[SeenJobIndex] = None,
+    deduplicator: Optional[MinHashDeduplicator] = None,
+    parse_pool: Optional[ParsePool] = None
+) -> List[Dict]:
+    """
+    Run every platform x query x location search in the matrix concurrently.
+
+    Args:
+        matrix (Dict): Sweep matrix as returned by load_matrix
+        max_pages (int, optional): Overrides the matrix's max_pages
+        use_cache (bool): Whether to use the on-disk HTTP response cache
+        seen_index (SeenJobIndex, optional): Shared index for incremental scraping
+        deduplicator (MinHashDeduplicator, optional): Shared across searches, so a posting
+            found on several platforms or searches is kept only once
+        parse_pool (ParsePool, optional): Worker processes parsing the pages of all
+            searches, so parsing does not hold up the threads fetching them
+
+    Returns:
+        List[Dict]: All scraped jobs, tagged with the search that found them
+    """
+    max_pages = max_pages or matrix.get('max_pages', 5)
+    # Platform names are matched case-insensitively, as in iter_jobs
+    concurrency = {**DEFAULT_CONCURRENCY,
+                   **{platform.lower(): limit for platform, limit in matrix.get('concurrency', {}).items()}}
+    platform_slots = {
+        platform: threading.BoundedSemaphore(limit) for platform, limit in concurrency.items()
+    }
+    searches = list(product(
+        [platform.lower() for platform in matrix['platforms']],
+        matrix['queries'],
+        matrix['locations']
+    ))
+
+    def run_search(platform: str, query: str, location: str) -> List[Dict]:
+        with platform_slots[platform]:
+            jobs = scrape_jobs(
+                platform,
+                query,
+                location,
+                max_pages,
+                use_cache=use_cache,
+                seen_index=seen_index,
+                deduplicator=deduplicator,
+                parse_pool=parse_pool
+            )
+        for job in jobs:
+            job['search_query'] = query
+            job['search_location'] = location
+        return jobs
+
+    logger.info(f"Starting sweep of {len(searches)} searches")
+    results: Dict[tuple, List[Dict]] = {}
+    workers = sum(concurrency[platform] for platform in set(p for p, _, _ in searches))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(run_search, *search): search for search in searches}
+        for future in as_completed(futures):
+            search = futures[future]
+            try:
+                results[search] = future.result()
+            except Exception as e:
+                logger.error(f"Search {search} failed: {str(e)}")
+                results[search] = []
+
+    # Keep output in matrix order regardless of completion order
+    all_jobs = [job for search in searches for job in results[search]]
+    logger.info(f"Sweep finished with {len(all_jobs)} jobs")
+    return all_jobs
+
+def main():
+    parser = argparse.ArgumentParser(description='Job Scraper sweep over many searches')
+    parser.add_argument('--matrix', required=True,
+                      help='JSON file listing platforms, queries and locations to sweep')
+    parser.add_argument('--max-pages', type=int,
+                      help='Maximum number of pages per search (overrides the matrix)')
+    parser.add_argument('--output-format', choices=['json', 'csv', 'parquet'], default='json',
+                      help='Output format for the consolidated data')
+    parser.add_argument('--no-cache', action='store_true',
+                      help='Bypass the on-disk HTTP response cache')
+    parser.add_argument('--incremental', action='store_true',
+                      help='Only scrape postings not seen by earlier runs')
+    parser.add_argument('--dedup', action='store_true',
+                      help='Drop near-duplicate postings across all searches and platforms')
+    parser.add_argument('--seen-index', default='data/seen_jobs.txt',
+                      help='File tracking already scraped postings for --incremental')
+    parser.add_argument('--parse-workers', type=int, default=0,
+                      help='Parse pages in this many worker processes shared by all searches '
+                           '(default: parse in the scraping threads)')
+
+    args = parser.parse_args()
+
+    matrix = load_matrix(args.matrix)
+    parse_pool = ParsePool(args.parse_workers) if args.parse_workers > 0 else None
+    try:
+        jobs = run_sweep(
+            matrix,
+            args.max_pages,
+            use_cache=not args.no_cache,
+            seen_index=SeenJobIndex(args.seen_index) if args.incremental else None,
+            deduplicator=MinHashDeduplicator() if args.dedup else None,
+            parse_pool=parse_pool
+        )
+    finally:
+        if parse_pool:
+            parse_pool.close()
+
+    filename = f"sweep_{Path(args.matrix).stem}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    if args.output_format == 'json':
+        filepath = save_to_json(jobs, filename)
+    elif args.output_format == 'parquet':
+        filepath = save_to_parquet(jobs, filename)
+    else:
+        filepath = save_to_csv(jobs, filename)
+    logger.info(f"Data saved to {filepath}")
+
+if __name__ == '__main__':
+    main()
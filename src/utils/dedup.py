@@ -0,0 +1,181 @@
+import re
+import threading
+from typing import Dict, List, Optional
+import logging
+import numpy as np
+from src.utils.helpers import normalize_company
+from src.utils.urls import job_key
+
+logger = logging.getLogger(__name__)
+
+# Multiplier mixing byte values into shingle hashes (the 64-bit FNV prime)
+_SHINGLE_MULTIPLIER = np.uint64(1099511628211)
+_SHIFT = np.uint64(32)
+
+# Requisition numbers and similar IDs that change between reposts of a job
+_ID_NUMBERS = re.compile(r'\d{4,}')
+_NON_WORD = re.compile(r'[\W_]+')
+
+def job_text(job: Dict) -> str:
+    """Normalized title, company and description used to compare postings."""
+    parts = [job.get('title', ''), normalize_company(job.get('company', '')), job.get('description', '')]
+    text = ' '.join(part for part in parts if isinstance(part, str)).casefold()
+    text = _ID_NUMBERS.sub(' ', text)
+    return ' '.join(_NON_WORD.sub(' ', text).split())
+
+def job_city(job: Dict) -> str:
+    """
+    Normalized city of a posting's location: the part before the first comma.
+    
+    'Nashville, TN' and 'Nashville, Tennessee, United States' both give 'nashville'.
+    """
+    location = job.get('location')
+    if not isinstance(location, str):
+        return ''
+    return ' '.join(_NON_WORD.sub(' ', location.split(',')[0].casefold()).split())
+
+class MinHashDeduplicator:
+    """
+    Detect near-duplicate job postings with MinHash signatures and an LSH index.
+
+    Each posting's normalized text is split into character shingles and
+    summarized by a MinHash signature. Signatures are split into bands and
+    bucketed by band, so only postings sharing a whole band are compared and
+    inserts stay fast as the index grows. Candidates are confirmed when their
+    estimated Jaccard similarity reaches the threshold and they are in the
+    same city, since one role is often posted with the same text for several
+    locations. Postings without a location match any city.
+    """
+
+    def __init__(self, threshold: float = 0.8, num_perm: int = 128, bands: int = 16,
+                 shingle_size: int = 4, seed: int = 1):
+        """
+        Args:
+            threshold (float): Estimated Jaccard similarity above which postings are duplicates
+            num_perm (int): Number of hash permutations in a signature
+            bands (int): Number of LSH bands; must divide num_perm. More bands
+                find more candidates at the cost of more comparisons
+            shingle_size (int): Length of the character shingles
+            seed (int): Seed for the permutations, fixed so signatures are reproducible
+        """
+        if num_perm % bands:
+            raise ValueError(f"bands ({bands}) must divide num_perm ({num_perm})")
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+
+        # Multiply-add-shift hash functions, one per permutation
+        generator = np.random.default_rng(seed)
+        self._a = generator.integers(0, 2 ** 64, size=(num_perm, 1), dtype=np.uint64) | np.uint64(1)
+        self._b = generator.integers(0, 2 ** 64, size=(num_perm, 1), dtype=np.uint64)
+
+        self._lock = threading.Lock()
+        self._signatures: Dict[str, np.ndarray] = {}
+        self._cities: Dict[str, str] = {}
+        self._buckets: List[Dict[bytes, List[str]]] = [{} for _ in range(bands)]
+
+    def _shingles(self, text: str) -> np.ndarray:
+        """64-bit hashes of the distinct byte shingles of text, computed without a Python loop per shingle."""
+        size = self.shingle_size
+        data = np.frombuffer(text.encode('utf-8'), dtype=np.uint8).astype(np.uint64)
+        if len(data) < size:
+            data = np.pad(data, (0, size - len(data)))
+        count = len(data) - size + 1
+        hashes = np.zeros(count, dtype=np.uint64)
+        for offset in range(size):
+            hashes = hashes * _SHINGLE_MULTIPLIER + data[offset:offset + count]
+        return np.unique(hashes)
+
+    def signature(self, text: str) -> np.ndarray:
+        """MinHash signature of a text as an array of num_perm uint32 values."""
+        permuted = (self._a * self._shingles(text) + self._b) >> _SHIFT
+        return permuted.min(axis=1).astype(np.uint32)
+
+    def _band_keys(self, signature: np.ndarray) -> List[bytes]:
+        """One bucket key per band of the signature."""
+        return [signature[i * self.rows:(i + 1) * self.rows].tobytes() for i in range(self.bands)]
+
+    def _similar_key(self, signature: np.ndarray, band_keys: List[bytes], city: str) -> Optional[str]:
+        """Key of an indexed posting in city similar to signature, or None. Caller holds the lock."""
+        checked = set()
+        for buckets, band_key in zip(self._buckets, band_keys):
+            for key in buckets.get(band_key, ()):
+                if key in checked:
+                    continue
+                checked.add(key)
+                if city and self._cities[key] and city != self._cities[key]:
+                    continue
+                if np.mean(self._signatures[key] == signature) >= self.threshold:
+                    return key
+        return None
+
+    def find_duplicate(self, job: Dict) -> Optional[str]:
+        """
+        Find an indexed posting that job duplicates, without indexing job.
+
+        Args:
+            job (Dict): Scraped job
+
+        Returns:
+            Optional[str]: Key of the matching posting, or None
+        """
+        signature = self.signature(job_text(job))
+        with self._lock:
+            return self._similar_key(signature, self._band_keys(signature), job_city(job))
+
+    def add(self, job: Dict, key: Optional[str] = None) -> Optional[str]:
+        """
+        Index a posting unless it duplicates one already indexed.
+
+        Args:
+            job (Dict): Scraped job
+            key (str, optional): Identifier to index it under; defaults to its job key
+
+        Returns:
+            Optional[str]: Key of the posting it duplicates, or None if it was indexed
+        """
+        key = key or job_key(job)
+        signature = self.signature(job_text(job))
+        band_keys = self._band_keys(signature)
+
+        with self._lock:
+            if key is None:
+                key = f"#{len(self._signatures)}"
+            elif key in self._signatures:
+                return key
+            city = job_city(job)
+            duplicate_of = self._similar_key(signature, band_keys, city)
+            if duplicate_of is not None:
+                return duplicate_of
+
+            self._signatures[key] = signature
+            self._cities[key] = city
+            for buckets, band_key in zip(self._buckets, band_keys):
+                buckets.setdefault(band_key, []).append(key)
+            return None
+
+    def filter(self, jobs: List[Dict]) -> List[Dict]:
+        """
+        Drop postings that duplicate an earlier one, indexing the rest.
+
+        Args:
+            jobs (List[Dict]): Scraped jobs
+
+        Returns:
+            List[Dict]: Jobs that are not near-duplicates, in their original order
+        """
+        unique = []
+        for job in jobs:
+            duplicate_of = self.add(job)
+            if duplicate_of is None:
+                unique.append(job)
+            else:
+                logger.debug(f"Dropping {job.get('url') or job.get('title')} as a duplicate of {duplicate_of}")
+        if len(unique) < len(jobs):
+            logger.info(f"Dropped {len(jobs) - len(unique)} near-duplicate postings")
+        return unique
+
+    def __len__(self) -> int:
+        return len(self._signatures)
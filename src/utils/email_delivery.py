@@ -0,0 +1,243 @@
+import queue
+import smtplib
+import threading
+import time
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+from typing import Callable, Dict, List, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Replies that will not change on retry: bad address, message refused, authentication failed
+_PERMANENT_ERRORS = (smtplib.SMTPRecipientsRefused, smtplib.SMTPSenderRefused, smtplib.SMTPAuthenticationError,
+                     smtplib.SMTPNotSupportedError)
+
+class EmailDeliveryQueue:
+    """
+    Background delivery of notification emails over one reused SMTP connection.
+
+    send() only enqueues, so callers such as the scrape pipeline never wait on
+    the mail server. A worker thread collects messages for batch_window
+    seconds, merges those to the same recipient into one digest, and sends
+    the digests over a single connection that is opened, secured and logged
+    into once and closed after idle_timeout seconds without mail. Failed
+    sends are retried with exponential backoff on a fresh connection, except
+    for rejections that no retry can fix.
+    """
+
+    def __init__(self, smtp_server: str, smtp_port: int = 587, username: str = "", password: str = "",
+                 from_email: str = "", starttls: bool = True, batch_window: float = 2.0, max_batch: int = 100,
+                 max_retries: int = 4, backoff: float = 1.0, max_backoff: float = 60.0,
+                 idle_timeout: float = 30.0, timeout: float = 30.0,
+                 smtp_factory: Callable[..., smtplib.SMTP] = smtplib.SMTP,
+                 sleep: Callable[[float], None] = time.sleep):
+        """
+        Args:
+            smtp_server (str): SMTP host
+            smtp_port (int): SMTP port
+            username (str): Login user; no login when empty
+            password (str): Login password
+            from_email (str): Sender address
+            starttls (bool): Upgrade the connection with STARTTLS before logging in
+            batch_window (float): Seconds to wait for more messages before sending a batch
+            max_batch (int): Send a batch as soon as it holds this many messages
+            max_retries (int): Retries of a failed digest before it is dropped
+            backoff (float): Delay before the first retry, in seconds; doubled on each retry
+            max_backoff (float): Upper bound for the retry delay in seconds
+            idle_timeout (float): Close the connection after this many seconds without mail
+            timeout (float): Socket timeout of the SMTP connection in seconds
+            smtp_factory (Callable): Creates the connection from (host, port, timeout=...); injectable for tests
+            sleep (Callable): Waits between retries; injectable for tests
+        """
+        self.smtp_server = smtp_server
+        self.smtp_port = smtp_port
+        self.username = username
+        self.password = password
+        self.from_email = from_email
+        self.starttls = starttls
+        self.batch_window = batch_window
+        self.max_batch = max_batch
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.idle_timeout = idle_timeout
+        self.timeout = timeout
+        self._smtp_factory = smtp_factory
+        self._sleep = sleep
+
+        self.sent = 0
+        self.failed = 0
+        self._queue: "queue.Queue[Optional[Tuple[str, str, str]]]" = queue.Queue()
+        self._connection: Optional[smtplib.SMTP] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, email_config: Dict, **kwargs) -> 'EmailDeliveryQueue':
+        """
+        Queue for the "email" section of a notification config.
+
+        Besides the server and login settings, the section may set starttls,
+        batch_window, max_retries and backoff. Keyword arguments override it.
+        """
+        options = {key: email_config[key] for key in ('starttls', 'batch_window', 'max_retries', 'backoff')
+                   if key in email_config}
+        options.update(kwargs)
+        return cls(
+            email_config.get('smtp_server', ''),
+            email_config.get('smtp_port', 587),
+            email_config.get('username', ''),
+            email_config.get('password', ''),
+            email_config.get('from_email', ''),
+            **options
+        )
+
+    def _ensure_worker(self) -> None:
+        """Start the delivery thread on first use."""
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='email-delivery', daemon=True)
+                self._thread.start()
+
+    def send(self, to_email: str, subject: str, body: str) -> None:
+        """Queue a plain text email; returns immediately."""
+        self._ensure_worker()
+        self._queue.put((to_email, subject, body))
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every queued message has been sent or given up on.
+
+        Args:
+            timeout (float, optional): Give up waiting after this many seconds
+
+        Returns:
+            bool: Whether the queue was drained in time
+        """
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = deadline - time.monotonic() if deadline is not None else None
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+        return True
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Deliver queued messages, then stop the delivery thread and close the connection."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is None:
+            return
+        self._queue.put(None)
+        thread.join(timeout)
+
+    def __enter__(self) -> 'EmailDeliveryQueue':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _run(self) -> None:
+        while True:
+            try:
+                first = self._queue.get(timeout=self.idle_timeout)
+            except queue.Empty:
+                self._disconnect()
+                continue
+
+            batch = [first]
+            if first is not None:
+                deadline = time.monotonic() + self.batch_window
+                while len(batch) < self.max_batch and batch[-1] is not None:
+                    try:
+                        batch.append(self._queue.get(timeout=max(0.0, deadline - time.monotonic())))
+                    except queue.Empty:
+                        break
+
+            stop = batch[-1] is None
+            messages = [message for message in batch if message is not None]
+            try:
+                for to_email, (subject, body) in self._digests(messages).items():
+                    self._deliver(to_email, subject, body)
+            except Exception:
+                logger.exception("Unexpected error delivering email notifications")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+            if stop:
+                self._disconnect()
+                return
+
+    @staticmethod
+    def _digests(messages: List[Tuple[str, str, str]]) -> Dict[str, Tuple[str, str]]:
+        """Merge messages to the same recipient, in the order they were queued."""
+        grouped: Dict[str, List[Tuple[str, str]]] = {}
+        for to_email, subject, body in messages:
+            grouped.setdefault(to_email, []).append((subject, body))
+
+        digests = {}
+        for to_email, parts in grouped.items():
+            if len(parts) == 1:
+                digests[to_email] = parts[0]
+            else:
+                body = "\n\n".join(f"{part_subject}\n\n{part_body}" for part_subject, part_body in parts)
+                digests[to_email] = (f"{parts[0][0]} (+{len(parts) - 1} more)", body)
+        return digests
+
+    def _connect(self) -> smtplib.SMTP:
+        """The open connection, or a new one that is secured and logged into."""
+        if self._connection is None:
+            connection = self._smtp_factory(self.smtp_server, self.smtp_port, timeout=self.timeout)
+            try:
+                if self.starttls:
+                    connection.starttls()
+                if self.username:
+                    connection.login(self.username, self.password)
+            except Exception:
+                connection.close()
+                raise
+            self._connection = connection
+        return self._connection
+
+    def _disconnect(self) -> None:
+        connection, self._connection = self._connection, None
+        if connection is None:
+            return
+        try:
+            connection.quit()
+        except (smtplib.SMTPException, OSError):
+            connection.close()
+
+    def _deliver(self, to_email: str, subject: str, body: str) -> bool:
+        """Send one email, retrying transient failures; returns whether it was sent."""
+        msg = MIMEMultipart()
+        msg['From'] = self.from_email
+        msg['To'] = to_email
+        msg['Subject'] = subject
+        msg.attach(MIMEText(body, 'plain'))
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                self._connect().send_message(msg)
+                self.sent += 1
+                logger.info(f"Email notification sent to {to_email}")
+                return True
+            except _PERMANENT_ERRORS as e:
+                logger.error(f"Email notification to {to_email} was rejected: {e}")
+                break
+            except (smtplib.SMTPException, OSError) as e:
+                # The connection may be unusable now; the next attempt opens a new one
+                self._disconnect()
+                if attempt == self.max_retries:
+                    logger.error(f"Failed to send email notification to {to_email} "
+                                 f"after {attempt + 1} attempts: {e}")
+                    break
+                delay = min(self.max_backoff, self.backoff * 2 ** attempt)
+                logger.warning(f"Sending email notification to {to_email} failed ({e}), "
+                               f"retrying in {delay:.1f} seconds")
+                self._sleep(delay)
+
+        self.failed += 1
+        return False
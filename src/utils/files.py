@@ -0,0 +1,29 @@
+import logging
+import os
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+def truncate_partial_line(filepath: Path, chunk_size: int = 65536) -> None:
+    """Cut a trailing line left unfinished by an interrupted write."""
+    if not filepath.exists():
+        return
+    
+    with open(filepath, 'rb+') as f:
+        end = f.seek(0, os.SEEK_END)
+        position = end
+        while position > 0:
+            start = max(0, position - chunk_size)
+            f.seek(start)
+            chunk = f.read(position - start)
+            newline = chunk.rfind(b'\n')
+            if newline != -1:
+                keep = start + newline + 1
+                break
+            position = start
+        else:
+            keep = 0
+        
+        if keep < end:
+            logger.warning(f"Dropping {end - keep} bytes of partial data at the end of {filepath}")
+            f.truncate(keep)
@@ -1,67 +1,25 @@
 import json
-<<<<<<< HEAD
-import pandas as pd
-from typing import List, Dict
-import logging
-from pathlib import Path
-from datetime import datetime
-
-logger = logging.getLogger(__name__)
-
-def save_to_json(data: List[Dict], filename: str) -> None:
-    """Save data to a JSON file."""
-    try:
-        filepath = Path(filename)
-        filepath.parent.mkdir(parents=True, exist_ok=True)
-        
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-        
-        logger.info(f"Data saved to {filename}")
-    except Exception as e:
-        logger.error(f"Error saving JSON file: {str(e)}")
-        raise
-
-def save_to_csv(data: List[Dict], filename: str) -> None:
-    """Save data to a CSV file."""
-    try:
-        filepath = Path(filename)
-        filepath.parent.mkdir(parents=True, exist_ok=True)
-        
-        df = pd.DataFrame(data)
-        df.to_csv(filepath, index=False, encoding='utf-8')
-        
-        logger.info(f"Data saved to {filename}")
-    except Exception as e:
-        logger.error(f"Error saving CSV file: {str(e)}")
-        raise
-=======
-import csv
 import os
 from datetime import datetime
-from typing import List, Dict
+from typing import Any, Dict, Iterator, List, Optional, Set
 import pandas as pd
 import re
->>>>>>> 8ea1b89381d322c3402bc9fb04a78c0131bbf2e5
+import glob
+import time
+import logging
+from pathlib import Path
+from src.utils.files import truncate_partial_line
+from src.utils.text import clean_text
+from src.utils.urls import job_key, validate_url
 
-def clean_text(text: str) -> str:
-    """Clean and normalize text data."""
-    if not isinstance(text, str):
-<<<<<<< HEAD
-        return ""
-    return " ".join(text.split())
+logger = logging.getLogger(__name__)
 
-def validate_url(url: str) -> bool:
-    """Validate URL format."""
-    return url.startswith(('http://', 'https://')) 
-=======
-        return str(text)
-    
-    # Remove extra whitespace
-    text = re.sub(r'\s+', ' ', text)
-    # Remove special characters
-    text = re.sub(r'[^\w\s.,$]', '', text)
-    return text.strip()
+# clean_text and validate_url moved to text and urls; they stay importable from here
+__all__ = [
+    'save_to_json', 'save_to_csv', 'save_to_parquet', 'JsonLinesWriter', 'iter_json_lines',
+    'json_lines_path', 'load_from_json', 'load_saved_jobs', 'COMPANY_SUFFIXES', 'normalize_company',
+    'clean_text', 'validate_url',
+]
 
 def save_to_json(data: List[Dict], filename: str) -> str:
     """Save data to a JSON file with timestamp."""
@@ -89,15 +47,142 @@ def save_to_csv(data: List[Dict], filename: str) -> str:
     
     return filepath
 
-def validate_url(url: str) -> bool:
-    """Validate URL format."""
-    url_pattern = re.compile(
-        r'^https?://'  # http:// or https://
-        r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain
-        r'localhost|'  # localhost
-        r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # IP
-        r'(?::\d+)?'  # optional port
-        r'(?:/?|[/?]\S+)$', re.IGNORECASE)
-    
-    return bool(url_pattern.match(url)) 
->>>>>>> 8ea1b89381d322c3402bc9fb04a78c0131bbf2e5
+def save_to_parquet(data: List[Dict], filename: str, dataset_dir: str = 'data/jobs') -> str:
+    """Append data to the Parquet job dataset, partitioned by source and scrape date."""
+    from src.utils.job_dataset import write_jobs_dataset
+    
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    write_jobs_dataset(data, dataset_dir, basename=f"{filename}_{timestamp}")
+    
+    return dataset_dir
+
+class JsonLinesWriter:
+    """
+    Append jobs to a JSON Lines file one record at a time.
+    
+    Each record is flushed as soon as it is written and fsynced periodically, so
+    a crash loses at most the line being written. Re-opening an existing file
+    resumes it: a partially written last line is dropped and jobs already in the
+    file, by job ID or canonical URL, are skipped.
+    """
+    
+    def __init__(self, filepath: str, fsync_every: int = 50, fsync_interval: float = 5.0):
+        """
+        Args:
+            filepath (str): Path of the .jsonl file to write or resume
+            fsync_every (int): Force data to disk after this many records
+            fsync_interval (float): Force data to disk at least this often, in seconds
+        """
+        self.filepath = Path(filepath)
+        self.filepath.parent.mkdir(parents=True, exist_ok=True)
+        self.fsync_every = fsync_every
+        self.fsync_interval = fsync_interval
+        
+        truncate_partial_line(self.filepath)
+        self.seen_keys: Set[str] = {
+            key for key in map(job_key, iter_json_lines(str(self.filepath))) if key
+        } if self.filepath.exists() else set()
+        self.resumed_count = len(self.seen_keys)
+        
+        self._file = open(self.filepath, 'a', encoding='utf-8')
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+        self.written = 0
+    
+    def write(self, record: Dict[str, Any]) -> bool:
+        """Append one record; returns False if it was already in the file."""
+        key = job_key(record)
+        if key:
+            if key in self.seen_keys:
+                return False
+            self.seen_keys.add(key)
+        
+        self._file.write(json.dumps(record, ensure_ascii=False) + '\n')
+        self._file.flush()
+        self.written += 1
+        self._unsynced += 1
+        if self._unsynced >= self.fsync_every or time.monotonic() - self._last_sync >= self.fsync_interval:
+            self.sync()
+        return True
+    
+    def sync(self) -> None:
+        """Force written records to disk."""
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+    
+    def close(self) -> None:
+        if not self._file.closed:
+            self.sync()
+            self._file.close()
+    
+    def __enter__(self) -> 'JsonLinesWriter':
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+def iter_json_lines(filepath: str) -> Iterator[Dict]:
+    """Stream records from a JSON Lines file without loading it into memory."""
+    with open(filepath, 'r', encoding='utf-8') as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                logger.warning(f"Skipping malformed line {line_number} in {filepath}")
+
+def json_lines_path(filename: str) -> str:
+    """Path for a JSON Lines output file in the data directory."""
+    return os.path.join('data', filename if filename.endswith('.jsonl') else f"{filename}.jsonl")
+
+def load_from_json(filepath: str) -> List[Dict]:
+    """Load a list of jobs from a JSON or JSON Lines file."""
+    if filepath.endswith('.jsonl'):
+        return list(iter_json_lines(filepath))
+    
+    with open(filepath, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    return data if isinstance(data, list) else []
+
+def load_saved_jobs(data_dir: str = 'data', patterns: Optional[List[str]] = None) -> List[Dict]:
+    """
+    Load every job saved as JSON or JSON Lines under data_dir, once per posting.
+    
+    Each run writes a new timestamped dump, so the same posting usually appears
+    in several files. Postings are matched by job_key, or by title, company and
+    location when they have no URL; the copy from the newest dump is kept, in
+    the position where the posting first appeared.
+    """
+    jobs: Dict[Any, Dict] = {}
+    filepaths = [
+        filepath
+        for pattern in patterns or ['*.json', '*.jsonl']
+        for filepath in glob.glob(os.path.join(data_dir, pattern))
+    ]
+    # Sorted by name, the dumps of one search are read oldest first
+    for filepath in sorted(filepaths):
+        for job in load_from_json(filepath):
+            jobs[_saved_job_key(job)] = job
+    return list(jobs.values())
+
+def _saved_job_key(job: Dict) -> Any:
+    """Key identifying a saved posting across dumps."""
+    key = job_key(job)
+    if key:
+        return key
+    return tuple(str(job.get(field) or '').strip().casefold() for field in ('title', 'company', 'location'))
+
+COMPANY_SUFFIXES = {'inc', 'llc', 'ltd', 'corp', 'corporation', 'co', 'company', 'plc', 'lp'}
+
+def normalize_company(name: str) -> str:
+    """Normalize a company name for grouping: case, punctuation and legal suffixes."""
+    if not isinstance(name, str):
+        return ''
+    
+    words = re.sub(r'[^\w\s]', ' ', name.casefold()).split()
+    while len(words) > 1 and words[-1] in COMPANY_SUFFIXES:
+        words.pop()
+    return ' '.join(words)
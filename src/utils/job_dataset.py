@@ -0,0 +1,206 @@
+import re
+import uuid
+from datetime import date, datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+import logging
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DATASET_DIR = 'data/jobs'
+
+# Low-cardinality text is dictionary encoded, which pandas reads back as categoricals
+_CATEGORY = pa.dictionary(pa.int32(), pa.string())
+
+JOB_SCHEMA = pa.schema([
+    ('title', pa.string()),
+    ('company', pa.string()),
+    ('location', pa.string()),
+    ('description', pa.string()),
+    ('url', pa.string()),
+    ('job_type', _CATEGORY),
+    ('salary', pa.string()),
+    ('salary_min', pa.float64()),
+    ('salary_max', pa.float64()),
+    ('salary_period', _CATEGORY),
+    ('posted_date', pa.string()),
+    ('scraped_date', pa.timestamp('us')),
+    ('search_query', pa.string()),
+    ('search_location', pa.string()),
+    ('textblob_score', pa.float64()),
+    ('vader_compound', pa.float64()),
+    ('vader_pos', pa.float64()),
+    ('vader_neu', pa.float64()),
+    ('vader_neg', pa.float64()),
+    ('spacy_score', pa.float64()),
+    ('overall_sentiment', _CATEGORY),
+    # Partition keys, stored in the directory names rather than the files
+    ('source', pa.string()),
+    ('date', pa.string()),
+])
+
+PARTITIONING = ds.partitioning(
+    pa.schema([('source', pa.string()), ('date', pa.string())]),
+    flavor='hive'
+)
+
+_SALARY_AMOUNT = re.compile(r'\$?\s*(\d[\d,]*(?:\.\d+)?)\s*([kK])?')
+_SALARY_PERIODS = (
+    ('hour', re.compile(r'\bhour|\bhr\b|hourly', re.IGNORECASE)),
+    ('day', re.compile(r'\bday\b|daily', re.IGNORECASE)),
+    ('week', re.compile(r'\bweek|weekly', re.IGNORECASE)),
+    ('month', re.compile(r'\bmonth|monthly', re.IGNORECASE)),
+    ('year', re.compile(r'\byear|annual|\byr\b', re.IGNORECASE)),
+)
+
+def parse_salary(salary: Optional[str]) -> Tuple[Optional[float], Optional[float], Optional[str]]:
+    """
+    Parse a free-text salary into its range and pay period.
+
+    Args:
+        salary (str): Salary text such as "$80,000 - $100,000 a year"
+
+    Returns:
+        Tuple: Minimum, maximum and period ('hour', 'day', 'week', 'month' or 'year'),
+            each None when not present
+    """
+    if not isinstance(salary, str):
+        return None, None, None
+
+    amounts = []
+    for number, thousands in _SALARY_AMOUNT.findall(salary):
+        value = float(number.replace(',', ''))
+        amounts.append(value * 1000 if thousands else value)
+    if not amounts:
+        return None, None, None
+
+    period = next((name for name, pattern in _SALARY_PERIODS if pattern.search(salary)), None)
+    return min(amounts[:2]), max(amounts[:2]), period
+
+def _parse_datetime(value) -> Optional[datetime]:
+    """Parse an ISO timestamp, returning None for missing or malformed values."""
+    if isinstance(value, datetime):
+        return value
+    try:
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+
+def _job_row(job: Dict) -> Dict:
+    """Flatten one job dict into JOB_SCHEMA columns."""
+    salary_min, salary_max, salary_period = parse_salary(job.get('salary'))
+    scraped_date = _parse_datetime(job.get('scraped_date'))
+    sentiment = job.get('sentiment_analysis') or {}
+    vader_scores = sentiment.get('vader_scores') or {}
+
+    return {
+        'title': job.get('title'),
+        'company': job.get('company'),
+        'location': job.get('location'),
+        'description': job.get('description'),
+        'url': job.get('url'),
+        'job_type': job.get('job_type') or None,
+        'salary': job.get('salary'),
+        'salary_min': salary_min,
+        'salary_max': salary_max,
+        'salary_period': salary_period,
+        'posted_date': job.get('posted_date'),
+        'scraped_date': scraped_date,
+        'search_query': job.get('search_query'),
+        'search_location': job.get('search_location'),
+        'textblob_score': sentiment.get('textblob_score'),
+        'vader_compound': vader_scores.get('compound'),
+        'vader_pos': vader_scores.get('pos'),
+        'vader_neu': vader_scores.get('neu'),
+        'vader_neg': vader_scores.get('neg'),
+        'spacy_score': sentiment.get('spacy_score'),
+        'overall_sentiment': sentiment.get('overall_sentiment'),
+        'source': job.get('source') or 'unknown',
+        'date': (scraped_date.date() if scraped_date else date.today()).isoformat(),
+    }
+
+def jobs_to_table(jobs: Iterable[Dict]) -> pa.Table:
+    """Convert job dicts to an Arrow table with JOB_SCHEMA's typed columns."""
+    columns: Dict[str, List] = {name: [] for name in JOB_SCHEMA.names}
+    for job in jobs:
+        row = _job_row(job)
+        for name, values in columns.items():
+            values.append(row[name])
+    return pa.Table.from_pydict(columns, schema=JOB_SCHEMA)
+
+def write_jobs_dataset(jobs: Iterable[Dict], dataset_dir: str = DEFAULT_DATASET_DIR,
+                       basename: str = 'jobs') -> int:
+    """
+    Append jobs to a Parquet dataset partitioned by source and scrape date.
+
+    Each call adds new files under dataset_dir/source=<source>/date=<YYYY-MM-DD>/,
+    so earlier runs are never rewritten.
+
+    Args:
+        jobs (Iterable[Dict]): Job dicts as produced by the scrapers
+        dataset_dir (str): Root directory of the dataset
+        basename (str): Prefix for the new Parquet files
+
+    Returns:
+        int: Number of jobs written
+    """
+    table = jobs_to_table(jobs)
+    if table.num_rows == 0:
+        return 0
+
+    ds.write_dataset(
+        table,
+        dataset_dir,
+        format='parquet',
+        partitioning=PARTITIONING,
+        basename_template=f"{basename}-{uuid.uuid4().hex}-{{i}}.parquet",
+        existing_data_behavior='overwrite_or_ignore'
+    )
+    logger.info(f"Wrote {table.num_rows} jobs to {dataset_dir}")
+    return table.num_rows
+
+def read_jobs_dataset(
+    dataset_dir: str = DEFAULT_DATASET_DIR,
+    sources: Optional[List[str]] = None,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    columns: Optional[List[str]] = None
+) -> pd.DataFrame:
+    """
+    Load jobs from a partitioned Parquet dataset into a DataFrame.
+
+    Source and date filters prune whole partitions, so only the matching
+    files are opened, and only the requested columns are read from them.
+
+    Args:
+        dataset_dir (str): Root directory of the dataset
+        sources (List[str], optional): Only load these sources, e.g. ['Indeed']
+        start_date (str, optional): First scrape date to load, as YYYY-MM-DD
+        end_date (str, optional): Last scrape date to load, as YYYY-MM-DD
+        columns (List[str], optional): Columns to load; defaults to all
+
+    Returns:
+        pd.DataFrame: One row per job, with categorical job_type, salary_period
+            and overall_sentiment columns
+    """
+    if not Path(dataset_dir).exists():
+        schema = JOB_SCHEMA if columns is None else pa.schema([JOB_SCHEMA.field(name) for name in columns])
+        return schema.empty_table().to_pandas()
+
+    dataset = ds.dataset(dataset_dir, format='parquet', partitioning=PARTITIONING, schema=JOB_SCHEMA)
+
+    conditions = []
+    if sources:
+        conditions.append(ds.field('source').isin(sources))
+    if start_date:
+        conditions.append(ds.field('date') >= start_date)
+    if end_date:
+        conditions.append(ds.field('date') <= end_date)
+    condition = None
+    for part in conditions:
+        condition = part if condition is None else condition & part
+
+    return dataset.to_table(columns=columns, filter=condition).to_pandas()
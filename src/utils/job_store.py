@@ -0,0 +1,245 @@
+import hashlib
+import json
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+import logging
+from src.utils import urls
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_key TEXT PRIMARY KEY,
+    source TEXT COLLATE NOCASE,
+    url TEXT,
+    title TEXT,
+    company TEXT COLLATE NOCASE,
+    location TEXT COLLATE NOCASE,
+    description TEXT,
+    salary TEXT,
+    job_type TEXT,
+    posted_date TEXT,
+    scraped_date TEXT,
+    sentiment TEXT,
+    data TEXT NOT NULL,
+    first_seen TEXT NOT NULL,
+    last_seen TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_company ON jobs (company);
+CREATE INDEX IF NOT EXISTS idx_jobs_location ON jobs (location);
+CREATE INDEX IF NOT EXISTS idx_jobs_posted_date ON jobs (posted_date);
+CREATE INDEX IF NOT EXISTS idx_jobs_source ON jobs (source);
+CREATE INDEX IF NOT EXISTS idx_jobs_last_seen ON jobs (last_seen);
+"""
+
+# A re-scraped job refreshes its fields but keeps first_seen, and keeps its
+# sentiment when the new copy was not scored
+_UPSERT = """
+INSERT INTO jobs (
+    job_key, source, url, title, company, location, description, salary, job_type,
+    posted_date, scraped_date, sentiment, data, first_seen, last_seen
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (job_key) DO UPDATE SET
+    source = excluded.source,
+    url = excluded.url,
+    title = excluded.title,
+    company = excluded.company,
+    location = excluded.location,
+    description = excluded.description,
+    salary = excluded.salary,
+    job_type = excluded.job_type,
+    posted_date = excluded.posted_date,
+    scraped_date = excluded.scraped_date,
+    sentiment = COALESCE(excluded.sentiment, jobs.sentiment),
+    data = excluded.data,
+    last_seen = excluded.last_seen
+"""
+
+def job_key(job: Dict) -> str:
+    """
+    Stable identifier for a job: its platform job ID or canonical URL, or a
+    hash of its listing fields when it has no URL.
+
+    Args:
+        job (Dict): Scraped job
+
+    Returns:
+        str: Key used to deduplicate the job in the store
+    """
+    key = urls.job_key(job)
+    if key:
+        return key
+    fields = [str(job.get(field, '')).strip().lower() for field in ('source', 'title', 'company', 'location')]
+    return 'sha256:' + hashlib.sha256('\0'.join(fields).encode('utf-8')).hexdigest()
+
+class JobStore:
+    """
+    SQLite repository of scraped jobs, deduplicated by job_key.
+
+    Writing a job that is already stored updates it in place, so repeated runs
+    and overlapping searches never produce duplicate rows. Writes can be
+    buffered with add() and are committed in batches.
+    """
+
+    def __init__(self, path: str = "data/jobs.sqlite3", batch_size: int = 500):
+        """
+        Args:
+            path (str): SQLite database file
+            batch_size (int): Number of jobs buffered by add() before they are written
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.batch_size = batch_size
+        self._pending: List[Dict] = []
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        # WAL lets the notifier and visualizer read while a scrape is writing
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+    def _row_values(self, job: Dict, now: str) -> tuple:
+        """Column values for one job, in _UPSERT order."""
+        sentiment = job.get('sentiment_analysis')
+        return (
+            job_key(job),
+            job.get('source'),
+            job.get('url'),
+            job.get('title'),
+            job.get('company'),
+            job.get('location'),
+            job.get('description'),
+            job.get('salary'),
+            job.get('job_type'),
+            job.get('posted_date'),
+            job.get('scraped_date'),
+            json.dumps(sentiment) if sentiment else None,
+            json.dumps(job, ensure_ascii=False),
+            now,
+            now
+        )
+
+    def upsert_many(self, jobs: Iterable[Dict]) -> int:
+        """
+        Insert or update jobs in batched transactions.
+
+        Args:
+            jobs (Iterable[Dict]): Scraped jobs
+
+        Returns:
+            int: Number of jobs written
+        """
+        now = datetime.now().isoformat()
+        rows = [self._row_values(job, now) for job in jobs]
+        with self._lock:
+            for start in range(0, len(rows), self.batch_size):
+                with self._conn:
+                    self._conn.executemany(_UPSERT, rows[start:start + self.batch_size])
+        return len(rows)
+
+    def upsert(self, job: Dict) -> None:
+        """Insert or update a single job immediately."""
+        self.upsert_many([job])
+
+    def add(self, job: Dict) -> None:
+        """Buffer a job, writing the buffer once batch_size jobs are pending."""
+        self._pending.append(job)
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write any jobs buffered by add()."""
+        pending, self._pending = self._pending, []
+        if pending:
+            self.upsert_many(pending)
+
+    def known_keys(self, keys: Iterable[str]) -> Set[str]:
+        """Return the subset of job keys that are already stored."""
+        keys = list(keys)
+        known = set()
+        with self._lock:
+            # Stay well under SQLite's limit on bound parameters
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                placeholders = ','.join('?' * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT job_key FROM jobs WHERE job_key IN ({placeholders})", chunk
+                ).fetchall()
+                known.update(row['job_key'] for row in rows)
+        return known
+
+    def query(
+        self,
+        company: Optional[str] = None,
+        location: Optional[str] = None,
+        source: Optional[str] = None,
+        posted_since: Optional[str] = None,
+        seen_since: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> List[Dict]:
+        """
+        Fetch stored jobs matching every given filter, most recently seen first.
+
+        Company, location and source match exactly but case-insensitively,
+        which lets SQLite use their indexes.
+
+        Args:
+            company (str, optional): Company name
+            location (str, optional): Location as scraped, e.g. 'Nashville, TN'
+            source (str, optional): Source site, e.g. 'Indeed'
+            posted_since (str, optional): Earliest posted_date, compared as text
+            seen_since (str, optional): Earliest ISO timestamp the job was last scraped at
+            limit (int, optional): Maximum number of jobs to return
+
+        Returns:
+            List[Dict]: Stored jobs, each with its latest sentiment_analysis
+        """
+        conditions, params = [], []
+        for column, value in (('company', company), ('location', location), ('source', source)):
+            if value is not None:
+                conditions.append(f"{column} = ?")
+                params.append(value)
+        if posted_since is not None:
+            conditions.append("posted_date >= ?")
+            params.append(posted_since)
+        if seen_since is not None:
+            conditions.append("last_seen >= ?")
+            params.append(seen_since)
+
+        sql = "SELECT data, sentiment FROM jobs"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY last_seen DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+
+        jobs = []
+        for row in rows:
+            job = json.loads(row['data'])
+            if row['sentiment']:
+                job['sentiment_analysis'] = json.loads(row['sentiment'])
+            jobs.append(job)
+        return jobs
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+
+    def close(self) -> None:
+        self.flush()
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> 'JobStore':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,158 @@
+import re
+from typing import Dict, Iterable, List, Optional, Set
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Marks the end of a term in a trie node; no character of a term is empty
+_END = ''
+
+def _trie_pattern(node: Dict) -> str:
+    """
+    Regex equivalent to a trie of terms.
+
+    Terms sharing a prefix share its branch, e.g. python, pytorch and
+    python developer become py(?:t(?:hon(?: developer)?|orch)), so the
+    regex engine tests each character once per position rather than once
+    per term.
+    """
+    branches = [re.escape(char) + _trie_pattern(child) for char, child in node.items() if char != _END]
+    if not branches:
+        return ''
+    if len(branches) == 1 and _END not in node:
+        return branches[0]
+    group = '(?:' + '|'.join(branches) + ')'
+    return group + '?' if _END in node else group
+
+class KeywordMatcher:
+    """
+    Case-insensitive substring matcher for many terms at once.
+
+    The terms are compiled once into a trie and an equivalent regex. Text is
+    scanned in a single pass of the regex, and only at positions where some
+    term starts is the trie walked in Python to name every term found there,
+    including terms that are prefixes of, or overlap, one another.
+    """
+
+    def __init__(self, terms: Iterable[str]):
+        """
+        Args:
+            terms (Iterable[str]): Terms to look for; empty terms are ignored
+        """
+        # Lowercased term -> spellings as given, in order of first appearance
+        self.terms: Dict[str, List[str]] = {}
+        for term in terms:
+            if isinstance(term, str) and term:
+                self.terms.setdefault(term.lower(), []).append(term)
+
+        self._trie: Dict = {}
+        for key in self.terms:
+            node = self._trie
+            for char in key:
+                node = node.setdefault(char, {})
+            node[_END] = key
+        self._order = {key: index for index, key in enumerate(self.terms)}
+        self._longest = max(map(len, self.terms), default=0)
+
+        pattern = _trie_pattern(self._trie)
+        self._pattern: Optional[re.Pattern] = re.compile(pattern) if self.terms else None
+        # Zero-width, so finditer reports every start position, including overlapping ones
+        self._starts: Optional[re.Pattern] = re.compile(f'(?=(?:{pattern}))') if self.terms else None
+
+    def __bool__(self) -> bool:
+        return bool(self.terms)
+
+    def search(self, text: str) -> bool:
+        """Whether text contains any of the terms."""
+        if self._pattern is None or not text or not isinstance(text, str):
+            return False
+        return self._pattern.search(text.lower()) is not None
+
+    def find(self, text: str) -> Set[str]:
+        """Lowercased terms that occur in text."""
+        found: Set[str] = set()
+        if self._starts is None or not text or not isinstance(text, str):
+            return found
+        text = text.lower()
+        for start in self._starts.finditer(text):
+            node = self._trie
+            for char in text[start.start():start.start() + self._longest]:
+                node = node.get(char)
+                if node is None:
+                    break
+                if _END in node:
+                    found.add(node[_END])
+        return found
+
+    def spellings(self, found: Iterable[str]) -> List[str]:
+        """Terms as given for lowercased terms returned by find(), in the order they were given."""
+        return [term for key in sorted(found, key=self._order.__getitem__) for term in self.terms[key]]
+
+class CriteriaMatcher:
+    """
+    Notification criteria compiled into one KeywordMatcher per kind of rule.
+
+    Keywords are looked for in a job's title and description, locations in
+    its location and companies in its company, each as a case-insensitive
+    substring.
+    """
+
+    # Kind of rule -> job fields it is matched against
+    FIELDS = {
+        'keywords': ('title', 'description'),
+        'locations': ('location',),
+        'companies': ('company',),
+    }
+
+    def __init__(self, keywords: Iterable[str] = (), locations: Iterable[str] = (),
+                 companies: Iterable[str] = ()):
+        """
+        Args:
+            keywords (Iterable[str]): Terms to find in the title or description
+            locations (Iterable[str]): Terms to find in the location
+            companies (Iterable[str]): Terms to find in the company
+        """
+        self.matchers = {
+            'keywords': KeywordMatcher(keywords),
+            'locations': KeywordMatcher(locations),
+            'companies': KeywordMatcher(companies),
+        }
+
+    @classmethod
+    def from_config(cls, config: Dict) -> 'CriteriaMatcher':
+        """Matcher for the keywords, locations and companies of a notification config."""
+        return cls(config.get('keywords') or [], config.get('locations') or [], config.get('companies') or [])
+
+    def is_match(self, job: Dict) -> bool:
+        """Whether any rule matches the job; stops at the first match."""
+        for kind, fields in self.FIELDS.items():
+            matcher = self.matchers[kind]
+            if matcher and any(matcher.search(job.get(field) or '') for field in fields):
+                return True
+        return False
+
+    def find(self, job: Dict) -> Dict[str, Set[str]]:
+        """Lowercased terms found in a job, by kind of rule, for each kind with a match."""
+        found = {}
+        for kind, fields in self.FIELDS.items():
+            matcher = self.matchers[kind]
+            if not matcher:
+                continue
+            terms = set()
+            for field in fields:
+                terms |= matcher.find(job.get(field) or '')
+            if terms:
+                found[kind] = terms
+        return found
+
+    def matches(self, job: Dict) -> Dict[str, List[str]]:
+        """
+        Rules that match a job.
+
+        Args:
+            job (Dict): Job with title, description, location and company fields
+
+        Returns:
+            Dict[str, List[str]]: Kind of rule -> matching terms as configured, for each kind that matched
+        """
+        return {kind: self.matchers[kind].spellings(terms) for kind, terms in self.find(job).items()}
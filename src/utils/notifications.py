@@ -1,11 +1,14 @@
-import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+import atexit
 import json
+import threading
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 import logging
-from datetime import datetime
+from src.utils.email_delivery import EmailDeliveryQueue
+from src.utils.job_store import JobStore
+from src.utils.seen_log import SeenLog
+from src.utils.subscriptions import Subscriber, SubscriptionIndex
+from src.utils.urls import job_key
 
 # Configure logging
 logging.basicConfig(
@@ -14,11 +17,18 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Subscriber made of the top-level keywords, locations and companies of the config
+DEFAULT_SUBSCRIBER = 'default'
+
 class JobNotifier:
-    def __init__(self, config_path: str = "config/notifications.json"):
+    def __init__(self, config_path: str = "config/notifications.json", store: Optional[JobStore] = None):
         self.config_path = Path(config_path)
+        self.store = store
         self.config = self._load_config()
+        self.subscriptions = SubscriptionIndex(self._load_subscribers())
         self.last_notified_jobs = self._load_last_notified()
+        self._delivery: Optional[EmailDeliveryQueue] = None
+        self._delivery_lock = threading.Lock()
     
     def _load_config(self) -> Dict:
         """Load notification configuration from JSON file."""
@@ -35,115 +45,160 @@ class JobNotifier:
                 },
                 "keywords": [],
                 "locations": [],
-                "companies": []
+                "companies": [],
+                "subscribers": [],
+                "history": {
+                    "path": "data/notified_jobs.txt",
+                    "ttl_days": 90,
+                    "bloom_capacity": None
+                }
             }
         
         with open(self.config_path, 'r') as f:
             return json.load(f)
     
-    def _load_last_notified(self) -> Dict:
-        """Load the last notified jobs from file."""
-        last_notified_path = Path("data/last_notified.json")
-        if not last_notified_path.exists():
-            return {}
+    def _load_subscribers(self) -> List[Subscriber]:
+        """
+        Subscribers of the config: one per entry of its subscribers list, plus
+        one for the top-level keywords, locations and companies sent to email.to_email.
+        """
+        subscribers = [Subscriber(
+            DEFAULT_SUBSCRIBER,
+            self.config.get('email', {}).get('to_email', ''),
+            self.config.get('keywords') or [],
+            self.config.get('locations') or [],
+            self.config.get('companies') or []
+        )]
+        subscribers.extend(Subscriber.from_dict(entry) for entry in self.config.get('subscribers') or [])
+        return subscribers
+    
+    def _load_last_notified(self) -> SeenLog:
+        """Open the log of jobs already notified about, importing data/last_notified.json into a new log."""
+        history = self.config.get('history') or {}
+        log = SeenLog(
+            history.get('path', "data/notified_jobs.txt"),
+            ttl_days=history.get('ttl_days', 90),
+            bloom_capacity=history.get('bloom_capacity')
+        )
         
-        with open(last_notified_path, 'r') as f:
-            return json.load(f)
+        legacy_path = Path("data/last_notified.json")
+        if legacy_path.exists() and not log.path.exists():
+            with open(legacy_path, 'r') as f:
+                legacy = json.load(f)
+            log.add_many((job_id, notified[:19]) for job_id, notified in legacy.items())
+            log.flush()
+            logger.info(f"Imported {len(legacy)} notified jobs from {legacy_path} into {log.path}")
+        
+        return log
     
     def _save_last_notified(self) -> None:
-        """Save the last notified jobs to file."""
-        last_notified_path = Path("data/last_notified.json")
-        last_notified_path.parent.mkdir(exist_ok=True)
-        
-        with open(last_notified_path, 'w') as f:
-            json.dump(self.last_notified_jobs, f, indent=2)
+        """Append newly notified jobs to the log."""
+        self.last_notified_jobs.flush()
     
     def _matches_criteria(self, job: Dict) -> bool:
-        """Check if a job matches the notification criteria."""
-        # Check keywords in title and description
-        title = job.get('title', '').lower()
-        description = job.get('description', '').lower()
-        
-        for keyword in self.config.get('keywords', []):
-            if keyword.lower() in title or keyword.lower() in description:
-                return True
-        
-        # Check location
-        location = job.get('location', '').lower()
-        for loc in self.config.get('locations', []):
-            if loc.lower() in location:
-                return True
-        
-        # Check company
-        company = job.get('company', '').lower()
-        for comp in self.config.get('companies', []):
-            if comp.lower() in company:
-                return True
-        
-        return False
+        """Check if a job matches the notification criteria of any subscriber."""
+        return bool(self.subscriptions.route(job))
+    
+    def matched_rules(self, job: Dict) -> Dict[str, Dict[str, List[str]]]:
+        """Subscribers a job matches, with the keywords, locations and companies of theirs it matched."""
+        return self.subscriptions.route(job)
+    
+    @property
+    def delivery(self) -> EmailDeliveryQueue:
+        """Background queue sending this notifier's emails, started on first use."""
+        with self._delivery_lock:
+            if self._delivery is None:
+                self._delivery = EmailDeliveryQueue.from_config(self.config['email'])
+                atexit.register(self.close)
+            return self._delivery
     
-    def _send_email(self, subject: str, body: str) -> None:
-        """Send an email notification."""
+    def _send_email(self, subject: str, body: str, to_email: Optional[str] = None) -> None:
+        """Queue an email notification, by default to the configured to_email; returns without waiting for it."""
         if not self.config['email']['enabled']:
             return
         
-        try:
-            msg = MIMEMultipart()
-            msg['From'] = self.config['email']['from_email']
-            msg['To'] = self.config['email']['to_email']
-            msg['Subject'] = subject
-            
-            msg.attach(MIMEText(body, 'plain'))
-            
-            with smtplib.SMTP(
-                self.config['email']['smtp_server'],
-                self.config['email']['smtp_port']
-            ) as server:
-                server.starttls()
-                server.login(
-                    self.config['email']['username'],
-                    self.config['email']['password']
-                )
-                server.send_message(msg)
-            
-            logger.info("Email notification sent successfully")
-        except Exception as e:
-            logger.error(f"Failed to send email notification: {str(e)}")
+        self.delivery.send(to_email or self.config['email']['to_email'], subject, body)
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until queued emails have been sent; returns False if timeout passed first."""
+        return self._delivery.flush(timeout) if self._delivery is not None else True
+    
+    def close(self) -> None:
+        """Send queued emails and close the mail server connection."""
+        with self._delivery_lock:
+            delivery, self._delivery = self._delivery, None
+        if delivery is not None:
+            delivery.close()
+    
+    def __enter__(self) -> 'JobNotifier':
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    def _format_digest(self, matches: List[Tuple[Dict, Dict[str, List[str]]]]) -> str:
+        """Email body listing matched jobs and the rules each one matched."""
+        body = "New job matches found:\n\n"
+        
+        for job, rules in matches:
+            body += f"Title: {job.get('title', '')}\n"
+            body += f"Company: {job.get('company', '')}\n"
+            body += f"Location: {job.get('location', '')}\n"
+            body += f"URL: {job.get('url', '')}\n"
+            matched = '; '.join(f"{kind}: {', '.join(terms)}" for kind, terms in rules.items())
+            body += f"Matched: {matched}\n\n"
+        
+        return body
     
     def check_new_jobs(self, jobs: List[Dict]) -> List[Dict]:
-        """Check for new jobs that match the criteria and send notifications."""
+        """Check for new jobs that match any subscriber's criteria and send each subscriber their matches."""
         new_jobs = []
+        digests: Dict[str, List[Tuple[Dict, Dict[str, List[str]]]]] = {}
         
         for job in jobs:
-            job_id = job.get('url', '')  # Use URL as unique identifier
+            # Platform job ID or canonical URL, so tracking variants of a link match
+            job_id = job_key(job) or ''
             
-            # Skip if we've already notified about this job
-            if job_id in self.last_notified_jobs:
+            # Skip if we've already notified about this job, including under its raw URL
+            if job_id in self.last_notified_jobs or job.get('url', '') in self.last_notified_jobs:
                 continue
             
-            # Check if job matches criteria
-            if self._matches_criteria(job):
+            # Route the job to every subscriber it matches in one pass, noting which rules matched
+            routes = self.subscriptions.route(job)
+            if routes:
                 new_jobs.append(job)
-                self.last_notified_jobs[job_id] = datetime.now().isoformat()
+                for subscriber_id, rules in routes.items():
+                    digests.setdefault(subscriber_id, []).append((job, rules))
+                self.last_notified_jobs.add(job_id)
         
         if new_jobs:
-            # Send email notification
-            subject = f"New Job Matches Found: {len(new_jobs)}"
-            body = "New job matches found:\n\n"
-            
-            for job in new_jobs:
-                body += f"Title: {job.get('title', '')}\n"
-                body += f"Company: {job.get('company', '')}\n"
-                body += f"Location: {job.get('location', '')}\n"
-                body += f"URL: {job.get('url', '')}\n\n"
-            
-            self._send_email(subject, body)
+            # Send each subscriber one email with their matches
+            for subscriber_id, matches in digests.items():
+                subscriber = self.subscriptions.subscribers[subscriber_id]
+                subject = f"New Job Matches Found: {len(matches)}"
+                self._send_email(subject, self._format_digest(matches), subscriber.email)
             
             # Save updated last notified jobs
             self._save_last_notified()
         
         return new_jobs
 
+    def check_stored_jobs(self, seen_since: Optional[str] = None, **filters) -> List[Dict]:
+        """
+        Check jobs kept in the job store for new matches and send notifications.
+        
+        Args:
+            seen_since (str, optional): Only consider jobs scraped at or after this ISO timestamp
+            **filters: Passed to JobStore.query, e.g. source='Indeed'
+            
+        Returns:
+            List[Dict]: Newly matched jobs
+        """
+        if self.store is None:
+            raise ValueError("JobNotifier was created without a job store")
+        
+        return self.check_new_jobs(self.store.query(seen_since=seen_since, **filters))
+
 if __name__ == "__main__":
     # Example usage
     notifier = JobNotifier()
@@ -168,4 +223,5 @@ if __name__ == "__main__":
     
     # Check for new jobs and send notifications
     new_jobs = notifier.check_new_jobs(jobs)
-    print(f"Found {len(new_jobs)} new matching jobs") 
\ No newline at end of file
+    print(f"Found {len(new_jobs)} new matching jobs")
+    notifier.close()
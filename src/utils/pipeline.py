@@ -0,0 +1,235 @@
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+import logging
+from src.utils.text import clean_texts
+
+logger = logging.getLogger(__name__)
+
+# Marks the end of the stream on a stage's inbox
+_DONE = object()
+
+# How often blocked queue operations check whether the pipeline was stopped
+_POLL_INTERVAL = 0.1
+
+class Stage:
+    """One step of a Pipeline: a function from a batch of jobs to the jobs to pass on."""
+
+    def __init__(self, name: str, func: Callable[[List[Dict]], Iterable[Dict]],
+                 batch_size: int = 1, batch_timeout: float = 0.5):
+        """
+        Args:
+            name (str): Name used in log messages and thread names
+            func (Callable): Takes a list of jobs and returns the jobs to pass downstream;
+                it may transform, drop or add jobs
+            batch_size (int): Maximum number of jobs handed to func at once
+            batch_timeout (float): Longest time to wait for a batch to fill before
+                processing what has arrived, in seconds
+        """
+        self.name = name
+        self.func = func
+        self.batch_size = batch_size
+        self.batch_timeout = batch_timeout
+
+class Pipeline:
+    """
+    Stream jobs from a source iterator through stages running on their own threads.
+
+    Stages are joined by bounded queues, so a slow stage applies back-pressure
+    to the ones before it instead of letting jobs pile up in memory, and the
+    first job reaches the consumer as soon as it has passed every stage rather
+    than after the whole crawl. Iterating the pipeline runs it; an exception in
+    the source or any stage stops every thread and is re-raised to the consumer.
+    """
+
+    def __init__(self, source: Iterable[Dict], stages: List[Stage], queue_size: int = 100):
+        """
+        Args:
+            source (Iterable[Dict]): Jobs to process, typically a scraper's iter_job_listings
+            stages (List[Stage]): Stages applied in order
+            queue_size (int): Capacity of each queue between stages
+        """
+        self.source = source
+        self.stages = stages
+        self.queue_size = queue_size
+        self._stop = threading.Event()
+        self._error: Optional[BaseException] = None
+
+    def __iter__(self) -> Iterator[Dict]:
+        queues = [queue.Queue(maxsize=self.queue_size) for _ in range(len(self.stages) + 1)]
+        threads = [threading.Thread(target=self._run_source, args=(queues[0],), name='pipeline-source', daemon=True)]
+        for stage, inbox, outbox in zip(self.stages, queues, queues[1:]):
+            threads.append(threading.Thread(
+                target=self._run_stage,
+                args=(stage, inbox, outbox),
+                name=f'pipeline-{stage.name}',
+                daemon=True
+            ))
+
+        for thread in threads:
+            thread.start()
+        try:
+            while True:
+                job = self._get(queues[-1])
+                if job is _DONE:
+                    break
+                yield job
+            if self._error is not None:
+                raise self._error
+        finally:
+            # Also reached when the consumer stops early, which winds down every stage
+            self._stop.set()
+            for thread in threads:
+                thread.join()
+
+    def run(self, sink: Callable[[Dict], Any]) -> int:
+        """
+        Run the pipeline to completion, handing every job to sink.
+
+        Args:
+            sink (Callable): Called with each job that made it through all stages
+
+        Returns:
+            int: Number of jobs passed to sink
+        """
+        count = 0
+        for job in self:
+            sink(job)
+            count += 1
+        return count
+
+    def _run_source(self, outbox: queue.Queue) -> None:
+        """Feed jobs from the source into the first queue."""
+        jobs = iter(self.source)
+        try:
+            for job in jobs:
+                if not self._put(outbox, job):
+                    break
+        except Exception as e:
+            self._fail('source', e)
+        finally:
+            # Let generator sources run their cleanup, e.g. flushing the seen index
+            close = getattr(jobs, 'close', None)
+            if close is not None:
+                close()
+            self._put(outbox, _DONE)
+
+    def _run_stage(self, stage: Stage, inbox: queue.Queue, outbox: queue.Queue) -> None:
+        """Process batches from inbox with the stage function until the stream ends."""
+        try:
+            done = False
+            while not done:
+                batch, done = self._next_batch(stage, inbox)
+                if batch:
+                    for job in stage.func(batch):
+                        if not self._put(outbox, job):
+                            return
+        except Exception as e:
+            self._fail(stage.name, e)
+        finally:
+            self._put(outbox, _DONE)
+
+    def _next_batch(self, stage: Stage, inbox: queue.Queue) -> Tuple[List[Dict], bool]:
+        """Collect up to batch_size jobs, returning the batch and whether the stream ended."""
+        job = self._get(inbox)
+        if job is _DONE:
+            return [], True
+
+        batch = [job]
+        deadline = time.monotonic() + stage.batch_timeout
+        while len(batch) < stage.batch_size:
+            # Past the deadline only jobs that are already queued join the batch
+            remaining = deadline - time.monotonic()
+            try:
+                job = inbox.get(timeout=remaining) if remaining > 0 else inbox.get_nowait()
+            except queue.Empty:
+                break
+            if job is _DONE:
+                return batch, True
+            batch.append(job)
+        return batch, False
+
+    def _put(self, q: queue.Queue, item: Any) -> bool:
+        """Put item on a bounded queue, giving up if the pipeline is stopped."""
+        while not self._stop.is_set():
+            try:
+                q.put(item, timeout=_POLL_INTERVAL)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _get(self, q: queue.Queue) -> Any:
+        """Take the next item from a queue, or _DONE once the pipeline is stopped."""
+        while not self._stop.is_set():
+            try:
+                return q.get(timeout=_POLL_INTERVAL)
+            except queue.Empty:
+                continue
+        return _DONE
+
+    def _fail(self, where: str, error: BaseException) -> None:
+        """Record the first error and stop every stage."""
+        logger.error(f"Pipeline {where} failed: {str(error)}")
+        if self._error is None:
+            self._error = error
+        self._stop.set()
+
+# Text fields normalized by the clean stage. description and job_type are left
+# as scraped: clean_text drops the punctuation VADER scores and would turn
+# 'Full-time' into 'Fulltime' in every sink.
+TEXT_FIELDS = ('title', 'company', 'location', 'salary')
+
+def clean_jobs(jobs: List[Dict]) -> List[Dict]:
+    """Run clean_text over each job's text fields in place, a field at a time."""
+    for field in TEXT_FIELDS:
+        present = [job for job in jobs if isinstance(job.get(field), str)]
+        for job, value in zip(present, clean_texts(job[field] for job in present)):
+            job[field] = value
+    return jobs
+
+def details_stage(scraper, batch_size: int = 10) -> Stage:
+    """
+    Stage that fetches and merges each job's detail page through the scraper's fetcher.
+    
+    The source should yield listings without details, e.g.
+    scraper.iter_job_listings(url, fetch_details=False), or each page is fetched twice.
+    """
+    def add_details(jobs: List[Dict]) -> List[Dict]:
+        scraper.add_details(jobs)
+        return jobs
+    return Stage('details', add_details, batch_size=batch_size)
+
+def sentiment_stage(analyzer, batch_size: int = 32) -> Stage:
+    """Stage that attaches sentiment_analysis to each job, scoring a batch at a time."""
+    def add_sentiment(jobs: List[Dict]) -> List[Dict]:
+        sentiments = analyzer.analyze_many([job.get('description', '') for job in jobs], batch_size=batch_size)
+        for job, sentiment in zip(jobs, sentiments):
+            job['sentiment_analysis'] = sentiment
+        return jobs
+    return Stage('sentiment', add_sentiment, batch_size=batch_size)
+
+def build_pipeline(source: Iterable[Dict], analyzer=None, detail_scraper=None,
+                   queue_size: int = 100) -> Pipeline:
+    """
+    Build the standard scrape -> details -> clean -> sentiment pipeline over a job source.
+
+    Args:
+        source (Iterable[Dict]): Jobs as they are fetched and parsed, typically a
+            scraper's iter_job_listings
+        analyzer (SentimentAnalyzer, optional): Adds a sentiment stage when given
+        detail_scraper (JobScraper, optional): Adds a stage fetching each job's
+            detail page, for sources iterated with fetch_details=False
+        queue_size (int): Capacity of each queue between stages
+
+    Returns:
+        Pipeline: Iterate it, or call run() with a sink, to scrape
+    """
+    stages = []
+    if detail_scraper is not None:
+        stages.append(details_stage(detail_scraper))
+    stages.append(Stage('clean', clean_jobs, batch_size=50, batch_timeout=0))
+    if analyzer is not None:
+        stages.append(sentiment_stage(analyzer))
+    return Pipeline(source, stages, queue_size=queue_size)
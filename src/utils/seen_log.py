@@ -0,0 +1,299 @@
+import hashlib
+import math
+import os
+import struct
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+import logging
+from src.utils.files import truncate_partial_line
+
+logger = logging.getLogger(__name__)
+
+# Sidecar file header: magic, bit count, hash count, log bytes covered by the
+# filter, and the log's line count and compaction threshold at that point
+_BLOOM_HEADER = struct.Struct('<4sQQQQQ')
+_BLOOM_MAGIC = b'BLM2'
+
+class BloomFilter:
+    """
+    Fixed-size set of keys answering "definitely not added" or "maybe added".
+
+    Uses k positions per key derived by double hashing one blake2b digest,
+    with the bit count and k chosen for the expected number of keys.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        """
+        Args:
+            capacity (int): Number of keys the filter is sized for
+            error_rate (float): False positive rate at capacity
+        """
+        capacity = max(capacity, 1)
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, key: str) -> Iterable[int]:
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest()
+        first, second = int.from_bytes(digest[:8], 'little'), int.from_bytes(digest[8:], 'little') | 1
+        return ((first + i * second) % self.size for i in range(self.hashes))
+
+    def add(self, key: str) -> None:
+        for position in self._positions(key):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, key: str) -> bool:
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+    def save(self, path: Path, covered: int, lines: int = 0, compact_at: int = 0) -> None:
+        """
+        Write the filter to path.
+        
+        Args:
+            path (Path): Sidecar file to write
+            covered (int): Bytes at the start of the log whose keys the filter holds
+            lines (int): Lines in those bytes
+            compact_at (int): Line count at which the log is next compacted
+        """
+        temp_path = path.with_name(path.name + '.tmp')
+        with open(temp_path, 'wb') as f:
+            f.write(_BLOOM_HEADER.pack(_BLOOM_MAGIC, self.size, self.hashes, covered, lines, compact_at))
+            f.write(self.bits)
+        os.replace(temp_path, path)
+
+    @classmethod
+    def load(cls, path: Path) -> Tuple[Optional['BloomFilter'], int, int, int]:
+        """
+        Filter saved at path with the covered, lines and compact_at it was saved with,
+        or (None, 0, 0, 0) if it is missing or damaged.
+        """
+        try:
+            with open(path, 'rb') as f:
+                magic, size, hashes, covered, lines, compact_at = _BLOOM_HEADER.unpack(f.read(_BLOOM_HEADER.size))
+                bits = bytearray(f.read())
+        except (OSError, struct.error):
+            return None, 0, 0, 0
+        if magic != _BLOOM_MAGIC or len(bits) != (size + 7) // 8:
+            return None, 0, 0, 0
+        bloom = cls.__new__(cls)
+        bloom.size, bloom.hashes, bloom.bits = size, hashes, bits
+        return bloom, covered, lines, compact_at
+
+class SeenLog:
+    """
+    Persistent record of job keys and when they were last seen, e.g. notified.
+
+    Keys are appended one "<ISO timestamp>\\t<key>" line at a time, so saving
+    costs only the new entries. Entries older than the TTL are ignored, and
+    the file is compacted to the latest entry of each live key whenever it
+    has grown to twice its size after the last compaction, which keeps it,
+    and the time to read it back, proportional to the keys seen within the
+    TTL.
+
+    With bloom_capacity set, a Bloom filter saved next to the log answers
+    lookups of keys never seen without reading the log at all; the log is
+    only loaded on the first lookup the filter cannot rule out. The filter
+    also records the log's line count, so compaction still triggers while
+    the log is not loaded, and then streams the file instead.
+    """
+
+    def __init__(self, path: str = "data/seen_log.txt", ttl_days: Optional[float] = 90,
+                 bloom_capacity: Optional[int] = None, bloom_error_rate: float = 0.01,
+                 compact_min_lines: int = 1000):
+        """
+        Args:
+            path (str): Path of the log file
+            ttl_days (float, optional): Forget entries older than this; None keeps them forever
+            bloom_capacity (int, optional): Keys to size a Bloom filter for; None disables it
+            bloom_error_rate (float): False positive rate of the Bloom filter at capacity
+            compact_min_lines (int): Never compact logs shorter than this
+        """
+        self.path = Path(path)
+        self.ttl = timedelta(days=ttl_days) if ttl_days is not None else None
+        self.bloom_capacity = bloom_capacity
+        self.bloom_error_rate = bloom_error_rate
+        self.compact_min_lines = compact_min_lines
+        self.bloom_path = self.path.with_name(self.path.name + '.bloom')
+
+        self._lock = threading.Lock()
+        self._entries: Optional[Dict[str, str]] = None
+        self._lines = 0
+        # Line count at which the log is next compacted
+        self._compact_at = compact_min_lines
+        self._pending: List[str] = []
+        self._bloom: Optional[BloomFilter] = None
+
+        truncate_partial_line(self.path)
+        if bloom_capacity:
+            self._open_bloom()
+        else:
+            self._load()
+
+    def _cutoff(self) -> Optional[str]:
+        return (datetime.now() - self.ttl).isoformat(timespec='seconds') if self.ttl else None
+
+    def _read(self, offset: int = 0) -> Iterator[Tuple[str, str]]:
+        """(timestamp, key) of each complete line of the log from offset on."""
+        if not self.path.exists():
+            return
+        with open(self.path, 'r', encoding='utf-8') as f:
+            f.seek(offset)
+            for line in f:
+                timestamp, _, key = line.rstrip('\n').partition('\t')
+                if key:
+                    yield timestamp, key
+
+    def _load(self) -> None:
+        """Read the log into memory, keeping each key's latest entry within the TTL."""
+        entries: Dict[str, str] = {}
+        lines = 0
+        for timestamp, key in self._read():
+            entries[key] = timestamp
+            lines += 1
+        for line in self._pending:
+            timestamp, _, key = line.rstrip('\n').partition('\t')
+            entries[key] = timestamp
+        cutoff = self._cutoff()
+        if cutoff:
+            entries = {key: timestamp for key, timestamp in entries.items() if timestamp >= cutoff}
+        self._entries = entries
+        self._lines = lines
+        self._compact_at = max(self.compact_min_lines, 2 * len(entries))
+        if lines:
+            logger.info(f"Loaded {len(entries)} seen keys from {self.path}")
+
+    def _open_bloom(self) -> None:
+        """Load the saved Bloom filter, catching it up with lines appended after it was saved."""
+        log_size = self.path.stat().st_size if self.path.exists() else 0
+        bloom, covered, lines, compact_at = BloomFilter.load(self.bloom_path)
+        if bloom is None or covered > log_size:
+            # Missing, damaged, or older than a compaction that never finished
+            self._load()
+            self._rebuild_bloom(self._entries)
+            return
+
+        self._bloom = bloom
+        self._lines = lines
+        self._compact_at = max(self.compact_min_lines, compact_at)
+        if covered < log_size:
+            for _, key in self._read(covered):
+                bloom.add(key)
+                self._lines += 1
+            self._save_bloom()
+
+    def _rebuild_bloom(self, keys: Iterable[str]) -> None:
+        """Build a Bloom filter of keys, the keys of the whole log, and save it."""
+        keys = list(keys)
+        self._bloom = BloomFilter(max(self.bloom_capacity, 2 * len(keys)), self.bloom_error_rate)
+        for key in keys:
+            self._bloom.add(key)
+        self._save_bloom()
+
+    def _save_bloom(self) -> None:
+        self._bloom.save(self.bloom_path, self.path.stat().st_size if self.path.exists() else 0,
+                         self._lines, self._compact_at)
+
+    def _ensure_loaded(self) -> Dict[str, str]:
+        if self._entries is None:
+            self._load()
+        return self._entries
+
+    def get(self, key: str) -> Optional[str]:
+        """When key was last seen, as an ISO timestamp, or None if not within the TTL."""
+        if not key:
+            return None
+        with self._lock:
+            if self._bloom is not None and key not in self._bloom:
+                return None
+            timestamp = self._ensure_loaded().get(key)
+        cutoff = self._cutoff()
+        return timestamp if timestamp and (cutoff is None or timestamp >= cutoff) else None
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
+
+    def __len__(self) -> int:
+        """Keys seen within the TTL."""
+        with self._lock:
+            entries = self._ensure_loaded()
+        cutoff = self._cutoff()
+        return sum(1 for timestamp in entries.values() if cutoff is None or timestamp >= cutoff)
+
+    def add(self, key: str, timestamp: Optional[str] = None) -> None:
+        """Record key as seen at timestamp (default now); written out on flush()."""
+        if not key:
+            return
+        timestamp = timestamp or datetime.now().isoformat(timespec='seconds')
+        with self._lock:
+            if self._entries is not None:
+                self._entries[key] = timestamp
+            if self._bloom is not None:
+                self._bloom.add(key)
+            self._pending.append(f"{timestamp}\t{key}\n")
+
+    def add_many(self, entries: Iterable[Tuple[str, Optional[str]]]) -> None:
+        """Record (key, timestamp) pairs as seen."""
+        for key, timestamp in entries:
+            self.add(key, timestamp)
+
+    def flush(self) -> None:
+        """Append entries added since the last flush, compacting the log once it has doubled."""
+        with self._lock:
+            if not self._pending:
+                return
+
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.writelines(self._pending)
+            self._lines += len(self._pending)
+            self._pending = []
+            if self._needs_compaction():
+                self._compact()
+            elif self._bloom is not None:
+                self._save_bloom()
+
+    def _needs_compaction(self) -> bool:
+        # Compacting once the log doubles past its live size keeps the cost amortized per appended line
+        return self._lines >= self._compact_at
+
+    def compact(self) -> None:
+        """Rewrite the log with only the latest entry of each key within the TTL."""
+        with self._lock:
+            self._compact()
+
+    def _compact(self) -> None:
+        cutoff = self._cutoff()
+        if self._entries is not None:
+            if cutoff:
+                self._entries = {key: timestamp for key, timestamp in self._entries.items() if timestamp >= cutoff}
+            latest = self._entries
+        else:
+            # Not loaded: dedupe the file and pending entries without keeping the result
+            latest = {}
+            for timestamp, key in self._read():
+                latest[key] = timestamp
+            for line in self._pending:
+                timestamp, _, key = line.rstrip('\n').partition('\t')
+                latest[key] = timestamp
+            if cutoff:
+                latest = {key: timestamp for key, timestamp in latest.items() if timestamp >= cutoff}
+        live = sorted(latest.items(), key=lambda entry: entry[1])
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.path.with_name(self.path.name + '.tmp')
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            # Pending entries are in latest already, so they are written here too
+            f.writelines(f"{timestamp}\t{key}\n" for key, timestamp in live)
+        if self._bloom is not None:
+            # Without a filter the next open rebuilds one, should we stop before saving the new one
+            self.bloom_path.unlink(missing_ok=True)
+        os.replace(temp_path, self.path)
+        logger.info(f"Compacted {self.path} from {self._lines} to {len(live)} lines")
+        self._lines = len(live)
+        self._compact_at = max(self.compact_min_lines, 2 * len(live))
+        self._pending = []
+        if self._bloom is not None:
+            # The new filter only holds live keys, which also drops expired ones
+            self._rebuild_bloom(latest)
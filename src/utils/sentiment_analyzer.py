@@ -1,23 +1,103 @@
 import logging
-from typing import Dict, List
-from textblob import TextBlob
-import spacy
-import nltk
-from nltk.sentiment import SentimentIntensityAnalyzer
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
+from src.utils.sentiment_cache import SentimentCache
 
-# Download required NLTK data
-nltk.download('vader_lexicon')
-nltk.download('punkt')
+# Models are loaded on first use and shared process-wide. Set SPACY_MODEL to a
+# package name or a local model directory, and VADER_LEXICON to a local
+# vader_lexicon.txt to run fully offline. SENTIMENT_OFFLINE=1 disables any
+# download attempt.
+SPACY_MODEL = os.environ.get('SPACY_MODEL', 'en_core_web_sm')
+VADER_LEXICON = os.environ.get('VADER_LEXICON')
+ALLOW_DOWNLOADS = os.environ.get('SENTIMENT_OFFLINE', '') not in ('1', 'true', 'yes')
 
-# Load spaCy model
-nlp = spacy.load('en_core_web_sm')
+# Bump when the scoring logic changes so cached results are not reused
+SCORING_VERSION = 1
+
+_nlp = None
+_sia = None
+_model_version = None
+_models_lock = threading.Lock()
+
+def get_nlp():
+    """Load the spaCy model on first use and return the shared instance."""
+    global _nlp
+    if _nlp is None:
+        with _models_lock:
+            if _nlp is None:
+                import spacy
+                _nlp = spacy.load(SPACY_MODEL)
+    return _nlp
+
+def get_vader():
+    """Load the VADER analyzer on first use and return the shared instance."""
+    global _sia
+    if _sia is None:
+        with _models_lock:
+            if _sia is None:
+                _sia = _load_vader()
+    return _sia
+
+def _load_vader():
+    from nltk.sentiment import SentimentIntensityAnalyzer
+    
+    if VADER_LEXICON:
+        return SentimentIntensityAnalyzer(lexicon_file=VADER_LEXICON)
+    try:
+        return SentimentIntensityAnalyzer()
+    except LookupError:
+        if not ALLOW_DOWNLOADS:
+            raise
+        import nltk
+        nltk.download('vader_lexicon', quiet=True)
+        return SentimentIntensityAnalyzer()
+
+def get_model_version() -> str:
+    """Identify the scoring setup, used to key cached sentiment results."""
+    global _model_version
+    if _model_version is None:
+        from importlib.metadata import PackageNotFoundError, version
+        
+        parts = [f"scoring={SCORING_VERSION}", f"spacy_model={SPACY_MODEL}", f"vader_lexicon={VADER_LEXICON or 'nltk'}"]
+        for package in ('textblob', 'nltk', 'spacy'):
+            try:
+                parts.append(f"{package}={version(package)}")
+            except PackageNotFoundError:
+                parts.append(f"{package}=unknown")
+        _model_version = ';'.join(parts)
+    return _model_version
+
+def _lexical_scores(description: str) -> Optional[Tuple[float, Dict]]:
+    """Score one description with TextBlob and VADER, returning None on failure."""
+    from textblob import TextBlob
+    
+    try:
+        return TextBlob(description).sentiment.polarity, get_vader().polarity_scores(description)
+    except Exception:
+        return None
+
+def _spacy_score(doc) -> float:
+    """Average token sentiment of a spaCy Doc."""
+    return sum([token.sentiment for token in doc]) / len(doc) if len(doc) > 0 else 0
 
 class SentimentAnalyzer:
-    def __init__(self):
-        self.sia = SentimentIntensityAnalyzer()
+    def __init__(self, cache: Optional[SentimentCache] = None):
+        """
+        Args:
+            cache (SentimentCache, optional): Memoizes results by description text
+        """
+        self.cache = cache
         logging.basicConfig(level=logging.INFO)
         self.logger = logging.getLogger(__name__)
 
+    @property
+    def sia(self):
+        """Shared VADER analyzer, loaded on first use."""
+        return get_vader()
+
     def analyze_job_description(self, description: str) -> Dict:
         """
         Analyze the sentiment of a job description using multiple methods.
@@ -28,36 +108,145 @@ class SentimentAnalyzer:
         Returns:
             Dict: Dictionary containing sentiment scores from different methods
         """
+        from textblob import TextBlob
+        
+        cache_key = self._cache_key(description)
+        if cache_key:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
+        # Load models outside the try so a missing model fails loudly
+        nlp = get_nlp()
+        sia = self.sia
+        
         try:
             # TextBlob analysis
             blob = TextBlob(description)
             textblob_sentiment = blob.sentiment.polarity
             
             # NLTK VADER analysis
-            vader_scores = self.sia.polarity_scores(description)
+            vader_scores = sia.polarity_scores(description)
             
             # spaCy analysis
             doc = nlp(description)
-            spacy_sentiment = sum([token.sentiment for token in doc]) / len(doc) if len(doc) > 0 else 0
+            spacy_sentiment = _spacy_score(doc)
             
-            return {
-                'textblob_score': textblob_sentiment,
-                'vader_scores': vader_scores,
-                'spacy_score': spacy_sentiment,
-                'overall_sentiment': self._calculate_overall_sentiment(
-                    textblob_sentiment,
-                    vader_scores['compound'],
-                    spacy_sentiment
-                )
-            }
+            result = self._build_result(textblob_sentiment, vader_scores, spacy_sentiment)
+            if cache_key:
+                self.cache.put(cache_key, result)
+            return result
         except Exception as e:
             self.logger.error(f"Error analyzing sentiment: {str(e)}")
-            return {
-                'textblob_score': 0,
-                'vader_scores': {'neg': 0, 'neu': 0, 'pos': 0, 'compound': 0},
-                'spacy_score': 0,
-                'overall_sentiment': 'neutral'
-            }
+            return self._neutral_result()
+
+    def analyze_many(self, descriptions: Iterable[str], batch_size: int = 64, n_process: int = 1) -> List[Dict]:
+        """
+        Analyze the sentiment of many job descriptions in one pass.
+        
+        spaCy tokenizes the texts in batches through nlp.pipe with every pipeline
+        component disabled, since only token sentiment is used. TextBlob and
+        VADER scoring is spread over n_process worker processes.
+        
+        Args:
+            descriptions (Iterable[str]): Job description texts to analyze
+            batch_size (int): Number of texts per spaCy batch and per worker chunk
+            n_process (int): Number of processes for TextBlob/VADER scoring
+            
+        Returns:
+            List[Dict]: One result per description, in input order, shaped like
+                analyze_job_description's output
+        """
+        texts = list(descriptions)
+        results: List[Optional[Dict]] = [None] * len(texts)
+        
+        # Resolve cache hits and collapse duplicate texts before scoring
+        hits: Dict[str, Dict] = {}
+        pending: Dict[str, List[int]] = {}
+        for i, text in enumerate(texts):
+            if not isinstance(text, str):
+                results[i] = self._neutral_result()
+            elif text in hits:
+                results[i] = hits[text]
+            elif text in pending:
+                pending[text].append(i)
+            else:
+                cached = self.cache.get(self._cache_key(text)) if self.cache else None
+                if cached is not None:
+                    hits[text] = results[i] = cached
+                else:
+                    pending[text] = [i]
+        
+        misses = list(pending)
+        scored = self._score_batch(misses, batch_size, n_process) if misses else []
+        new_results = {}
+        for text, result in zip(misses, scored):
+            if result is None:
+                result = self._neutral_result()
+            elif self.cache:
+                new_results[self._cache_key(text)] = result
+            for i in pending[text]:
+                results[i] = result
+        
+        if self.cache and new_results:
+            self.cache.put_many(new_results)
+        
+        return results
+
+    def _score_batch(self, texts: List[str], batch_size: int, n_process: int) -> List[Optional[Dict]]:
+        """Score texts with all three methods, returning None where scoring failed."""
+        get_vader()  # Fail loudly on a missing lexicon rather than scoring everything neutral
+        if n_process > 1 and len(texts) > batch_size:
+            # Forking a process that runs the HTTP client's event loop thread is unsafe;
+            # spawned workers load the models again from the same environment
+            with ProcessPoolExecutor(
+                max_workers=n_process, mp_context=multiprocessing.get_context('spawn')
+            ) as executor:
+                lexical = executor.map(_lexical_scores, texts, chunksize=batch_size)
+                spacy_scores = self._spacy_scores(texts, batch_size)
+                lexical = list(lexical)
+        else:
+            lexical = [_lexical_scores(text) for text in texts]
+            spacy_scores = self._spacy_scores(texts, batch_size)
+        
+        return [
+            self._build_result(scores[0], scores[1], spacy_sentiment) if scores is not None else None
+            for scores, spacy_sentiment in zip(lexical, spacy_scores)
+        ]
+
+    def _cache_key(self, description: str) -> Optional[str]:
+        """Cache key for a description, or None when caching does not apply."""
+        if self.cache is None or not isinstance(description, str):
+            return None
+        return self.cache.key(description, get_model_version())
+
+    def _spacy_scores(self, texts: List[str], batch_size: int) -> List[float]:
+        """Tokenize texts with nlp.pipe and return their average token sentiment."""
+        nlp = get_nlp()
+        with nlp.select_pipes(disable=nlp.pipe_names):
+            return [_spacy_score(doc) for doc in nlp.pipe(texts, batch_size=batch_size)]
+
+    def _build_result(self, textblob_score: float, vader_scores: Dict, spacy_score: float) -> Dict:
+        """Assemble the per-description result dict."""
+        return {
+            'textblob_score': textblob_score,
+            'vader_scores': vader_scores,
+            'spacy_score': spacy_score,
+            'overall_sentiment': self._calculate_overall_sentiment(
+                textblob_score,
+                vader_scores['compound'],
+                spacy_score
+            )
+        }
+
+    def _neutral_result(self) -> Dict:
+        """Result used when a description cannot be analyzed."""
+        return {
+            'textblob_score': 0,
+            'vader_scores': {'neg': 0, 'neu': 0, 'pos': 0, 'compound': 0},
+            'spacy_score': 0,
+            'overall_sentiment': 'neutral'
+        }
 
     def analyze_company_sentiment(self, job_postings: List[Dict]) -> Dict:
         """
@@ -76,13 +265,48 @@ class SentimentAnalyzer:
                 'sentiment_distribution': {'positive': 0, 'neutral': 0, 'negative': 0}
             }
 
+        return self._summarize(self._posting_sentiments(job_postings))
+
+    def analyze_companies(self, job_postings: List[Dict]) -> Dict[str, Dict]:
+        """
+        Analyze sentiment for every company in a collection of job postings at once.
+        
+        Postings are grouped by normalized company name in a single pass and any
+        postings without a sentiment_analysis result are scored in one batch.
+        
+        Args:
+            job_postings (List[Dict]): Job postings from any number of companies
+            
+        Returns:
+            Dict[str, Dict]: Company-level analysis keyed by normalized company name,
+                each with the company's display name under 'company'
+        """
+        from src.utils.helpers import normalize_company
+        
+        groups: Dict[str, List[Dict]] = {}
+        names: Dict[str, str] = {}
+        for posting, sentiment in zip(job_postings, self._posting_sentiments(job_postings)):
+            key = normalize_company(posting.get('company', ''))
+            names.setdefault(key, posting.get('company', ''))
+            groups.setdefault(key, []).append(sentiment)
+        
+        return {
+            key: {'company': names[key], **self._summarize(sentiments)}
+            for key, sentiments in groups.items()
+        }
+
+    def _posting_sentiments(self, job_postings: List[Dict]) -> List[Dict]:
+        """Sentiment for each posting, reusing attached results and batch-scoring the rest."""
+        unscored = [posting for posting in job_postings if not posting.get('sentiment_analysis')]
+        new_sentiments = iter(self.analyze_many([posting.get('description', '') for posting in unscored]))
+        return [posting.get('sentiment_analysis') or next(new_sentiments) for posting in job_postings]
+
+    def _summarize(self, sentiments: List[Dict]) -> Dict:
+        """Aggregate per-posting sentiment results into a company-level summary."""
         total_sentiment = 0
         sentiment_distribution = {'positive': 0, 'neutral': 0, 'negative': 0}
         
-        for posting in job_postings:
-            description = posting.get('description', '')
-            sentiment = self.analyze_job_description(description)
-            
+        for sentiment in sentiments:
             # Update sentiment distribution
             if sentiment['overall_sentiment'] == 'positive':
                 sentiment_distribution['positive'] += 1
@@ -98,11 +322,11 @@ class SentimentAnalyzer:
                 sentiment['spacy_score']
             ) / 3
 
-        average_sentiment = total_sentiment / len(job_postings)
+        average_sentiment = total_sentiment / len(sentiments)
         
         return {
             'average_sentiment': self._get_sentiment_label(average_sentiment),
-            'total_postings': len(job_postings),
+            'total_postings': len(sentiments),
             'sentiment_distribution': sentiment_distribution
         }
 
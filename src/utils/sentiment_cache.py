@@ -0,0 +1,100 @@
+import hashlib
+import json
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+class SentimentCache:
+    """
+    Two-level cache of sentiment results keyed by description text and model version.
+
+    An in-memory LRU sits in front of a SQLite table, so an unchanged description
+    is scored once no matter how many runs or sources it shows up in. Including
+    the model version in the key means upgrading a model never serves stale scores.
+    """
+
+    def __init__(self, path: str = "data/cache/sentiment.sqlite3", memory_size: int = 10000):
+        """
+        Args:
+            path (str): SQLite file for the persistent store
+            memory_size (int): Number of results kept in the in-memory LRU
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.memory_size = memory_size
+        self._memory: 'OrderedDict[str, Dict]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS sentiment (key TEXT PRIMARY KEY, result TEXT NOT NULL)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def key(description: str, model_version: str) -> str:
+        """Hash of the whitespace-normalized description and the model version."""
+        normalized = ' '.join(description.split())
+        return hashlib.sha256(f"{model_version}\0{normalized}".encode('utf-8')).hexdigest()
+
+    def _remember(self, key: str, result: Dict) -> None:
+        self._memory[key] = result
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Return the cached result for key, or None."""
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                return self._memory[key]
+
+            row = self._conn.execute("SELECT result FROM sentiment WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            result = json.loads(row[0])
+            self._remember(key, result)
+            return result
+
+    def put(self, key: str, result: Dict) -> None:
+        """Store a result in both cache levels."""
+        with self._lock:
+            self._remember(key, result)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sentiment (key, result) VALUES (?, ?)",
+                (key, json.dumps(result))
+            )
+            self._conn.commit()
+
+    def put_many(self, results: Dict[str, Dict]) -> None:
+        """Store several results in one transaction."""
+        if not results:
+            return
+        with self._lock:
+            for key, result in results.items():
+                self._remember(key, result)
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO sentiment (key, result) VALUES (?, ?)",
+                [(key, json.dumps(result)) for key, result in results.items()]
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+_default_cache: Optional[SentimentCache] = None
+_default_cache_lock = threading.Lock()
+
+def get_sentiment_cache() -> SentimentCache:
+    """Get the process-wide sentiment cache."""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = SentimentCache()
+        return _default_cache
@@ -0,0 +1,147 @@
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import logging
+from src.utils.matching import CriteriaMatcher
+
+logger = logging.getLogger(__name__)
+
+class Subscriber:
+    """One recipient of job alerts and the rules their alerts are for."""
+
+    __slots__ = ('subscriber_id', 'email', 'keywords', 'locations', 'companies')
+
+    def __init__(self, subscriber_id: str, email: str, keywords: Iterable[str] = (),
+                 locations: Iterable[str] = (), companies: Iterable[str] = ()):
+        """
+        Args:
+            subscriber_id (str): Unique name of the subscriber, e.g. a team
+            email (str): Address alerts are sent to
+            keywords (Iterable[str]): Terms to find in a job's title or description
+            locations (Iterable[str]): Terms to find in a job's location
+            companies (Iterable[str]): Terms to find in a job's company
+        """
+        self.subscriber_id = subscriber_id
+        self.email = email
+        self.keywords = [term for term in keywords if term]
+        self.locations = [term for term in locations if term]
+        self.companies = [term for term in companies if term]
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Subscriber':
+        """Subscriber from a config entry with id, email, keywords, locations and companies keys."""
+        if not data.get('id') or not data.get('email'):
+            raise ValueError(f"Subscriber needs an id and an email: {data!r}")
+        return cls(data['id'], data['email'], data.get('keywords') or [],
+                   data.get('locations') or [], data.get('companies') or [])
+
+    def rules(self) -> Dict[str, List[str]]:
+        """Terms of each kind of rule, keyed like CriteriaMatcher.FIELDS."""
+        return {'keywords': self.keywords, 'locations': self.locations, 'companies': self.companies}
+
+class SubscriptionIndex:
+    """
+    Inverted index routing jobs to every subscriber whose rules they match.
+
+    Each kind of rule maps a lowercased term to the subscribers that use it,
+    and the distinct terms of all subscribers are compiled into a single
+    CriteriaMatcher. Routing a job is one matcher pass over its fields plus a
+    lookup per term found, however many subscribers there are. The matcher
+    is recompiled lazily after subscribers are added or removed.
+    """
+
+    def __init__(self, subscribers: Iterable[Subscriber] = ()):
+        """
+        Args:
+            subscribers (Iterable[Subscriber]): Initial subscribers
+        """
+        self.subscribers: Dict[str, Subscriber] = {}
+        # Kind of rule -> lowercased term -> subscriber ID -> (position in their rules, term as given)
+        self._postings: Dict[str, Dict[str, Dict[str, Tuple[int, str]]]] = {
+            kind: {} for kind in CriteriaMatcher.FIELDS
+        }
+        self._matcher: Optional[CriteriaMatcher] = None
+        self._lock = threading.Lock()
+        for subscriber in subscribers:
+            self.add(subscriber)
+
+    def __len__(self) -> int:
+        return len(self.subscribers)
+
+    def __contains__(self, subscriber_id: str) -> bool:
+        return subscriber_id in self.subscribers
+
+    def add(self, subscriber: Subscriber) -> None:
+        """Add a subscriber, replacing any subscriber with the same ID."""
+        with self._lock:
+            self._remove(subscriber.subscriber_id)
+            self.subscribers[subscriber.subscriber_id] = subscriber
+            for kind, terms in subscriber.rules().items():
+                postings = self._postings[kind]
+                for position, term in enumerate(terms):
+                    postings.setdefault(term.lower(), {}).setdefault(subscriber.subscriber_id, (position, term))
+            self._matcher = None
+
+    def remove(self, subscriber_id: str) -> Optional[Subscriber]:
+        """Remove a subscriber, returning it, or None if there was none with that ID."""
+        with self._lock:
+            return self._remove(subscriber_id)
+
+    def _remove(self, subscriber_id: str) -> Optional[Subscriber]:
+        subscriber = self.subscribers.pop(subscriber_id, None)
+        if subscriber is None:
+            return None
+        for kind, terms in subscriber.rules().items():
+            postings = self._postings[kind]
+            for term in terms:
+                subscribed = postings.get(term.lower())
+                if subscribed is not None:
+                    subscribed.pop(subscriber_id, None)
+                    if not subscribed:
+                        del postings[term.lower()]
+        self._matcher = None
+        return subscriber
+
+    def _compiled(self) -> CriteriaMatcher:
+        """Matcher over the distinct terms of all subscribers, compiled on first use; call with the lock held."""
+        if self._matcher is None:
+            self._matcher = CriteriaMatcher(**{kind: list(postings) for kind, postings in self._postings.items()})
+        return self._matcher
+
+    def route(self, job: Dict) -> Dict[str, Dict[str, List[str]]]:
+        """
+        Find every subscriber a job should be sent to.
+
+        Args:
+            job (Dict): Job with title, description, location and company fields
+
+        Returns:
+            Dict[str, Dict[str, List[str]]]: Subscriber ID -> kind of rule -> their matching
+                terms as configured, for each subscriber with a match
+        """
+        routes: Dict[str, Dict[str, List[Tuple[int, str]]]] = {}
+        with self._lock:
+            for kind, terms in self._compiled().find(job).items():
+                postings = self._postings[kind]
+                for term in terms:
+                    for subscriber_id, rule in postings[term].items():
+                        routes.setdefault(subscriber_id, {}).setdefault(kind, []).append(rule)
+        return {
+            subscriber_id: {kind: [term for _, term in sorted(rules)] for kind, rules in matched.items()}
+            for subscriber_id, matched in routes.items()
+        }
+
+    def route_many(self, jobs: Iterable[Dict]) -> Dict[str, List[Tuple[Dict, Dict[str, List[str]]]]]:
+        """
+        Group jobs by the subscribers they should be sent to.
+
+        Args:
+            jobs (Iterable[Dict]): Jobs to route
+
+        Returns:
+            Dict[str, List[Tuple[Dict, Dict[str, List[str]]]]]: Subscriber ID -> (job, matching rules) in job order
+        """
+        digests: Dict[str, List[Tuple[Dict, Dict[str, List[str]]]]] = {}
+        for job in jobs:
+            for subscriber_id, rules in self.route(job).items():
+                digests.setdefault(subscriber_id, []).append((job, rules))
+        return digests
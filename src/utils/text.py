@@ -0,0 +1,71 @@
+import re
+from typing import Any, Dict, Iterable, List, Tuple
+import numpy as np
+import pandas as pd
+
+# clean_text collapses whitespace runs to one space, then deletes every
+# character that is not a word character, whitespace, '.', ',' or '$'
+_WHITESPACE = re.compile(r'\s+')
+_SPECIAL_CHARS = re.compile(r'[^\w\s.,$]')
+
+# Text without anything to collapse, delete or strip is returned as is
+_NEEDS_CLEANING = re.compile(r'[^\w.,$ ]|  |^ | \Z')
+
+# The same character filter as a str.translate table, for ASCII text
+_ASCII_SPECIAL_CHARS = {
+    code: None for code in range(128) if _SPECIAL_CHARS.match(chr(code))
+}
+
+def clean_text(text: str) -> str:
+    """Clean and normalize text data."""
+    if not isinstance(text, str):
+        return str(text)
+    if _NEEDS_CLEANING.search(text) is None:
+        return text
+
+    if text.isascii():
+        # str.split splits on exactly the characters \s matches
+        return ' '.join(text.split()).translate(_ASCII_SPECIAL_CHARS).strip()
+    return _SPECIAL_CHARS.sub('', _WHITESPACE.sub(' ', text)).strip()
+
+def clean_texts(texts: Iterable[Any]) -> List[str]:
+    """
+    Clean many values at once, cleaning each distinct value only once.
+
+    Scraped fields such as locations, companies and salaries repeat heavily,
+    so a batch usually holds far fewer distinct values than items.
+
+    Args:
+        texts (Iterable): Values to clean, as clean_text accepts them
+
+    Returns:
+        List[str]: Cleaned values in input order
+    """
+    # Keyed by type too: 1, 1.0 and True are equal dict keys but clean differently
+    cleaned: Dict[Tuple[type, Any], str] = {}
+    results = []
+    for text in texts:
+        key = (type(text), text)
+        try:
+            results.append(cleaned[key])
+        except KeyError:
+            cleaned[key] = clean_text(text)
+            results.append(cleaned[key])
+    return results
+
+def clean_series(series: pd.Series) -> pd.Series:
+    """
+    Clean a pandas Series of text, cleaning each distinct value only once.
+
+    Unlike clean_text, missing values stay missing instead of becoming 'nan'.
+
+    Args:
+        series (pd.Series): Text column, e.g. a DataFrame's 'company'
+
+    Returns:
+        pd.Series: Cleaned values with the original index and name
+    """
+    codes, uniques = pd.factorize(series)
+    cleaned = np.array(clean_texts(uniques) + [np.nan], dtype=object)
+    # Missing values have code -1, which picks the trailing NaN
+    return pd.Series(cleaned[codes], index=series.index, name=series.name)
@@ -0,0 +1,163 @@
+import re
+from functools import lru_cache
+from typing import Dict, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+_URL_PATTERN = re.compile(
+    r'^https?://'  # http:// or https://
+    r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain
+    r'localhost|'  # localhost
+    r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # IP
+    r'(?::\d+)?'  # optional port
+    r'(?:/?|[/?]\S+)$', re.IGNORECASE)
+
+# Query parameters that only track where a click came from, on any site
+TRACKING_PARAMS = {
+    'fbclid', 'gclid', 'msclkid', 'mc_cid', 'mc_eid',
+    'trk', 'trkinfo', 'trackingid', 'refid', 'lipi',
+}
+TRACKING_PREFIXES = ('utm_',)
+
+# Parameters that only track the click on a platform's job-view links. On
+# other pages the same names can select content, e.g. a search's pageNum,
+# and canonical URLs also key the response cache
+JOB_VIEW_TRACKING_PARAMS = {
+    'linkedin': {'position', 'pagenum'},
+    'indeed': {'from', 'vjs', 'tk', 'advn', 'adid', 'sjdu', 'xkcb', 'xpse', 'xfps'},
+}
+_INDEED_JOB_VIEW_PATHS = ('/viewjob', '/rc/clk', '/pagead/clk')
+
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+_LINKEDIN_JOB_PATH = re.compile(r'/jobs/view/(?:[^/]*-)?(\d+)/?$')
+_INDEED_JOB_KEY = re.compile(r'[0-9a-f]{8,}', re.IGNORECASE)
+
+def validate_url(url: str) -> bool:
+    """Validate URL format."""
+    return bool(_URL_PATTERN.match(url))
+
+def _is_tracking_param(name: str) -> bool:
+    name = name.lower()
+    return name in TRACKING_PARAMS or name.startswith(TRACKING_PREFIXES)
+
+def _is_host(host: str, domain: str) -> bool:
+    return host == domain or host.endswith('.' + domain)
+
+def _is_indeed_host(host: str) -> bool:
+    # Indeed runs country sites such as ca.indeed.com and indeed.co.uk
+    return '.indeed.' in f".{host}"
+
+def _job_view_tracking_params(host: str, path: str) -> frozenset:
+    """Platform tracking parameters to drop from a URL, if it is a job-view link."""
+    if _is_indeed_host(host) and path.rstrip('/').lower() in _INDEED_JOB_VIEW_PATHS:
+        return frozenset(JOB_VIEW_TRACKING_PARAMS['indeed'])
+    if _is_host(host, 'linkedin.com') and (path + '/').startswith('/jobs/view/'):
+        return frozenset(JOB_VIEW_TRACKING_PARAMS['linkedin'])
+    return frozenset()
+
+def _normalize_netloc(scheme: str, host: str, port: Optional[int]) -> str:
+    """Lowercased host without a trailing dot, credentials or the scheme's default port."""
+    host = host.lower().rstrip('.')
+    if port is not None and port != DEFAULT_PORTS.get(scheme):
+        return f"{host}:{port}"
+    return host
+
+@lru_cache(maxsize=65536)
+def canonicalize_url(url: str) -> str:
+    """
+    Canonical form of a URL, so that variants of one page compare equal.
+
+    The scheme and host are lowercased, default ports, fragments and tracking
+    parameters are dropped, and the remaining query parameters are sorted.
+    Platform-specific tracking parameters are only dropped from job-view
+    links, so search pages keep e.g. their page number.
+    Indeed and LinkedIn job links are reduced to their job ID alone, so
+    e.g. an Indeed /rc/clk?jk=... redirect and /viewjob?jk=... agree.
+
+    Args:
+        url (str): Absolute URL
+
+    Returns:
+        str: Canonical URL, or url unchanged if it cannot be parsed
+    """
+    try:
+        parts = urlsplit(url.strip())
+        port = parts.port
+    except ValueError:
+        return url
+    if not parts.scheme or not parts.hostname:
+        return url
+
+    scheme = parts.scheme.lower()
+    host = parts.hostname.lower().rstrip('.')
+    netloc = _normalize_netloc(scheme, host, port)
+
+    platform_id = _platform_job_id(host, parts.path, parts.query)
+    if platform_id is not None:
+        platform, value = platform_id
+        if platform == 'indeed':
+            return urlunsplit((scheme, netloc, '/viewjob', f"jk={value}", ''))
+        return urlunsplit((scheme, netloc, f"/jobs/view/{value}", '', ''))
+
+    path = parts.path or '/'
+    if len(path) > 1:
+        path = path.rstrip('/') or '/'
+    job_view_params = _job_view_tracking_params(host, path)
+    query = urlencode(sorted(
+        (name, value) for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not _is_tracking_param(name) and name.lower() not in job_view_params
+    ))
+    return urlunsplit((scheme, netloc, path, query, ''))
+
+def _platform_job_id(host: str, path: str, query: str):
+    """(platform, ID) for Indeed and LinkedIn job links, or None."""
+    # Only jk identifies a job; search pages carry vjk for the job in their preview
+    if _is_indeed_host(host):
+        value = dict(parse_qsl(query)).get('jk')
+        if value and _INDEED_JOB_KEY.fullmatch(value):
+            return 'indeed', value.lower()
+    elif _is_host(host, 'linkedin.com'):
+        match = _LINKEDIN_JOB_PATH.search(path)
+        if match:
+            return 'linkedin', match.group(1)
+    return None
+
+def job_id(url: str) -> Optional[str]:
+    """
+    Stable platform job ID for a job URL, e.g. 'indeed:4a1b2c3d4e5f6a7b' or 'linkedin:3912345678'.
+
+    Args:
+        url (str): Job posting URL in any of the platform's link formats
+
+    Returns:
+        Optional[str]: The ID, or None for URLs of other sites
+    """
+    if not url:
+        return None
+    try:
+        parts = urlsplit(url.strip())
+    except ValueError:
+        return None
+    if not parts.hostname:
+        return None
+
+    platform_id = _platform_job_id(parts.hostname.lower().rstrip('.'), parts.path, parts.query)
+    return f"{platform_id[0]}:{platform_id[1]}" if platform_id else None
+
+def job_key(job: Dict) -> Optional[str]:
+    """
+    Identifier used to recognize a posting across runs, caches and indexes.
+
+    Args:
+        job (Dict): Scraped job
+
+    Returns:
+        Optional[str]: The job's platform ID when known, else its canonical URL,
+            or None if it has no URL
+    """
+    if job.get('job_id'):
+        return job['job_id']
+    url = job.get('url')
+    if not url:
+        return None
+    return job_id(url) or canonicalize_url(url)
@@ -1,8 +1,8 @@
-<<<<<<< HEAD
 import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
-from typing import List, Dict
+from wordcloud import WordCloud
+from typing import Any, Callable, List, Dict, Optional, Union
 import logging
 from pathlib import Path
 from datetime import datetime
@@ -14,61 +14,155 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Jobs as scraped, or a frame as returned by read_jobs_dataset
+Jobs = Union[List[Dict], pd.DataFrame]
+
+# Job fields the plots read; the frame keeps only these
+_PLOT_COLUMNS = ('company', 'location', 'job_type', 'salary', 'description', 'posted_date', 'sentiment_analysis')
+
+# Text columns with few distinct values, stored as categoricals
+_CATEGORY_COLUMNS = ('company', 'location', 'job_type')
+
+# Flattened sentiment columns, as in read_jobs_dataset frames, with the plot labels of their models
+_SCORE_COLUMNS = {'textblob_score': 'TextBlob', 'vader_compound': 'VADER', 'spacy_score': 'spaCy'}
+_SENTIMENT_COLUMNS = (*_SCORE_COLUMNS, 'overall_sentiment')
+
 class JobVisualizer:
+    """
+    Plots of scraped jobs.
+
+    The jobs passed to the plot methods are converted once into a frame of
+    the fields the plots read, with categorical company, location and job
+    type columns. Every count or derived column a plot needs, such as the
+    flattened sentiment scores, is computed from that frame on first use and
+    memoized. Plotting the same jobs several times, as
+    generate_all_visualizations does, therefore shares one frame and one set
+    of aggregates. Jobs are recognized by the list (or frame) object and its
+    length; call clear_cache() after changing jobs in place.
+    """
+
     def __init__(self, output_dir: str = "data/visualizations"):
         self.output_dir = Path(output_dir)
-        self.output_dir.mkdir(exist_ok=True)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self._source: Optional[Jobs] = None
+        self._source_length = 0
+        self._frame: Optional[pd.DataFrame] = None
+        self._aggregates: Dict[str, Any] = {}
+    
+    def clear_cache(self) -> None:
+        """Forget the frame and aggregates of the last jobs plotted."""
+        self._source = None
+        self._frame = None
+        self._aggregates = {}
+    
+    def frame(self, jobs: Jobs) -> pd.DataFrame:
+        """
+        Frame of jobs, built once per distinct jobs object.
+        
+        Args:
+            jobs (List[Dict] or pd.DataFrame): Jobs as scraped, or a frame from read_jobs_dataset
+            
+        Returns:
+            pd.DataFrame: One row per job with the plotted fields, missing ones as
+                nulls, and categorical company, location and job_type
+        """
+        if jobs is not self._source or len(jobs) != self._source_length:
+            frame = jobs if isinstance(jobs, pd.DataFrame) else pd.DataFrame(jobs)
+            columns = list(_PLOT_COLUMNS) + [column for column in _SENTIMENT_COLUMNS if column in frame.columns]
+            # reindex copies, so a caller's frame is never modified
+            frame = frame.reindex(columns=columns)
+            for column in _CATEGORY_COLUMNS:
+                # Categories in order of first appearance, so tied counts rank as they did for plain text
+                values = frame[column]
+                frame[column] = values.astype(pd.CategoricalDtype(values.dropna().unique()))
+            
+            self._source = jobs
+            self._source_length = len(jobs)
+            self._frame = frame
+            self._aggregates = {}
+        return self._frame
+    
+    def _aggregate(self, jobs: Jobs, name: str, compute: Callable[[pd.DataFrame], Any]) -> Any:
+        """compute(frame) for the jobs' frame, memoized under name until the jobs change."""
+        frame = self.frame(jobs)
+        if name not in self._aggregates:
+            self._aggregates[name] = compute(frame)
+        return self._aggregates[name]
+    
+    def _value_counts(self, jobs: Jobs, column: str) -> pd.Series:
+        """Counts of each value of a column, most frequent first, without unused categories."""
+        def compute(frame: pd.DataFrame) -> pd.Series:
+            values = self._sentiment(jobs)[column] if column in _SENTIMENT_COLUMNS else frame[column]
+            counts = values.value_counts()
+            return counts[counts > 0]
+        return self._aggregate(jobs, f'{column}_counts', compute)
+    
+    def _sentiment(self, jobs: Jobs) -> pd.DataFrame:
+        """Sentiment scores and categorical overall sentiment of each job, null where not analyzed."""
+        def compute(frame: pd.DataFrame) -> pd.DataFrame:
+            if set(_SENTIMENT_COLUMNS) <= set(frame.columns):
+                sentiment = frame[list(_SENTIMENT_COLUMNS)].copy()
+            else:
+                analyses = [analysis if isinstance(analysis, dict) else {} for analysis in frame['sentiment_analysis']]
+                sentiment = pd.DataFrame({
+                    'textblob_score': [analysis.get('textblob_score') for analysis in analyses],
+                    'vader_compound': [(analysis.get('vader_scores') or {}).get('compound') for analysis in analyses],
+                    'spacy_score': [analysis.get('spacy_score') for analysis in analyses],
+                    'overall_sentiment': [analysis.get('overall_sentiment') for analysis in analyses],
+                }, index=frame.index)
+            sentiment[list(_SCORE_COLUMNS)] = sentiment[list(_SCORE_COLUMNS)].astype(float)
+            sentiment['overall_sentiment'] = sentiment['overall_sentiment'].astype('category')
+            return sentiment
+        return self._aggregate(jobs, 'sentiment', compute)
     
     def _save_plot(self, fig, filename: str, save_path: str = None) -> None:
-        """Save a matplotlib figure to a file."""
-        filepath = self.output_dir / f"{filename}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
+        """Save a matplotlib figure to save_path, or to a timestamped file in the output directory."""
+        if save_path:
+            filepath = Path(save_path)
+        else:
+            filepath = self.output_dir / f"{filename}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
         fig.savefig(filepath, bbox_inches='tight', dpi=300)
-        plt.close(fig)
+        plt.close('all')
         logger.info(f"Saved visualization to {filepath}")
-        if save_path:
-            save_path.append(filepath)
     
-    def plot_jobs_by_company(self, jobs: List[Dict]) -> None:
+    def plot_jobs_by_company(self, jobs: Jobs) -> None:
         """Create a bar plot of jobs by company."""
-        df = pd.DataFrame(jobs)
-        company_counts = df['company'].value_counts().head(10)
+        company_counts = self._value_counts(jobs, 'company').head(10)
         
         plt.figure(figsize=(12, 6))
-        sns.barplot(x=company_counts.values, y=company_counts.index)
+        sns.barplot(x=company_counts.values, y=company_counts.index.astype(str))
         plt.title('Top 10 Companies by Number of Job Postings')
         plt.xlabel('Number of Jobs')
         plt.ylabel('Company')
         
         self._save_plot(plt.gcf(), 'jobs_by_company')
     
-    def plot_jobs_by_location(self, jobs: List[Dict]) -> None:
+    def plot_jobs_by_location(self, jobs: Jobs) -> None:
         """Create a bar plot of jobs by location."""
-        df = pd.DataFrame(jobs)
-        location_counts = df['location'].value_counts().head(10)
+        location_counts = self._value_counts(jobs, 'location').head(10)
         
         plt.figure(figsize=(12, 6))
-        sns.barplot(x=location_counts.values, y=location_counts.index)
+        sns.barplot(x=location_counts.values, y=location_counts.index.astype(str))
         plt.title('Top 10 Locations by Number of Job Postings')
         plt.xlabel('Number of Jobs')
         plt.ylabel('Location')
         
         self._save_plot(plt.gcf(), 'jobs_by_location')
     
-    def plot_job_types(self, jobs: List[Dict]) -> None:
+    def plot_job_types(self, jobs: Jobs) -> None:
         """Create a pie chart of job types."""
-        df = pd.DataFrame(jobs)
-        job_types = df['job_type'].value_counts()
+        job_types = self._value_counts(jobs, 'job_type')
         
         plt.figure(figsize=(10, 10))
-        plt.pie(job_types.values, labels=job_types.index, autopct='%1.1f%%')
+        plt.pie(job_types.values, labels=job_types.index.astype(str), autopct='%1.1f%%')
         plt.title('Distribution of Job Types')
         
         self._save_plot(plt.gcf(), 'job_types')
     
-    def create_word_cloud(self, jobs: List[Dict]) -> None:
+    def create_word_cloud(self, jobs: Jobs) -> None:
         """Create a word cloud from job descriptions."""
         # Combine all job descriptions
-        text = ' '.join(job.get('description', '') for job in jobs)
+        text = self._aggregate(jobs, 'description_text', lambda frame: ' '.join(frame['description'].dropna()))
         
         # Generate word cloud
         wordcloud = WordCloud(
@@ -86,21 +180,14 @@ class JobVisualizer:
         
         self._save_plot(plt.gcf(), 'word_cloud')
     
-    def plot_salary_ranges(self, jobs: List[Dict]) -> None:
+    def plot_salary_ranges(self, jobs: Jobs) -> None:
         """Create a histogram of salary ranges."""
-        # Extract salary information (this is a simplified example)
-        salaries = []
-        for job in jobs:
-            salary = job.get('salary', '')
-            if salary:
-                # Extract numeric value (this is a simplified example)
-                try:
-                    salary_value = float(''.join(filter(str.isdigit, salary)))
-                    salaries.append(salary_value)
-                except ValueError:
-                    continue
-        
-        if salaries:
+        # Numeric value of each salary's digits (this is a simplified example)
+        salaries = self._aggregate(jobs, 'salary_values', lambda frame: pd.to_numeric(
+            frame['salary'].astype('string').str.replace(r'\D', '', regex=True), errors='coerce'
+        ).dropna())
+        
+        if not salaries.empty:
             plt.figure(figsize=(12, 6))
             sns.histplot(salaries, bins=20)
             plt.title('Distribution of Salary Ranges')
@@ -109,8 +196,12 @@ class JobVisualizer:
             
             self._save_plot(plt.gcf(), 'salary_ranges')
     
-    def generate_all_visualizations(self, jobs: List[Dict]) -> None:
-        """Generate all visualizations for the job data."""
+    def plot_salary_distribution(self, jobs: Jobs) -> None:
+        """Create a histogram of salary ranges."""
+        self.plot_salary_ranges(jobs)
+    
+    def generate_all_visualizations(self, jobs: Jobs) -> None:
+        """Generate all visualizations for the job data from one shared frame."""
         logger.info("Generating visualizations...")
         
         try:
@@ -119,24 +210,39 @@ class JobVisualizer:
             self.plot_job_types(jobs)
             self.create_word_cloud(jobs)
             self.plot_salary_ranges(jobs)
+            if self._sentiment(jobs)[list(_SCORE_COLUMNS)].notna().any().any():
+                self.plot_sentiment_trends(jobs)
             
             logger.info("All visualizations generated successfully")
         except Exception as e:
             logger.error(f"Error generating visualizations: {str(e)}")
 
-    def plot_sentiment_distribution(self, job_postings: List[Dict], save_path: str = None) -> None:
+    def generate_from_store(self, store, **filters) -> None:
+        """
+        Generate all visualizations for jobs kept in a JobStore.
+        
+        Args:
+            store (JobStore): Job store to read from
+            **filters: Passed to JobStore.query, e.g. source='Indeed'
+        """
+        jobs = store.query(**filters)
+        if not jobs:
+            logger.warning("No stored jobs match the given filters")
+            return
+        self.generate_all_visualizations(jobs)
+
+    def plot_sentiment_distribution(self, job_postings: Jobs, save_path: str = None) -> None:
         """
         Plot the distribution of sentiment scores across job postings.
         
         Args:
-            job_postings (List[Dict]): List of job postings with sentiment analysis
+            job_postings (List[Dict] or pd.DataFrame): Job postings with sentiment analysis
             save_path (str, optional): Path to save the plot
         """
-        sentiments = [job['sentiment_analysis']['overall_sentiment'] for job in job_postings]
-        sentiment_counts = pd.Series(sentiments).value_counts()
+        sentiment_counts = self._value_counts(job_postings, 'overall_sentiment')
         
         plt.figure(figsize=(10, 6))
-        sns.barplot(x=sentiment_counts.index, y=sentiment_counts.values)
+        sns.barplot(x=sentiment_counts.index.astype(str), y=sentiment_counts.values)
         plt.title('Distribution of Sentiment in Job Descriptions')
         plt.xlabel('Sentiment')
         plt.ylabel('Number of Job Postings')
@@ -163,27 +269,26 @@ class JobVisualizer:
         
         self._save_plot(plt, 'company_sentiment', save_path)
 
-    def plot_sentiment_wordcloud(self, job_postings: List[Dict], sentiment: str = 'positive', save_path: str = None) -> None:
+    def plot_sentiment_wordcloud(self, job_postings: Jobs, sentiment: str = 'positive',
+                                 save_path: str = None) -> None:
         """
         Generate a word cloud for job descriptions with a specific sentiment.
         
         Args:
-            job_postings (List[Dict]): List of job postings with sentiment analysis
+            job_postings (List[Dict] or pd.DataFrame): Job postings with sentiment analysis
             sentiment (str): Sentiment to filter ('positive', 'negative', or 'neutral')
             save_path (str, optional): Path to save the plot
         """
         # Filter job descriptions by sentiment
-        filtered_descriptions = [
-            job['description'] for job in job_postings 
-            if job['sentiment_analysis']['overall_sentiment'] == sentiment
-        ]
+        text = self._aggregate(job_postings, f'description_text_{sentiment}', lambda frame: ' '.join(
+            frame.loc[self._sentiment(job_postings)['overall_sentiment'] == sentiment, 'description'].dropna()
+        ))
         
-        if not filtered_descriptions:
-            self.logger.warning(f"No job descriptions found with {sentiment} sentiment")
+        if not text:
+            logger.warning(f"No job descriptions found with {sentiment} sentiment")
             return
         
         # Generate word cloud
-        text = ' '.join(filtered_descriptions)
         wordcloud = WordCloud(width=800, height=400, background_color='white').generate(text)
         
         plt.figure(figsize=(10, 6))
@@ -193,71 +298,48 @@ class JobVisualizer:
         
         self._save_plot(plt, f'wordcloud_{sentiment}', save_path)
 
-    def plot_sentiment_scores(self, job_postings: List[Dict], save_path: str = None) -> None:
+    def plot_sentiment_scores(self, job_postings: Jobs, save_path: str = None) -> None:
         """
         Plot the distribution of sentiment scores across all job postings.
         
         Args:
-            job_postings (List[Dict]): List of job postings with sentiment analysis
+            job_postings (List[Dict] or pd.DataFrame): Job postings with sentiment analysis
             save_path (str, optional): Path to save the plot
         """
-        # Extract sentiment scores
-        textblob_scores = [job['sentiment_analysis']['textblob_score'] for job in job_postings]
-        vader_scores = [job['sentiment_analysis']['vader_scores']['compound'] for job in job_postings]
-        spacy_scores = [job['sentiment_analysis']['spacy_score'] for job in job_postings]
+        scores = self._sentiment(job_postings)
         
-        # Create subplots
+        # One histogram per model
         fig, axes = plt.subplots(1, 3, figsize=(15, 5))
-        
-        # Plot TextBlob scores
-        sns.histplot(textblob_scores, ax=axes[0], bins=20)
-        axes[0].set_title('TextBlob Sentiment Scores')
-        axes[0].set_xlabel('Score')
-        axes[0].set_ylabel('Count')
-        
-        # Plot VADER scores
-        sns.histplot(vader_scores, ax=axes[1], bins=20)
-        axes[1].set_title('VADER Sentiment Scores')
-        axes[1].set_xlabel('Score')
-        axes[1].set_ylabel('Count')
-        
-        # Plot spaCy scores
-        sns.histplot(spacy_scores, ax=axes[2], bins=20)
-        axes[2].set_title('spaCy Sentiment Scores')
-        axes[2].set_xlabel('Score')
-        axes[2].set_ylabel('Count')
+        for ax, (column, model) in zip(axes, _SCORE_COLUMNS.items()):
+            sns.histplot(scores[column].dropna(), ax=ax, bins=20)
+            ax.set_title(f'{model} Sentiment Scores')
+            ax.set_xlabel('Score')
+            ax.set_ylabel('Count')
         
         plt.tight_layout()
         self._save_plot(plt, 'sentiment_scores', save_path)
 
-    def plot_sentiment_trends(self, job_postings: List[Dict], save_path: str = None) -> None:
+    def plot_sentiment_trends(self, job_postings: Jobs, save_path: str = None) -> None:
         """
         Plot sentiment trends over time.
         
         Args:
-            job_postings (List[Dict]): List of job postings with sentiment analysis
+            job_postings (List[Dict] or pd.DataFrame): Job postings with sentiment analysis
             save_path (str, optional): Path to save the plot
         """
-        # Convert to DataFrame for easier manipulation
-        df = pd.DataFrame(job_postings)
+        def rolling_scores(frame: pd.DataFrame) -> pd.DataFrame:
+            window = 7  # 7-day rolling average
+            scores = self._sentiment(job_postings)[list(_SCORE_COLUMNS)]
+            return scores.rolling(window=window).mean().assign(
+                date=pd.to_datetime(frame['posted_date'], errors='coerce')
+            )
         
-        # Extract dates and scores
-        df['date'] = pd.to_datetime(df['posted_date'])
-        df['textblob_score'] = df['sentiment_analysis'].apply(lambda x: x['textblob_score'])
-        df['vader_score'] = df['sentiment_analysis'].apply(lambda x: x['vader_scores']['compound'])
-        df['spacy_score'] = df['sentiment_analysis'].apply(lambda x: x['spacy_score'])
-        
-        # Calculate rolling averages
-        window = 7  # 7-day rolling average
-        df['textblob_rolling'] = df['textblob_score'].rolling(window=window).mean()
-        df['vader_rolling'] = df['vader_score'].rolling(window=window).mean()
-        df['spacy_rolling'] = df['spacy_score'].rolling(window=window).mean()
+        trends = self._aggregate(job_postings, 'sentiment_trends', rolling_scores)
         
         # Plot trends
         plt.figure(figsize=(12, 6))
-        plt.plot(df['date'], df['textblob_rolling'], label='TextBlob')
-        plt.plot(df['date'], df['vader_rolling'], label='VADER')
-        plt.plot(df['date'], df['spacy_rolling'], label='spaCy')
+        for column, model in _SCORE_COLUMNS.items():
+            plt.plot(trends['date'], trends[column], label=model)
         
         plt.title('Sentiment Score Trends Over Time')
         plt.xlabel('Date')
@@ -292,89 +374,4 @@ if __name__ == "__main__":
     ]
     
     # Generate visualizations
-    visualizer.generate_all_visualizations(jobs) 
-=======
-import logging
-import os
-from typing import List, Dict
-import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
-from wordcloud import WordCloud
-
-logger = logging.getLogger(__name__)
-
-class JobVisualizer:
-    """Class for generating visualizations from job data."""
-    
-    def __init__(self, jobs: List[Dict]):
-        """Initialize with job data."""
-        self.jobs = jobs
-        self.df = pd.DataFrame(jobs)
-        self.output_dir = 'data/visualizations'
-        os.makedirs(self.output_dir, exist_ok=True)
-    
-    def _save_plot(self, filename: str) -> str:
-        """Save the current plot and return the filepath."""
-        filepath = os.path.join(self.output_dir, filename)
-        plt.savefig(filepath)
-        plt.close()
-        return filepath
-    
-    def plot_jobs_by_company(self) -> str:
-        """Create a bar plot of jobs by company."""
-        plt.figure(figsize=(12, 6))
-        company_counts = self.df['company'].value_counts().head(10)
-        sns.barplot(x=company_counts.values, y=company_counts.index)
-        plt.title('Top 10 Companies by Number of Job Listings')
-        plt.xlabel('Number of Jobs')
-        plt.ylabel('Company')
-        filepath = self._save_plot('jobs_by_company.png')
-        logger.info(f"Saved company distribution plot to {filepath}")
-        return filepath
-    
-    def plot_jobs_by_location(self) -> str:
-        """Create a bar plot of jobs by location."""
-        plt.figure(figsize=(12, 6))
-        location_counts = self.df['location'].value_counts().head(10)
-        sns.barplot(x=location_counts.values, y=location_counts.index)
-        plt.title('Top 10 Locations by Number of Job Listings')
-        plt.xlabel('Number of Jobs')
-        plt.ylabel('Location')
-        filepath = self._save_plot('jobs_by_location.png')
-        logger.info(f"Saved location distribution plot to {filepath}")
-        return filepath
-    
-    def plot_job_types(self) -> str:
-        """Create a pie chart of job types."""
-        plt.figure(figsize=(10, 10))
-        job_types = self.df['job_type'].value_counts()
-        plt.pie(job_types.values, labels=job_types.index, autopct='%1.1f%%')
-        plt.title('Distribution of Job Types')
-        filepath = self._save_plot('job_types.png')
-        logger.info(f"Saved job types plot to {filepath}")
-        return filepath
-    
-    def plot_salary_distribution(self) -> str:
-        """Create a histogram of salary ranges."""
-        plt.figure(figsize=(12, 6))
-        sns.histplot(data=self.df, x='salary', bins=20)
-        plt.title('Salary Distribution')
-        plt.xlabel('Salary Range')
-        plt.ylabel('Number of Jobs')
-        filepath = self._save_plot('salary_distribution.png')
-        logger.info(f"Saved salary distribution plot to {filepath}")
-        return filepath
-    
-    def create_word_cloud(self) -> str:
-        """Create a word cloud from job descriptions."""
-        plt.figure(figsize=(12, 8))
-        text = ' '.join(self.df['description'].dropna())
-        wordcloud = WordCloud(width=800, height=400, background_color='white').generate(text)
-        plt.imshow(wordcloud, interpolation='bilinear')
-        plt.axis('off')
-        plt.title('Word Cloud of Job Descriptions')
-        filepath = self._save_plot('job_descriptions_wordcloud.png')
-        logger.info(f"Saved word cloud to {filepath}")
-        return filepath 
->>>>>>> 8ea1b89381d322c3402bc9fb04a78c0131bbf2e5
+    visualizer.generate_all_visualizations(jobs)
@@ -0,0 +1,82 @@
+import pytest
+from src.utils.dedup import MinHashDeduplicator, job_city, job_text
+
+@pytest.fixture
+def posting():
+    """A job posting with a realistic description."""
+    return {
+        'title': 'SOFTWARE DEVELOPER JUNIOR 0415202566741',
+        'company': 'Tennessee Department of Transportation',
+        'description': (
+            'The Tennessee Department of Transportation is looking for a junior software developer '
+            'to build and maintain internal applications. You will work with a small team on Python '
+            'and SQL services, write tests, and support the rollout of new tools across the state.'
+        ),
+        'url': 'https://www.linkedin.com/jobs/view/1',
+        'source': 'LinkedIn'
+    }
+
+def test_job_text_ignores_ids_case_and_punctuation(posting):
+    """Test that requisition numbers, case and punctuation do not affect the compared text."""
+    repost = {**posting, 'title': 'Software Developer, Junior (0415202599999)'}
+
+    assert job_text(repost) == job_text(posting)
+
+def test_signature_is_reproducible(posting):
+    """Test that equal seeds give equal signatures across instances."""
+    text = job_text(posting)
+
+    assert (MinHashDeduplicator().signature(text) == MinHashDeduplicator().signature(text)).all()
+
+def test_repost_is_detected_as_duplicate(posting):
+    """Test that a repost with a new ID and a lightly edited description is a duplicate."""
+    deduplicator = MinHashDeduplicator()
+    assert deduplicator.add(posting) is None
+
+    repost = {
+        **posting,
+        'title': 'SOFTWARE DEVELOPER JUNIOR 0501202512345',
+        'description': posting['description'].replace('small team', 'small, friendly team'),
+        'url': 'https://www.indeed.com/viewjob?jk=2',
+        'source': 'Indeed'
+    }
+
+    assert deduplicator.find_duplicate(repost) == 'linkedin:1'
+    assert deduplicator.add(repost) == 'linkedin:1'
+    assert len(deduplicator) == 1
+
+def test_filter_keeps_distinct_postings_in_order(posting):
+    """Test that unrelated postings pass the filter and exact repeats do not."""
+    other = {
+        'title': 'Stadium Operations Assistant',
+        'company': 'Tennessee Titans',
+        'description': 'Help run game day operations, greet guests and keep the stadium running smoothly.',
+        'url': 'https://www.linkedin.com/jobs/view/3'
+    }
+
+    unique = MinHashDeduplicator().filter([posting, other, dict(posting)])
+
+    assert [job['url'] for job in unique] == [posting['url'], other['url']]
+
+def test_same_role_in_different_cities_is_kept():
+    """Test that one title at one company is kept once per city, however similar the city names."""
+    places = [('Acme Inc', 'Berlin'), ('Acme', 'New York, NY'), ('Acme', 'Bern'), ('Acme LLC', 'Berlin, Germany')]
+    jobs = [
+        {'title': 'Senior Python Engineer', 'company': company, 'location': location,
+         'url': f'https://example.com/{number}'}
+        for number, (company, location) in enumerate(places)
+    ]
+
+    unique = MinHashDeduplicator().filter(jobs)
+
+    assert [job['location'] for job in unique] == ['Berlin', 'New York, NY', 'Bern']
+
+def test_job_city_ignores_region_and_case():
+    """Test that location formats of different platforms give the same city."""
+    assert job_city({'location': 'Nashville, TN'}) == job_city({'location': 'NASHVILLE, Tennessee, United States'})
+    assert job_city({}) == ''
+
+def test_bands_must_divide_num_perm():
+    """Test that an invalid band layout is rejected."""
+    with pytest.raises(ValueError):
+        MinHashDeduplicator(num_perm=128, bands=10)
@@ -0,0 +1,147 @@
+import json
+import smtplib
+import socket
+import pytest
+from src.utils.email_delivery import EmailDeliveryQueue
+from src.utils.notifications import JobNotifier
+
+controller_module = pytest.importorskip('aiosmtpd.controller')
+
+class _Handler:
+    """Stand-in mail server that records messages and the connection each arrived on."""
+
+    def __init__(self):
+        self.messages = []
+        self.refuse = set()
+        self.transient_failures = 0
+
+    async def handle_RCPT(self, server, session, envelope, address, rcpt_options):
+        if address in self.refuse:
+            return '550 No such user'
+        envelope.rcpt_tos.append(address)
+        return '250 OK'
+
+    async def handle_DATA(self, server, session, envelope):
+        if self.transient_failures:
+            self.transient_failures -= 1
+            return '451 Try again later'
+        self.messages.append((id(session), envelope.rcpt_tos[0], envelope.content.decode()))
+        return '250 Message accepted'
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+@pytest.fixture
+def smtp_server():
+    handler = _Handler()
+    port = _free_port()
+    controller = controller_module.Controller(handler, hostname='127.0.0.1', port=port)
+    controller.start()
+    yield handler, '127.0.0.1', port
+    controller.stop()
+
+@pytest.fixture
+def make_queue(smtp_server):
+    queues = []
+
+    def make(**kwargs):
+        _, host, port = smtp_server
+        options = dict(from_email='alerts@example.com', starttls=False, batch_window=0.2,
+                       backoff=0.01, timeout=5)
+        options.update(kwargs)
+        queue = EmailDeliveryQueue(host, port, **options)
+        queues.append(queue)
+        return queue
+
+    yield make
+    for queue in queues:
+        queue.close(timeout=5)
+
+def test_messages_share_one_connection(smtp_server, make_queue):
+    """Test that queued emails to different recipients go out over a single connection."""
+    handler, _, _ = smtp_server
+    queue = make_queue()
+    for number in range(3):
+        queue.send(f'team{number}@example.com', f'Subject {number}', f'Body {number}')
+
+    assert queue.flush(timeout=10)
+    assert sorted(recipient for _, recipient, _ in handler.messages) == [
+        'team0@example.com', 'team1@example.com', 'team2@example.com'
+    ]
+    assert len({connection for connection, _, _ in handler.messages}) == 1
+    assert queue.sent == 3
+
+def test_messages_to_one_recipient_are_merged(smtp_server, make_queue):
+    """Test that messages to the same recipient within the batch window become one digest."""
+    handler, _, _ = smtp_server
+    queue = make_queue()
+    queue.send('team@example.com', 'First', 'first body')
+    queue.send('team@example.com', 'Second', 'second body')
+
+    assert queue.flush(timeout=10)
+    assert len(handler.messages) == 1
+    content = handler.messages[0][2]
+    assert 'Subject: First (+1 more)' in content
+    assert 'first body' in content and 'second body' in content
+
+def test_transient_failures_are_retried(smtp_server, make_queue):
+    """Test that temporary server errors and dropped connections are retried with backoff."""
+    handler, host, port = smtp_server
+    handler.transient_failures = 1
+    attempts = []
+    delays = []
+
+    def flaky_factory(*args, **kwargs):
+        attempts.append(args)
+        if len(attempts) == 2:
+            raise smtplib.SMTPConnectError(421, b'Too busy')
+        return smtplib.SMTP(*args, **kwargs)
+
+    queue = make_queue(smtp_factory=flaky_factory, sleep=delays.append, backoff=1.0)
+    queue.send('team@example.com', 'Subject', 'Body')
+
+    assert queue.flush(timeout=10)
+    assert len(handler.messages) == 1
+    assert delays == [1.0, 2.0]
+    assert queue.sent == 1 and queue.failed == 0
+
+def test_rejected_recipients_are_not_retried(smtp_server, make_queue):
+    """Test that a permanent rejection is given up on at once without blocking other mail."""
+    handler, _, _ = smtp_server
+    handler.refuse.add('gone@example.com')
+    delays = []
+    queue = make_queue(sleep=delays.append)
+    queue.send('gone@example.com', 'Subject', 'Body')
+    queue.send('team@example.com', 'Subject', 'Body')
+
+    assert queue.flush(timeout=10)
+    assert [recipient for _, recipient, _ in handler.messages] == ['team@example.com']
+    assert delays == []
+    assert queue.failed == 1 and queue.sent == 1
+
+def test_send_returns_before_delivery(make_queue):
+    """Test that send() only enqueues."""
+    queue = make_queue(batch_window=5)
+    queue.send('team@example.com', 'Subject', 'Body')
+
+    assert queue.flush(timeout=0.1) is False
+    assert queue.sent == 0
+
+def test_notifier_delivers_through_queue(smtp_server, tmp_path, monkeypatch):
+    """Test that the notifier hands its emails to the delivery queue and close() sends them."""
+    handler, host, port = smtp_server
+    monkeypatch.chdir(tmp_path)
+    config = tmp_path / 'notifications.json'
+    config.write_text(json.dumps({
+        'email': {'enabled': True, 'smtp_server': host, 'smtp_port': port, 'from_email': 'alerts@example.com',
+                  'to_email': 'me@example.com', 'starttls': False, 'batch_window': 0.1},
+        'keywords': ['python'], 'locations': [], 'companies': [],
+    }))
+
+    with JobNotifier(str(config)) as notifier:
+        notifier.check_new_jobs([{'title': 'Python Developer', 'url': 'https://example.com/1'}])
+
+    assert [recipient for _, recipient, _ in handler.messages] == ['me@example.com']
+    assert 'Subject: New Job Matches Found: 1' in handler.messages[0][2]
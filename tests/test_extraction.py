@@ -0,0 +1,104 @@
+import json
+import pytest
+from src.scrapers.extraction import FieldGroup, SiteExtractor
+from src.scrapers.job_scraper import JobScraper
+from src.scrapers.parsers import available_parsers, get_parser
+from src.scrapers.site_specs import INDEED, LINKEDIN, load_site_spec
+
+PAGE = '''
+<html><body>
+<ul class="results">
+  <li class="job"><a class="title" href="/jobs/1?utm_source=feed">Python Developer</a>
+    <span class="meta">Full-time</span><span class="meta">Pay: $90,000</span><span class="meta">Posted today</span>
+  </li>
+  <li class="job"><a class="title" href="/jobs/2">Data Analyst</a></li>
+  <li class="job"><span class="meta">No title</span></li>
+</ul>
+<nav><a class="page" aria-label="Next page" href="/search?page=2">Next</a></nav>
+</body></html>
+'''
+
+EXAMPLE_SPEC = {
+    'name': 'example',
+    'source': 'Example',
+    'listing': {
+        'item': 'li.job',
+        'fields': {
+            'title': {'selector': 'a.title', 'required': True},
+            'url': {'selector': 'li.job a.title', 'attr': 'href'},
+            'job_type': {'selector': 'span.meta', 'default': ''},
+            'salary': {'selector': 'span.meta', 'contains': 'pay', 'default': 'Not specified'},
+        },
+    },
+    'next_page': {'selector': 'nav a[aria-label="Next page"]', 'attr': 'href'},
+}
+
+@pytest.fixture(params=available_parsers())
+def parser(request):
+    """Every parser backend installed here."""
+    return get_parser(request.param)
+
+def test_field_options(parser):
+    """Test attr, index, all, contains and default on one walk of the page."""
+    group = FieldGroup({
+        'first': 'span.meta',
+        'second': {'selector': 'span.meta', 'index': 1},
+        'every': {'selector': 'li.job span.meta', 'all': True},
+        'pay': {'selector': 'span.meta', 'contains': 'PAY'},
+        'link': {'selector': 'ul.results a[href]', 'attr': 'href'},
+        'missing': {'selector': 'table.none', 'default': 'n/a'},
+    })
+
+    values = group.extract(parser, parser.parse(PAGE))
+
+    assert values == {
+        'first': 'Full-time',
+        'second': 'Pay: $90,000',
+        'every': ['Full-time', 'Pay: $90,000', 'Posted today', 'No title'],
+        'pay': 'Pay: $90,000',
+        'link': '/jobs/1?utm_source=feed',
+        'missing': 'n/a',
+    }
+
+def test_descendant_selector_requires_ancestor(parser):
+    """Test that every step of a descendant selector has to match."""
+    group = FieldGroup({'link': {'selector': 'nav a[href]', 'attr': 'href'}})
+
+    assert group.extract(parser, parser.parse(PAGE)) == {'link': '/search?page=2'}
+
+def test_new_site_from_spec_alone(parser):
+    """Test that a site described only by a spec is scraped by the generic scraper."""
+    scraper = JobScraper('https://jobs.example.com', parser=parser.name, use_cache=False, site_spec=EXAMPLE_SPEC)
+    doc = scraper.parser.parse(PAGE)
+
+    jobs = scraper._extract_job_listings(doc)
+
+    assert jobs == [
+        {'title': 'Python Developer', 'url': 'https://jobs.example.com/jobs/1', 'job_id': None,
+         'job_type': 'Fulltime', 'salary': 'Pay $90,000', 'source': 'Example'},
+        {'title': 'Data Analyst', 'url': 'https://jobs.example.com/jobs/2', 'job_id': None,
+         'job_type': '', 'salary': 'Not specified', 'source': 'Example'},
+    ]
+    assert scraper._get_next_page_url(doc) == 'https://jobs.example.com/search?page=2'
+
+@pytest.mark.parametrize('spec', [
+    {'name': 'x', 'listings': {}},
+    {'listing': {'item': 'li', 'fields': {'title': {'css': 'a'}}}},
+    {'listing': {'item': 'li', 'fields': {'title': 'a > b'}}},
+])
+def test_invalid_specs_are_rejected(spec):
+    """Test that typos in a spec fail when it is compiled, not on the first page."""
+    with pytest.raises(ValueError):
+        SiteExtractor(spec)
+
+def test_builtin_specs_compile():
+    """Test that the bundled site specs are valid."""
+    for spec in (INDEED, LINKEDIN):
+        SiteExtractor(spec)
+
+def test_load_site_spec(tmp_path):
+    """Test that specs can be kept in JSON files."""
+    path = tmp_path / 'example.json'
+    path.write_text(json.dumps(EXAMPLE_SPEC))
+
+    assert load_site_spec(str(path)) == EXAMPLE_SPEC
@@ -0,0 +1,50 @@
+import threading
+import time
+import pytest
+from src.scrapers.fetcher import ConcurrentFetcher
+
+@pytest.fixture
+def fetcher():
+    return ConcurrentFetcher(max_workers=8, per_host_limit=2, min_host_interval=0)
+
+def test_fetch_all_preserves_order(fetcher):
+    """Test that results come back in the order the URLs were given."""
+    urls = [f"https://example.com/job/{i}" for i in range(10)]
+
+    def fetch(url):
+        time.sleep(0.01 * (10 - int(url.rsplit('/', 1)[1])))
+        return url.upper()
+
+    assert fetcher.fetch_all(urls, fetch) == [url.upper() for url in urls]
+
+def test_fetch_all_respects_per_host_limit(fetcher):
+    """Test that no more than per_host_limit requests run at once on one host."""
+    lock = threading.Lock()
+    in_flight = {'current': 0, 'max': 0}
+
+    def fetch(url):
+        with lock:
+            in_flight['current'] += 1
+            in_flight['max'] = max(in_flight['max'], in_flight['current'])
+        time.sleep(0.02)
+        with lock:
+            in_flight['current'] -= 1
+        return url
+
+    urls = [f"https://www.indeed.com/viewjob?jk={i}" for i in range(8)]
+    fetcher.fetch_all(urls, fetch)
+    assert in_flight['max'] <= 2
+
+def test_fetch_all_failures_become_none(fetcher):
+    """Test that a failing fetch yields None without breaking the batch."""
+    def fetch(url):
+        if url.endswith('2'):
+            raise RuntimeError("boom")
+        return url
+
+    urls = ["https://example.com/1", "https://example.com/2", "https://example.com/3"]
+    assert fetcher.fetch_all(urls, fetch) == [urls[0], None, urls[2]]
+
+def test_fetch_all_empty(fetcher):
+    """Test fetching an empty list of URLs."""
+    assert fetcher.fetch_all([], lambda url: url) == []
@@ -0,0 +1,63 @@
+import json
+from src.utils.helpers import JsonLinesWriter, iter_json_lines, load_from_json, load_saved_jobs
+
+def test_json_lines_round_trip(tmp_path):
+    """Test that written records are read back in order."""
+    path = tmp_path / 'jobs.jsonl'
+    with JsonLinesWriter(str(path)) as writer:
+        writer.write({'title': 'Engineer', 'url': 'https://example.com/1'})
+        writer.write({'title': 'Analyst', 'url': 'https://example.com/2'})
+
+    assert [job['title'] for job in iter_json_lines(str(path))] == ['Engineer', 'Analyst']
+    assert len(load_from_json(str(path))) == 2
+
+def test_json_lines_resume_skips_known_urls(tmp_path):
+    """Test that re-opening a file resumes it without duplicating jobs."""
+    path = tmp_path / 'jobs.jsonl'
+    with JsonLinesWriter(str(path)) as writer:
+        writer.write({'title': 'Engineer', 'url': 'https://example.com/1'})
+
+    with JsonLinesWriter(str(path)) as writer:
+        assert writer.resumed_count == 1
+        assert not writer.write({'title': 'Engineer', 'url': 'https://example.com/1'})
+        assert writer.write({'title': 'Analyst', 'url': 'https://example.com/2'})
+        assert writer.written == 1
+
+    assert len(list(iter_json_lines(str(path)))) == 2
+
+def test_json_lines_drops_partial_last_line(tmp_path):
+    """Test that a line cut off by a crash is dropped before appending."""
+    path = tmp_path / 'jobs.jsonl'
+    path.write_text('{"title": "Engineer", "url": "https://example.com/1"}\n{"title": "Ana')
+
+    with JsonLinesWriter(str(path)) as writer:
+        writer.write({'title': 'Analyst', 'url': 'https://example.com/2'})
+
+    assert [job['title'] for job in iter_json_lines(str(path))] == ['Engineer', 'Analyst']
+
+def test_iter_json_lines_skips_malformed_lines(tmp_path):
+    """Test that malformed lines are skipped rather than aborting the read."""
+    path = tmp_path / 'jobs.jsonl'
+    path.write_text('{"title": "Engineer"}\nnot json\n\n{"title": "Analyst"}\n')
+
+    assert [job['title'] for job in iter_json_lines(str(path))] == ['Engineer', 'Analyst']
+
+def test_load_saved_jobs_dedupes_overlapping_dumps(tmp_path):
+    """Test that a posting saved by several runs is loaded once, from the newest dump."""
+    first = [
+        {'title': 'Engineer', 'company': 'Acme', 'location': 'Remote',
+         'url': 'https://www.indeed.com/viewjob?jk=00000000000000a1&from=serp'},
+        {'title': 'Analyst', 'company': 'Beta', 'location': 'Berlin', 'url': ''},
+    ]
+    second = [
+        {'title': 'Senior Engineer', 'company': 'Acme', 'location': 'Remote',
+         'url': 'https://www.indeed.com/viewjob?jk=00000000000000a1'},
+        {'title': 'Analyst', 'company': 'Beta', 'location': 'Berlin'},
+        {'title': 'Designer', 'company': 'Gamma', 'location': 'Remote', 'url': 'https://example.com/jobs/3'},
+    ]
+    (tmp_path / 'indeed_python_20250101_120000.json').write_text(json.dumps(first))
+    (tmp_path / 'indeed_python_20250102_120000.json').write_text(json.dumps(second))
+
+    jobs = load_saved_jobs(str(tmp_path))
+
+    assert [job['title'] for job in jobs] == ['Senior Engineer', 'Analyst', 'Designer']
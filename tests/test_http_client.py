@@ -0,0 +1,65 @@
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+import pytest
+import requests
+from src.scrapers.http_client import AsyncHttpClient
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        status = 404 if self.path == '/missing' else 200
+        body = f"<html><body>{self.path}</body></html>".encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+@pytest.fixture
+def server_url():
+    server = HTTPServer(('127.0.0.1', 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+@pytest.fixture
+def client():
+    client = AsyncHttpClient(limit=4, limit_per_host=2, timeout=5)
+    yield client
+    client.close()
+
+def test_get_returns_response(client, server_url):
+    """Test a successful GET through the pooled client."""
+    response = client.run(client.get(f"{server_url}/jobs"))
+    assert response.status_code == 200
+    assert '/jobs' in response.text
+    response.raise_for_status()
+
+def test_error_status_raises_http_error(client, server_url):
+    """Test that raise_for_status maps 4xx responses to requests.HTTPError."""
+    response = client.run(client.get(f"{server_url}/missing"))
+    assert response.status_code == 404
+    with pytest.raises(requests.HTTPError):
+        response.raise_for_status()
+
+def test_connection_error_is_requests_exception(client):
+    """Test that transport failures surface as requests exceptions."""
+    with pytest.raises(requests.RequestException):
+        client.run(client.get("http://127.0.0.1:1/unreachable"))
+
+def test_sync_callers_from_many_threads(client, server_url):
+    """Test that run() can be called concurrently from worker threads."""
+    results = []
+    threads = [
+        threading.Thread(target=lambda i=i: results.append(client.run(client.get(f"{server_url}/{i}")).status_code))
+        for i in range(6)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == [200] * 6
@@ -0,0 +1,73 @@
+import pytest
+from src.utils.job_dataset import parse_salary, read_jobs_dataset, write_jobs_dataset
+
+@pytest.fixture
+def sample_jobs():
+    """Jobs from two sources scraped on different days."""
+    return [
+        {
+            'title': 'Python Developer',
+            'company': 'Tech Corp',
+            'location': 'Nashville, TN',
+            'salary': '$80,000  $100,000 a year',
+            'job_type': 'Full-time',
+            'url': 'https://www.indeed.com/viewjob?jk=1',
+            'source': 'Indeed',
+            'scraped_date': '2025-04-15T10:00:00',
+            'sentiment_analysis': {
+                'textblob_score': 0.5,
+                'vader_scores': {'neg': 0.0, 'neu': 0.5, 'pos': 0.5, 'compound': 0.8},
+                'spacy_score': 0.0,
+                'overall_sentiment': 'positive'
+            }
+        },
+        {
+            'title': 'Data Scientist Intern',
+            'company': 'HealthStream',
+            'location': 'Nashville, TN',
+            'salary': 'Not specified',
+            'job_type': 'Internship',
+            'url': 'https://www.linkedin.com/jobs/view/2',
+            'source': 'LinkedIn',
+            'scraped_date': '2025-04-16T10:00:00'
+        }
+    ]
+
+def test_parse_salary():
+    """Test that salary ranges, single amounts and periods are parsed."""
+    assert parse_salary('$80,000  $100,000 a year') == (80000.0, 100000.0, 'year')
+    assert parse_salary('$45 an hour') == (45.0, 45.0, 'hour')
+    assert parse_salary('$90K - $110K') == (90000.0, 110000.0, None)
+    assert parse_salary('Not specified') == (None, None, None)
+    assert parse_salary(None) == (None, None, None)
+
+def test_dataset_round_trip_with_typed_columns(tmp_path, sample_jobs):
+    """Test that jobs are written to partitions and read back with typed columns."""
+    dataset_dir = tmp_path / 'jobs'
+    assert write_jobs_dataset(sample_jobs, str(dataset_dir)) == 2
+
+    assert (dataset_dir / 'source=Indeed' / 'date=2025-04-15').is_dir()
+    df = read_jobs_dataset(str(dataset_dir)).sort_values('title').reset_index(drop=True)
+
+    assert list(df['title']) == ['Data Scientist Intern', 'Python Developer']
+    assert df.loc[1, 'salary_min'] == 80000.0
+    assert df.loc[1, 'vader_compound'] == 0.8
+    assert str(df['job_type'].dtype) == 'category'
+    assert str(df['scraped_date'].dtype).startswith('datetime64')
+
+def test_dataset_filters_by_source_and_date(tmp_path, sample_jobs):
+    """Test that source and date filters select the matching partitions only."""
+    dataset_dir = str(tmp_path / 'jobs')
+    write_jobs_dataset(sample_jobs, dataset_dir)
+    write_jobs_dataset(sample_jobs[:1], dataset_dir)
+
+    assert len(read_jobs_dataset(dataset_dir, sources=['Indeed'])) == 2
+    assert list(read_jobs_dataset(dataset_dir, start_date='2025-04-16')['source']) == ['LinkedIn']
+    assert list(read_jobs_dataset(dataset_dir, columns=['company'], end_date='2025-04-15').columns) == ['company']
+
+def test_read_missing_dataset_is_empty(tmp_path):
+    """Test that reading a dataset that was never written returns an empty frame."""
+    df = read_jobs_dataset(str(tmp_path / 'missing'), columns=['title', 'salary_min'])
+
+    assert df.empty
+    assert list(df.columns) == ['title', 'salary_min']
@@ -0,0 +1,143 @@
+import asyncio
+import threading
+from urllib.parse import parse_qs, urlsplit
+from src.scrapers.http_client import HttpResponse
+from src.scrapers.job_scraper import IndeedScraper
+from src.scrapers.rate_limiter import RateLimiter
+from src.scrapers.seen_index import SeenJobIndex
+from src.utils.pipeline import build_pipeline
+
+def results_page(numbers):
+    """An Indeed results page with one card per job number."""
+    cards = ''.join(
+        f'<div class="job_seen_beacon"><h2 class="jobTitle"><a href="/viewjob?jk={n:016x}">Engineer {n}</a></h2>'
+        f'<span class="companyName">Company {n}</span><div class="companyLocation">Remote</div></div>'
+        for n in numbers
+    )
+    return f'<html><body>{cards}</body></html>'
+
+def detail_page(jk):
+    return f'<html><body><div id="jobDescriptionText">Description of {jk}</div></body></html>'
+
+class StubHttpClient:
+    """Serves results pages by start offset and detail pages, recording requests."""
+
+    def __init__(self, pages, detail_delay=0.05):
+        """
+        Args:
+            pages (Dict[int, List[int]]): Job numbers on the results page at each start offset
+            detail_delay (float): Seconds each detail request stays in flight
+        """
+        self.pages = pages
+        self.detail_delay = detail_delay
+        self.requested = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    async def get(self, url, headers=None, timeout=None):
+        query = parse_qs(urlsplit(url).query)
+        with self._lock:
+            self.requested.append(url)
+        if 'jk' not in query:
+            return HttpResponse(url, 200, results_page(self.pages.get(int(query['start'][0]), [])), {})
+
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.detail_delay)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+        return HttpResponse(url, 200, detail_page(query['jk'][0]), {})
+
+    def run(self, coro):
+        # Every calling thread gets its own loop, so concurrent callers overlap
+        return asyncio.run(coro)
+
+def make_scraper(http, **kwargs):
+    rate_limiter = RateLimiter(rates={}, default_rate=1000, default_burst=1000)
+    scraper = IndeedScraper(use_cache=False, rate_limiter=rate_limiter, **kwargs)
+    scraper.http = http
+    return scraper
+
+def test_offset_scraper_fetches_detail_pages_concurrently():
+    """Test that Indeed listings are merged with detail pages fetched in parallel, within the host limit."""
+    http = StubHttpClient({0: list(range(6))})
+    scraper = make_scraper(http, max_workers=8, per_host_limit=3)
+
+    jobs = scraper.scrape_job_listings('https://www.indeed.com/jobs?q=python', max_pages=1)
+
+    assert [job['title'] for job in jobs] == [f'Engineer {n}' for n in range(6)]
+    assert [job['description'] for job in jobs] == [f'Description of {n:016x}' for n in range(6)]
+    assert all(job['company'] == f'Company {n}' for n, job in enumerate(jobs))
+    assert sum('jk=' in url for url in http.requested) == 6
+    assert 1 < http.max_in_flight <= 3
+
+def test_incremental_scrape_skips_seen_jobs_and_stops_on_known_page(tmp_path):
+    """Test that seen postings are dropped and pagination stops after a mostly known page."""
+    http = StubHttpClient({0: [0, 1, 2, 3, 4], 10: [5, 6, 7, 8, 9], 20: [10, 11, 12, 13, 14]})
+    seen_path = tmp_path / 'seen_jobs.txt'
+    seen_index = SeenJobIndex(str(seen_path))
+    seen_index.add(f'indeed:{n:016x}' for n in (1, 5, 6, 7, 8))
+    scraper = make_scraper(http, seen_index=seen_index, known_page_threshold=0.8, fetch_details=False)
+
+    jobs = scraper.scrape_job_listings('https://www.indeed.com/jobs?q=python', max_pages=3)
+
+    assert [job['title'] for job in jobs] == ['Engineer 0', 'Engineer 2', 'Engineer 3', 'Engineer 4', 'Engineer 9']
+    assert not any('start=20' in url for url in http.requested)
+    assert len(SeenJobIndex(str(seen_path))) == 10
+
+def test_postings_of_a_failed_page_stay_unseen(tmp_path, monkeypatch):
+    """Test that postings are only recorded as seen once they have been handed to the consumer."""
+    http = StubHttpClient({0: [0, 1, 2]})
+    seen_path = tmp_path / 'seen_jobs.txt'
+    scraper = make_scraper(http, seen_index=SeenJobIndex(str(seen_path)))
+    def fail(jobs):
+        raise RuntimeError('detail fetch failed')
+    monkeypatch.setattr(scraper, 'add_details', fail)
+
+    assert scraper.scrape_job_listings('https://www.indeed.com/jobs?q=python', max_pages=1) == []
+    assert len(SeenJobIndex(str(seen_path))) == 0
+
+    scraper = make_scraper(http, seen_index=SeenJobIndex(str(seen_path)))
+    jobs = scraper.iter_job_listings('https://www.indeed.com/jobs?q=python', max_pages=1)
+    assert next(jobs)['title'] == 'Engineer 0'
+    jobs.close()
+    assert len(SeenJobIndex(str(seen_path))) == 0
+
+    jobs = scraper.scrape_job_listings('https://www.indeed.com/jobs?q=python', max_pages=1)
+    assert [job['title'] for job in jobs] == ['Engineer 0', 'Engineer 1', 'Engineer 2']
+    assert len(SeenJobIndex(str(seen_path))) == 3
+
+class StubAnalyzer:
+    def analyze_many(self, texts, batch_size=32):
+        return [{'overall_sentiment': 'neutral'} for _ in texts]
+
+def test_details_stage_fetches_each_detail_page_once():
+    """Test that with a details stage the listings come without details and each page is fetched once."""
+    http = StubHttpClient({0: list(range(4)), 10: list(range(4, 8))})
+    scraper = make_scraper(http)
+
+    pipeline = build_pipeline(
+        scraper.iter_job_listings('https://www.indeed.com/jobs?q=python', max_pages=2, fetch_details=False),
+        detail_scraper=scraper
+    )
+    jobs = list(pipeline)
+
+    assert [job['description'] for job in jobs] == [f'Description of {n:016x}' for n in range(8)]
+    assert sum('jk=' in url for url in http.requested) == 8
+
+def test_iter_jobs_runs_details_as_a_pipeline_stage():
+    """Test that iter_jobs fetches details in the pipeline rather than in the listing generator."""
+    http = StubHttpClient({0: list(range(3))})
+    scraper = make_scraper(http)
+    scraper.base_url = 'https://www.indeed.com/jobs?q=python'
+    scraper.sentiment_analyzer = StubAnalyzer()
+
+    jobs = list(scraper.iter_jobs(max_pages=1))
+
+    assert [job['description'] for job in jobs] == [f'Description of {n:016x}' for n in range(3)]
+    assert all(job['sentiment_analysis'] == {'overall_sentiment': 'neutral'} for job in jobs)
+    assert sum('jk=' in url for url in http.requested) == 3
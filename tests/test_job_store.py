@@ -0,0 +1,78 @@
+import pytest
+from src.utils.job_store import JobStore, job_key
+from src.utils.notifications import JobNotifier
+
+@pytest.fixture
+def store(tmp_path):
+    """Job store in a temporary directory."""
+    with JobStore(str(tmp_path / 'jobs.sqlite3'), batch_size=2) as job_store:
+        yield job_store
+
+@pytest.fixture
+def sample_jobs():
+    """Jobs from two companies and sources."""
+    return [
+        {
+            'title': 'Python Developer',
+            'company': 'Tech Corp',
+            'location': 'Nashville, TN',
+            'url': 'https://www.indeed.com/viewjob?jk=1',
+            'source': 'Indeed'
+        },
+        {
+            'title': 'Data Scientist Intern',
+            'company': 'HealthStream',
+            'location': 'Nashville, TN',
+            'url': 'https://www.linkedin.com/jobs/view/2',
+            'source': 'LinkedIn'
+        }
+    ]
+
+def test_upsert_deduplicates_by_url(store, sample_jobs):
+    """Test that writing the same job twice updates it instead of duplicating it."""
+    store.upsert_many(sample_jobs)
+    store.upsert({**sample_jobs[0], 'title': 'Senior Python Developer'})
+
+    assert len(store) == 2
+    assert [job['title'] for job in store.query(company='tech corp')] == ['Senior Python Developer']
+
+def test_upsert_keeps_sentiment_when_not_rescored(store, sample_jobs):
+    """Test that re-scraping a job without sentiment keeps its stored sentiment."""
+    sentiment = {'overall_sentiment': 'positive'}
+    store.upsert({**sample_jobs[0], 'sentiment_analysis': sentiment})
+    store.upsert(sample_jobs[0])
+
+    assert store.query(source='indeed')[0]['sentiment_analysis'] == sentiment
+
+def test_add_buffers_until_batch_size(store, sample_jobs):
+    """Test that add() writes in batches and flush() writes the remainder."""
+    store.add(sample_jobs[0])
+    assert len(store) == 0
+
+    store.add(sample_jobs[1])
+    assert len(store) == 2
+
+    store.add({'title': 'No URL', 'company': 'Other Corp', 'source': 'Indeed'})
+    store.flush()
+    assert len(store) == 3
+
+def test_query_filters(store, sample_jobs):
+    """Test that query filters combine and known_keys reports stored jobs."""
+    store.upsert_many(sample_jobs)
+
+    assert [job['source'] for job in store.query(location='Nashville, TN', source='LinkedIn')] == ['LinkedIn']
+    assert len(store.query(limit=1)) == 1
+    assert store.query(seen_since='9999') == []
+    assert store.known_keys([job_key(sample_jobs[0]), 'missing']) == {job_key(sample_jobs[0])}
+
+def test_notifier_checks_stored_jobs(store, sample_jobs, tmp_path, monkeypatch):
+    """Test that the notifier can pull candidate jobs from the store."""
+    monkeypatch.chdir(tmp_path)
+    config = tmp_path / 'notifications.json'
+    config.write_text('{"email": {"enabled": false}, "keywords": ["python"], "locations": [], "companies": []}')
+    store.upsert_many(sample_jobs)
+
+    notifier = JobNotifier(str(config), store=store)
+
+    assert [job['title'] for job in notifier.check_stored_jobs()] == ['Python Developer']
+    assert notifier.check_stored_jobs() == []
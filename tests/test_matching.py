@@ -0,0 +1,88 @@
+import random
+import pytest
+from src.utils.matching import CriteriaMatcher, KeywordMatcher
+from src.utils.notifications import JobNotifier
+
+def naive_find(terms, text):
+    """Reference implementation: one substring test per term."""
+    return {term.lower() for term in terms if term and term.lower() in text.lower()}
+
+def test_find_reports_overlapping_and_prefix_terms():
+    """Test that terms sharing a prefix or overlapping are all reported."""
+    matcher = KeywordMatcher(['python', 'Python Developer', 'developer', 'pytorch', 'java'])
+
+    assert matcher.find('Senior PYTHON developer') == {'python', 'python developer', 'developer'}
+    assert matcher.find('JavaScript') == {'java'}
+    assert matcher.find('Go engineer') == set()
+
+def test_search_and_find_handle_empty_input():
+    """Test that empty term lists and missing text never match."""
+    assert not KeywordMatcher([])
+    assert KeywordMatcher([]).find('python') == set()
+    assert KeywordMatcher(['', 'python']).search(None) is False
+    assert KeywordMatcher(['python']).find('') == set()
+
+def test_terms_with_regex_metacharacters():
+    """Test that terms are matched literally."""
+    matcher = KeywordMatcher(['c++', 'c#', '.net', '(remote)'])
+
+    assert matcher.find('C++ and .NET, (Remote)') == {'c++', '.net', '(remote)'}
+    assert matcher.find('cnet') == set()
+
+def test_find_agrees_with_substring_scan():
+    """Test that the compiled matcher finds exactly what a substring scan does."""
+    rng = random.Random(7)
+    alphabet = 'abc d'
+    terms = [''.join(rng.choice(alphabet) for _ in range(rng.randint(1, 4))) for _ in range(60)]
+    matcher = KeywordMatcher(terms)
+
+    for _ in range(200):
+        text = ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 30)))
+        assert matcher.find(text) == naive_find(terms, text)
+        assert matcher.search(text) == bool(naive_find(terms, text))
+
+@pytest.fixture
+def criteria():
+    return CriteriaMatcher(keywords=['Python', 'django'], locations=['Remote'], companies=['Tech'])
+
+def test_matches_reports_rules_by_kind(criteria):
+    """Test that matching rules are reported per kind, as configured and in config order."""
+    job = {
+        'title': 'Django Developer',
+        'description': 'We use python',
+        'location': 'Remote - US',
+        'company': 'Other Corp',
+    }
+
+    assert criteria.matches(job) == {'keywords': ['Python', 'django'], 'locations': ['Remote']}
+    assert criteria.is_match(job)
+
+def test_rules_only_match_their_fields(criteria):
+    """Test that a location term in the description does not count as a location match."""
+    job = {'title': 'Engineer', 'description': 'Remote friendly', 'location': 'Austin', 'company': None}
+
+    assert criteria.matches(job) == {}
+    assert not criteria.is_match(job)
+
+def test_from_config_tolerates_missing_lists():
+    """Test that absent or null criteria lists mean no rules of that kind."""
+    matcher = CriteriaMatcher.from_config({'keywords': ['python'], 'locations': None})
+
+    assert matcher.matches({'title': 'Python', 'location': 'Remote'}) == {'keywords': ['python']}
+
+def test_notifier_lists_matched_rules(tmp_path, monkeypatch):
+    """Test that notification emails say which rules each job matched."""
+    monkeypatch.chdir(tmp_path)
+    config = tmp_path / 'notifications.json'
+    config.write_text('{"email": {"enabled": false}, "keywords": ["python"], "locations": ["remote"], "companies": []}')
+    notifier = JobNotifier(str(config))
+    sent = []
+    monkeypatch.setattr(notifier, '_send_email', lambda subject, body, to_email=None: sent.append(body))
+
+    jobs = [
+        {'title': 'Python Developer', 'location': 'Remote', 'url': 'https://example.com/1'},
+        {'title': 'Java Developer', 'location': 'Austin', 'url': 'https://example.com/2'},
+    ]
+
+    assert notifier.check_new_jobs(jobs) == jobs[:1]
+    assert 'Matched: keywords: python; locations: remote\n' in sent[0]
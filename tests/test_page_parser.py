@@ -0,0 +1,81 @@
+import pickle
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from urllib.parse import parse_qs, urlsplit
+import pytest
+from src.scrapers.job_scraper import IndeedScraper
+from src.scrapers.page_parser import JobPageParser, LinkedInPageParser, ParsePool
+from src.scrapers.rate_limiter import RateLimiter
+from src.scrapers.site_specs import INDEED, LINKEDIN
+
+def results_page(start):
+    """An Indeed results page with three cards numbered from start."""
+    cards = ''.join(
+        f'<div class="job_seen_beacon"><h2 class="jobTitle"><a href="/viewjob?jk={n:016x}">Engineer {n}</a></h2>'
+        f'<span class="companyName">Company {n}</span><div class="companyLocation">Remote</div></div>'
+        for n in range(start, start + 3)
+    )
+    return f'<html><body>{cards}</body></html>'
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        start = int(parse_qs(urlsplit(self.path).query).get('start', ['0'])[0])
+        body = results_page(start).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+@pytest.fixture
+def server_url():
+    server = HTTPServer(('127.0.0.1', 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+@pytest.fixture(scope='module')
+def parse_pool():
+    with ParsePool(max_workers=2) as pool:
+        yield pool
+
+def test_page_parser_pickles_without_compiled_state():
+    """Test that a page parser survives pickling, keeping its class and backend."""
+    page_parser = LinkedInPageParser('https://www.linkedin.com', LINKEDIN, 'lxml')
+
+    copy = pickle.loads(pickle.dumps(page_parser))
+
+    assert type(copy) is LinkedInPageParser
+    assert copy.parser.name == 'lxml'
+    assert copy.extractor is page_parser.extractor
+
+def test_pool_parses_like_the_calling_process(parse_pool):
+    """Test that pages parsed in worker processes give the same records."""
+    page_parser = JobPageParser('https://www.indeed.com', INDEED)
+    html = results_page(0)
+
+    jobs, next_url = parse_pool.run(page_parser.parse_results_page, html)
+
+    assert (jobs, next_url) == page_parser.parse_results_page(html)
+    assert [job['job_id'] for job in jobs] == [f'indeed:{n:016x}' for n in range(3)]
+
+def test_scraper_with_pool_keeps_page_order(parse_pool, server_url):
+    """Test that prefetched pages are still yielded in page order."""
+    scraper = IndeedScraper(
+        use_cache=False,
+        rate_limiter=RateLimiter(default_rate=100, default_burst=100),
+        parse_pool=parse_pool,
+        prefetch_pages=2,
+        fetch_details=False
+    )
+
+    jobs = scraper.scrape_job_listings(f"{server_url}/jobs?q=python", max_pages=4)
+
+    assert [job['title'] for job in jobs] == [
+        f'Engineer {start + offset}' for start in (0, 10, 20, 30) for offset in range(3)
+    ]
@@ -0,0 +1,135 @@
+import pytest
+from src.scrapers.job_scraper import IndeedScraper, LinkedInScraper
+from src.scrapers import parsers
+from src.scrapers.parsers import Selector, available_parsers, get_parser
+
+INDEED_PAGE = '''
+<html><body>
+<div class="job_seen_beacon result">
+  <h2 class="jobTitle css-1"><a href="/rc/clk?jk=4a1b2c3d4e5f6a7b&amp;from=serp">Python <b>Developer</b></a></h2>
+  <span class="companyName">Tech Corp</span>
+  <div class="companyLocation">Nashville, TN</div>
+  <div class="salary-snippet">$80,000 - $100,000 a year</div>
+</div>
+<div class="job_seen_beacon">
+  <h2 class="jobTitle"><a href="/viewjob?jk=0a0b0c0d0e0f0a0b">Data Analyst</a></h2>
+  <span class="companyName">Café Crème</span>
+  <div class="companyLocation">Remote</div>
+</div>
+<div class="job_seen_beacon"><h2 class="jobTitle">No link</h2></div>
+<a aria-label="Next Page" href="/jobs?q=python&amp;start=10">Next</a>
+</body></html>
+'''
+
+LINKEDIN_DETAIL = '''
+<html><body>
+<h1 class="top-card-layout__title">Python Developer</h1>
+<a class="topcard__org-name-link" href="/company/tech">  Tech Corp </a>
+<span class="topcard__flavor topcard__flavor--bullet">Nashville, TN</span>
+<div class="show-more-less-html__markup"><p>Build services.</p><p>Great team.</p></div>
+<span class="description__job-criteria-text">Full-time</span>
+<span class="description__job-criteria-text">2 days ago</span>
+</body></html>
+'''
+
+@pytest.fixture(params=available_parsers())
+def parser_name(request):
+    """Every parser backend installed here."""
+    return request.param
+
+def test_selector_compiles_to_css_and_xpath():
+    """Test that one selector is expressed for both selector engines."""
+    selector = Selector('a', {'aria-label': 'Next Page'}, class_='nav', href=True)
+
+    assert selector.css == 'a[aria-label="Next Page"][href].nav'
+    assert selector.xpath == (
+        './/a[@aria-label="Next Page"][@href]'
+        "[contains(concat(' ', normalize-space(@class), ' '), ' nav ')]"
+    )
+    assert selector == Selector('a', {'aria-label': 'Next Page', 'href': True}, class_='nav')
+
+def test_class_selector_matches_one_of_several_classes(parser_name):
+    """Test that class selectors match a single class token, as BeautifulSoup does."""
+    parser = get_parser(parser_name)
+    doc = parser.parse(INDEED_PAGE)
+
+    assert len(parser.select(doc, Selector('div', class_='job_seen_beacon'))) == 3
+    assert parser.select(doc, Selector('div', class_='job_seen')) == []
+    assert parser.first_text(doc, Selector('h2', class_='jobTitle')) == 'Python Developer'
+    assert parser.first_text(doc, Selector('span', class_='missing')) is None
+
+def test_listing_extraction_is_identical_across_backends(parser_name):
+    """Test that every backend extracts the same listings as BeautifulSoup."""
+    def extract(name):
+        scraper = IndeedScraper(parser=name, use_cache=False)
+        doc = scraper.parser.parse(INDEED_PAGE)
+        cards = scraper.extractor.items(scraper.parser, doc)
+        return (
+            scraper._extract_job_listings(doc),
+            [scraper._extract_job_data(card) for card in cards],
+            scraper._get_next_page_url(doc)
+        )
+
+    listings, cards, next_url = extract(parser_name)
+
+    assert (listings, cards, next_url) == extract('bs4')
+    assert listings[0]['url'] == 'https://www.indeed.com/viewjob?jk=4a1b2c3d4e5f6a7b'
+    assert cards[0]['salary'] == '$80,000  $100,000 a year'
+    assert cards[1]['salary'] == 'Not specified'
+    assert cards[2] == {}
+    assert next_url == 'https://www.indeed.com/jobs?q=python&start=10'
+
+def test_detail_extraction(parser_name):
+    """Test that detail pages are extracted the same way on every backend."""
+    scraper = LinkedInScraper(parser=parser_name, use_cache=False)
+
+    details = scraper._parse_job_details(LINKEDIN_DETAIL, 'https://www.linkedin.com/jobs/view/1')
+
+    assert details['company'] == 'Tech Corp'
+    assert details['description'] == 'Build services.Great team.'
+    assert (details['job_type'], details['posted_date']) == ('Full-time', '2 days ago')
+
+def test_empty_page_has_no_matches(parser_name):
+    """Test that an empty response parses to a document without matches."""
+    parser = get_parser(parser_name)
+
+    assert parser.select(parser.parse(''), Selector('div', class_='job_seen_beacon')) == []
+
+def test_select_any_finds_matches_once_in_document_order(parser_name):
+    """Test that a group of selectors is matched in one walk without duplicates."""
+    parser = get_parser(parser_name)
+    doc = parser.parse(INDEED_PAGE)
+    selectors = [Selector('a', href=True), Selector('h2', class_='jobTitle'), Selector(class_='css-1')]
+
+    matches = parser.select_any(doc, selectors)
+
+    assert [parser.tag(match) for match in matches] == ['h2', 'a', 'h2', 'a', 'h2', 'a']
+
+@pytest.mark.parametrize('css,tag,attrs', [
+    ('h2.jobTitle', 'h2', {'class': 'jobTitle'}),
+    ('div#jobDescriptionText', 'div', {'id': 'jobDescriptionText'}),
+    ('a[aria-label="Next Page"][href]', 'a', {'aria-label': 'Next Page', 'href': True}),
+    ('.companyName', None, {'class': 'companyName'}),
+])
+def test_selector_from_css(css, tag, attrs):
+    """Test that compound CSS selectors parse into their find() terms."""
+    assert Selector.from_css(css) == Selector(tag, attrs)
+
+def test_selector_from_css_rejects_unsupported_syntax():
+    """Test that combinators and pseudo-classes are not silently ignored."""
+    with pytest.raises(ValueError):
+        Selector.from_css('a:first-child')
+    with pytest.raises(ValueError):
+        Selector.from_css('span.a.b')
+
+def test_missing_backend_falls_back(monkeypatch):
+    """Test that requesting an uninstalled backend uses the fastest available one."""
+    monkeypatch.setattr(parsers, 'LexborHTMLParser', None)
+
+    assert get_parser('selectolax').name == 'lxml'
+    assert get_parser().name == 'lxml'
+
+def test_unknown_backend_is_rejected():
+    """Test that a misspelled backend name is an error rather than a silent fallback."""
+    with pytest.raises(ValueError):
+        get_parser('html5')
@@ -0,0 +1,78 @@
+import threading
+import pytest
+from src.utils.pipeline import Pipeline, Stage, build_pipeline
+
+def test_pipeline_applies_stages_in_order():
+    """Test that every job passes through each stage and keeps its order."""
+    jobs = [{'title': f'  Job   {i} '} for i in range(20)]
+    double = Stage('double', lambda batch: [job for job in batch for _ in range(2)], batch_size=4)
+    pipeline = build_pipeline(iter(jobs), queue_size=2)
+    pipeline.stages.append(double)
+
+    results = list(pipeline)
+
+    assert [job['title'] for job in results] == [f'Job {i}' for i in range(20) for _ in range(2)]
+
+def test_pipeline_batches_up_to_batch_size():
+    """Test that stage functions receive batches no larger than batch_size."""
+    sizes = []
+    def record(batch):
+        sizes.append(len(batch))
+        return batch
+
+    sunk = []
+    count = Pipeline(({'id': i} for i in range(10)), [Stage('record', record, batch_size=4)]).run(sunk.append)
+
+    assert count == 10
+    assert [job['id'] for job in sunk] == list(range(10))
+    assert max(sizes) <= 4
+
+def test_pipeline_reraises_stage_errors():
+    """Test that a failing stage stops the pipeline and surfaces the error."""
+    def explode(batch):
+        raise ValueError('bad job')
+
+    with pytest.raises(ValueError, match='bad job'):
+        list(Pipeline(({'id': i} for i in range(100)), [Stage('explode', explode)], queue_size=2))
+
+def test_pipeline_applies_back_pressure_and_closes_source():
+    """Test that a slow consumer bounds how far the source runs ahead, and stopping early closes it."""
+    produced = []
+    closed = threading.Event()
+    def source():
+        try:
+            for i in range(1000):
+                produced.append(i)
+                yield {'id': i}
+        finally:
+            closed.set()
+
+    pipeline = Pipeline(source(), [Stage('noop', lambda batch: batch)], queue_size=2)
+    for job in pipeline:
+        if job['id'] == 3:
+            break
+
+    assert closed.is_set()
+    assert len(produced) < 20
+
+def test_pipeline_keeps_description_and_job_type_as_scraped():
+    """Test that the clean stage leaves the description the sentiment stage scores, and job_type, untouched."""
+    class RecordingAnalyzer:
+        def __init__(self):
+            self.texts = []
+
+        def analyze_many(self, texts, batch_size=32):
+            self.texts.extend(texts)
+            return [{'overall_sentiment': 'positive'} for _ in texts]
+
+    description = 'Great team! Use C++/C#? Apply: now (remote).'
+    jobs = [{'title': ' Python   Developer ', 'job_type': 'Full-time', 'description': description}]
+    analyzer = RecordingAnalyzer()
+
+    results = list(build_pipeline(iter(jobs), analyzer=analyzer))
+
+    assert analyzer.texts == [description]
+    assert results[0]['description'] == description
+    assert results[0]['job_type'] == 'Full-time'
+    assert results[0]['title'] == 'Python Developer'
+    assert results[0]['sentiment_analysis'] == {'overall_sentiment': 'positive'}
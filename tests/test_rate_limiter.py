@@ -0,0 +1,70 @@
+import pytest
+from src.scrapers.rate_limiter import RateLimiter, _parse_retry_after
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+@pytest.fixture
+def limiter(clock):
+    return RateLimiter(
+        rates={'indeed.com': (1.0, 2), 'linkedin.com': (0.5, 1)},
+        backoff=5.0,
+        clock=clock
+    )
+
+def test_no_wait_within_burst(limiter):
+    """Test that requests within the burst budget are not delayed."""
+    assert limiter.reserve('https://www.indeed.com/jobs') == 0
+    assert limiter.reserve('https://www.indeed.com/viewjob?jk=1') == 0
+
+def test_wait_when_budget_exhausted(limiter, clock):
+    """Test that callers wait only once the bucket is empty, and refill over time."""
+    for _ in range(2):
+        limiter.reserve('https://www.indeed.com/jobs')
+    assert limiter.reserve('https://www.indeed.com/jobs') == pytest.approx(1.0)
+
+    clock.now += 5
+    assert limiter.reserve('https://www.indeed.com/jobs') == 0
+
+def test_hosts_have_independent_budgets(limiter):
+    """Test that Indeed and LinkedIn are rate limited separately."""
+    assert limiter.reserve('https://www.linkedin.com/jobs') == 0
+    assert limiter.reserve('https://www.linkedin.com/jobs') == pytest.approx(2.0)
+    assert limiter.reserve('https://www.indeed.com/jobs') == 0
+
+def test_throttle_honors_retry_after(limiter):
+    """Test that a 429 with Retry-After pauses the host for that long."""
+    limiter.record_response('https://www.indeed.com/jobs', 429, '30')
+    assert limiter.reserve('https://www.indeed.com/jobs') == pytest.approx(30.0)
+
+def test_throttle_backs_off_exponentially(limiter):
+    """Test that repeated 403s without Retry-After double the pause."""
+    limiter.record_response('https://www.indeed.com/jobs', 403)
+    assert limiter.reserve('https://www.indeed.com/jobs') == pytest.approx(5.0)
+    limiter.record_response('https://www.indeed.com/jobs', 403)
+    assert limiter.reserve('https://www.indeed.com/jobs') >= 5.0 + 10.0
+
+def test_rate_recovers_after_success(limiter):
+    """Test that the rate halves on throttling and climbs back on success."""
+    limiter.record_response('https://www.indeed.com/jobs', 429, '0')
+    bucket = limiter._get_bucket('https://www.indeed.com/jobs')
+    assert bucket.rate == pytest.approx(0.5)
+
+    for _ in range(10):
+        limiter.record_response('https://www.indeed.com/jobs', 200)
+    assert bucket.rate == pytest.approx(1.0)
+
+def test_parse_retry_after():
+    """Test Retry-After parsing for seconds, dates and garbage."""
+    assert _parse_retry_after('120') == 120.0
+    assert _parse_retry_after('Wed, 21 Oct 2015 07:28:00 GMT') == 0.0
+    assert _parse_retry_after('soon') is None
+    assert _parse_retry_after(None) is None
@@ -0,0 +1,61 @@
+import os
+import time
+import pytest
+from src.scrapers.http_client import HttpResponse
+from src.scrapers.response_cache import ResponseCache
+
+def _response(url, text, **headers):
+    return HttpResponse(url, 200, text, headers)
+
+@pytest.fixture
+def cache(tmp_path):
+    return ResponseCache(cache_dir=str(tmp_path / 'http'), max_bytes=100)
+
+def test_put_and_get_roundtrip(cache):
+    """Test that a stored response comes back with its validators."""
+    url = 'https://www.indeed.com/viewjob?jk=abc'
+    cache.put(url, _response(url, 'hello\r\nworld', ETag='"v1"', **{'Last-Modified': 'Wed, 16 Apr 2025 17:49:38 GMT'}))
+
+    entry = cache.get(url)
+    assert entry.text == 'hello\r\nworld'
+    assert entry.is_fresh(ttl=60)
+    assert entry.validators() == {
+        'If-None-Match': '"v1"',
+        'If-Modified-Since': 'Wed, 16 Apr 2025 17:49:38 GMT'
+    }
+    assert entry.to_response().status_code == 200
+
+def test_get_missing_url(cache):
+    """Test that unknown URLs are cache misses."""
+    assert cache.get('https://example.com/nothing') is None
+
+def test_stale_entries_are_kept_for_revalidation(cache):
+    """Test that expired entries stay available and refresh() makes them fresh."""
+    url = 'https://www.linkedin.com/jobs/view/1'
+    cache.put(url, _response(url, 'body', etag='"v1"'))
+    entry = cache.get(url)
+    assert not entry.is_fresh(ttl=60, now=time.time() + 120)
+
+    cache.refresh(url, entry, {'ETag': '"v2"'})
+    entry = cache.get(url)
+    assert entry.is_fresh(ttl=60)
+    assert entry.validators()['If-None-Match'] == '"v2"'
+
+def test_lru_eviction(cache):
+    """Test that the least recently used entries are evicted past max_bytes."""
+    for i in range(3):
+        cache.put(f'https://example.com/{i}', _response(f'https://example.com/{i}', 'x' * 40))
+        cache.get('https://example.com/0')
+
+    assert cache.get('https://example.com/0') is not None
+    assert cache.get('https://example.com/1') is None
+    assert cache.get('https://example.com/2') is not None
+
+def test_index_survives_restart(cache):
+    """Test that a new cache instance sees entries written by a previous one."""
+    url = 'https://example.com/persisted'
+    cache.put(url, _response(url, 'saved'))
+
+    reopened = ResponseCache(cache_dir=str(cache.cache_dir), max_bytes=100)
+    assert reopened.get(url).text == 'saved'
+    assert not any(name.endswith('.tmp') for name in os.listdir(cache.cache_dir))
@@ -0,0 +1,51 @@
+from src.scrapers.seen_index import SeenJobIndex
+
+def test_add_and_flush_persists(tmp_path):
+    """Test that flushed job IDs are visible to a new index instance."""
+    path = tmp_path / 'seen_jobs.txt'
+    index = SeenJobIndex(str(path))
+    index.add(['https://www.indeed.com/viewjob?jk=1', 'https://www.indeed.com/viewjob?jk=2'])
+    assert 'https://www.indeed.com/viewjob?jk=1' in index
+
+    assert not path.exists()
+    index.flush()
+
+    reopened = SeenJobIndex(str(path))
+    assert len(reopened) == 2
+    assert 'https://www.indeed.com/viewjob?jk=2' in reopened
+
+def test_flush_only_appends_new_ids(tmp_path):
+    """Test that repeated adds and flushes never duplicate lines."""
+    path = tmp_path / 'seen_jobs.txt'
+    index = SeenJobIndex(str(path))
+    index.add(['a', 'b'])
+    index.flush()
+    index.add(['b', 'c', ''])
+    index.flush()
+
+    assert [line.split('\t')[1] for line in path.read_text().splitlines()] == ['a', 'b', 'c']
+
+def test_ids_expire_after_ttl(tmp_path):
+    """Test that postings first seen longer ago than the TTL are forgotten and compacted away."""
+    path = tmp_path / 'seen_jobs.txt'
+    path.write_text('2000-01-01T00:00:00\told\n')
+    index = SeenJobIndex(str(path), ttl_days=30)
+    index.add(['new'])
+    index.flush()
+
+    assert 'old' not in index and 'new' in index
+    assert len(index) == 1
+
+    index._log.compact()
+    assert [line.split('\t')[1] for line in path.read_text().splitlines()] == ['new']
+
+def test_plain_index_is_upgraded(tmp_path):
+    """Test that an index of bare IDs from older versions is read and rewritten as a seen log."""
+    path = tmp_path / 'seen_jobs.txt'
+    path.write_text('a\nb\n\nb\n')
+
+    index = SeenJobIndex(str(path))
+
+    assert len(index) == 2 and 'a' in index and 'b' in index
+    assert all('\t' in line for line in path.read_text().splitlines())
+    assert len(SeenJobIndex(str(path))) == 2
@@ -0,0 +1,136 @@
+import json
+from datetime import datetime, timedelta
+import pytest
+from src.utils.notifications import JobNotifier
+from src.utils.seen_log import BloomFilter, SeenLog
+
+def days_ago(days: float) -> str:
+    return (datetime.now() - timedelta(days=days)).isoformat(timespec='seconds')
+
+@pytest.fixture
+def path(tmp_path):
+    return tmp_path / 'seen.txt'
+
+def test_flush_appends_and_reopen_restores(path):
+    """Test that flushed keys survive a reopen and saving only appends."""
+    log = SeenLog(str(path))
+    log.add('indeed:1')
+    log.add('linkedin:2')
+    assert 'indeed:1' in log and not path.exists()
+    log.flush()
+
+    first = path.read_text()
+    log.add('indeed:3')
+    log.flush()
+
+    assert path.read_text().startswith(first)
+    reopened = SeenLog(str(path))
+    assert len(reopened) == 3
+    assert 'linkedin:2' in reopened and 'indeed:4' not in reopened
+
+def test_entries_expire_after_ttl(path):
+    """Test that entries older than the TTL are forgotten, and re-adding refreshes them."""
+    log = SeenLog(str(path), ttl_days=30)
+    log.add('old', days_ago(40))
+    log.add('refreshed', days_ago(40))
+    log.add('refreshed')
+    log.add('recent', days_ago(1))
+    log.flush()
+
+    reopened = SeenLog(str(path), ttl_days=30)
+    assert 'old' not in reopened
+    assert 'refreshed' in reopened and 'recent' in reopened
+    assert len(reopened) == 2
+    assert 'old' in SeenLog(str(path), ttl_days=None)
+
+def test_compaction_keeps_latest_live_entries(path):
+    """Test that a log of mostly dead lines is rewritten with one line per live key."""
+    log = SeenLog(str(path), ttl_days=30, compact_min_lines=10)
+    for number in range(20):
+        log.add(f'expired:{number}', days_ago(60))
+    log.add('live:1', days_ago(2))
+    log.add('live:1')
+    log.add('live:2')
+    log.flush()
+
+    lines = path.read_text().splitlines()
+    assert [line.split('\t')[1] for line in lines] == ['live:1', 'live:2']
+    assert SeenLog(str(path)).get('live:1') == log.get('live:1')
+
+def test_partial_last_line_is_dropped(path):
+    """Test that a line cut short by a crash is discarded before appending."""
+    path.write_text(f"{days_ago(1)}\tindeed:1\n{days_ago(1)}\tind")
+    log = SeenLog(str(path))
+    log.add('indeed:2')
+    log.flush()
+
+    assert path.read_text().splitlines()[-1].endswith('\tindeed:2')
+    assert len(SeenLog(str(path))) == 2
+
+def test_bloom_filter_has_no_false_negatives():
+    """Test that every added key is reported and few others are."""
+    bloom = BloomFilter(1000, error_rate=0.01)
+    for number in range(1000):
+        bloom.add(f'key:{number}')
+
+    assert all(f'key:{number}' in bloom for number in range(1000))
+    assert sum(f'other:{number}' in bloom for number in range(10000)) < 300
+
+def test_bloom_front_avoids_loading_log(path):
+    """Test that unseen keys are ruled out by the saved filter without reading the log."""
+    log = SeenLog(str(path), bloom_capacity=100)
+    log.add('indeed:1')
+    log.flush()
+    assert log.bloom_path.exists()
+
+    reopened = SeenLog(str(path), bloom_capacity=100)
+    assert 'indeed:2' not in reopened
+    assert reopened._entries is None
+    assert 'indeed:1' in reopened
+    assert reopened._entries is not None
+
+def test_bloom_catches_up_with_appended_lines(path):
+    """Test that lines appended after the filter was saved are added on open."""
+    log = SeenLog(str(path), bloom_capacity=100)
+    log.add('indeed:1')
+    log.flush()
+    with open(path, 'a') as f:
+        f.write(f"{days_ago(0)}\tindeed:2\n")
+
+    assert 'indeed:2' in SeenLog(str(path), bloom_capacity=100)
+
+def test_bloom_log_compacts_without_loading(path):
+    """Test that a log behind a Bloom filter is compacted across runs without loading it into memory."""
+    SeenLog(str(path), ttl_days=30, bloom_capacity=100, compact_min_lines=10)
+    for run in range(4):
+        log = SeenLog(str(path), ttl_days=30, bloom_capacity=100, compact_min_lines=10)
+        for number in range(3):
+            log.add(f'expired:{run}-{number}', days_ago(60))
+        log.add('live:1')
+        log.flush()
+        assert log._entries is None
+
+    # The third run crossed compact_min_lines and left only live:1; the fourth appended after it
+    keys = [line.split('\t')[1] for line in path.read_text().splitlines()]
+    assert keys == ['live:1', 'expired:3-0', 'expired:3-1', 'expired:3-2', 'live:1']
+    reopened = SeenLog(str(path), ttl_days=30, bloom_capacity=100, compact_min_lines=10)
+    assert 'live:1' in reopened and 'expired:0-0' not in reopened
+    assert reopened._lines == len(keys)
+
+def test_notifier_imports_last_notified_json(tmp_path, monkeypatch):
+    """Test that jobs recorded in the old JSON file are not notified again."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'data').mkdir()
+    (tmp_path / 'data' / 'last_notified.json').write_text(json.dumps({
+        'https://example.com/1': datetime.now().isoformat()
+    }))
+    config = tmp_path / 'notifications.json'
+    config.write_text('{"email": {"enabled": false}, "keywords": ["python"], "locations": [], "companies": []}')
+
+    notifier = JobNotifier(str(config))
+    jobs = [{'title': 'Python Developer', 'url': 'https://example.com/1'},
+            {'title': 'Python Engineer', 'url': 'https://example.com/2'}]
+
+    assert notifier.check_new_jobs(jobs) == jobs[1:]
+    assert JobNotifier(str(config)).check_new_jobs(jobs) == []
+    assert (tmp_path / 'data' / 'notified_jobs.txt').read_text().count('\n') == 2
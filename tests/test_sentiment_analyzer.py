@@ -1,5 +1,11 @@
+import os
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
 import pytest
 from src.utils.sentiment_analyzer import SentimentAnalyzer
+from src.utils.sentiment_cache import SentimentCache
 
 @pytest.fixture
 def sentiment_analyzer():
@@ -84,4 +90,126 @@ def test_company_sentiment_empty_list(sentiment_analyzer):
     result = sentiment_analyzer.analyze_company_sentiment([])
     assert result['average_sentiment'] == 'neutral'
     assert result['total_postings'] == 0
-    assert result['sentiment_distribution'] == {'positive': 0, 'neutral': 0, 'negative': 0} 
\ No newline at end of file
+    assert result['sentiment_distribution'] == {'positive': 0, 'neutral': 0, 'negative': 0} 
+
+def test_analyze_many_matches_single_analysis(sentiment_analyzer):
+    """Test that batch analysis returns the same results as one-by-one analysis."""
+    descriptions = [
+        'Join our amazing team with great benefits!',
+        'Long hours and a stressful, demanding environment.',
+        'Standard position with regular hours.',
+        '',
+        None
+    ]
+    
+    results = sentiment_analyzer.analyze_many(descriptions, batch_size=2)
+    
+    assert len(results) == len(descriptions)
+    for description, result in zip(descriptions, results):
+        assert result == sentiment_analyzer.analyze_job_description(description)
+
+def test_analyze_many_with_process_pool(sentiment_analyzer):
+    """Test batch analysis spread over worker processes."""
+    descriptions = ['Great team and excellent benefits!', 'Terrible, awful hours.'] * 5
+    
+    results = sentiment_analyzer.analyze_many(descriptions, batch_size=2, n_process=2)
+    
+    assert [r['overall_sentiment'] for r in results] == [
+        sentiment_analyzer.analyze_job_description(d)['overall_sentiment'] for d in descriptions
+    ]
+
+def test_cached_analysis_is_not_rescored(tmp_path, monkeypatch):
+    """Test that a description is scored once and then served from the cache."""
+    cache = SentimentCache(str(tmp_path / 'sentiment.sqlite3'))
+    analyzer = SentimentAnalyzer(cache=cache)
+    description = 'Join our amazing team with great benefits!'
+    
+    first = analyzer.analyze_job_description(description)
+    monkeypatch.setattr(analyzer, '_score_batch', lambda *args: pytest.fail('description was rescored'))
+    
+    assert analyzer.analyze_many([description, '  Join our amazing team   with great benefits!  ']) == [first, first]
+    assert SentimentAnalyzer(cache=SentimentCache(str(tmp_path / 'sentiment.sqlite3'))).analyze_job_description(description) == first
+
+def test_company_sentiment_reuses_existing_results(sentiment_analyzer, monkeypatch):
+    """Test that postings carrying sentiment_analysis are not analyzed again."""
+    scored = sentiment_analyzer.analyze_job_description('Join our amazing team with great benefits!')
+    job_postings = [{'description': 'ignored', 'sentiment_analysis': scored}] * 2
+    monkeypatch.setattr(sentiment_analyzer, '_score_batch', lambda *args: pytest.fail('posting was rescored'))
+    
+    result = sentiment_analyzer.analyze_company_sentiment(job_postings)
+    assert result['total_postings'] == 2
+    assert result['sentiment_distribution'][scored['overall_sentiment']] == 2
+
+def test_analyze_companies_groups_by_normalized_name(sentiment_analyzer):
+    """Test that all companies are summarized in one call with normalized grouping."""
+    job_postings = [
+        {'description': 'Join our amazing team with great benefits!', 'company': 'Tech Corp'},
+        {'description': 'Standard position with regular hours.', 'company': 'TECH CORP.'},
+        {'description': 'Fast-paced environment with growth opportunities.', 'company': 'Data Inc'}
+    ]
+    
+    result = sentiment_analyzer.analyze_companies(job_postings)
+    
+    assert set(result) == {'tech', 'data'}
+    assert result['tech']['company'] == 'Tech Corp'
+    assert result['tech']['total_postings'] == 2
+    assert result['data']['total_postings'] == 1
+
+# Run in a fresh interpreter, since model settings are read and models loaded once per process
+def run_python(*blocks, **env):
+    result = subprocess.run(
+        [sys.executable, '-c', ''.join(textwrap.dedent(block) for block in blocks)],
+        cwd=Path(__file__).resolve().parent.parent,
+        env={**os.environ, **env},
+        capture_output=True,
+        text=True
+    )
+    assert result.returncode == 0, result.stderr
+    return result.stdout.split()
+
+# Makes any network access or NLTK download in the child process fail
+NO_NETWORK = """
+    import socket
+    import nltk
+    def refuse(*args, **kwargs):
+        raise AssertionError('network access')
+    socket.socket.connect = refuse
+    nltk.download = refuse
+"""
+
+def test_import_does_not_load_models():
+    """Test that importing the module loads neither spaCy nor NLTK."""
+    loaded = run_python("""
+        import sys
+        import src.utils.sentiment_analyzer
+        print('spacy' in sys.modules, 'nltk' in sys.modules)
+    """)
+
+    assert loaded == ['False', 'False']
+
+def test_vader_lexicon_is_loaded_from_local_file(tmp_path):
+    """Test that VADER_LEXICON is used without touching the network."""
+    lexicon = tmp_path / 'vader_lexicon.txt'
+    # Like the lexicon NLTK ships, without a trailing newline
+    lexicon.write_text('splendid\t3.0\t0.5\t[3, 3, 3]')
+
+    scores = run_python(NO_NETWORK, """
+        from src.utils.sentiment_analyzer import get_vader
+        sia = get_vader()
+        print(sia.polarity_scores('splendid')['compound'] > 0, sia.polarity_scores('wonderful')['compound'])
+    """, VADER_LEXICON=str(lexicon), SENTIMENT_OFFLINE='1')
+
+    assert scores == ['True', '0.0']
+
+def test_offline_mode_never_downloads(tmp_path):
+    """Test that SENTIMENT_OFFLINE raises on a missing lexicon instead of downloading it."""
+    error = run_python(NO_NETWORK, f"""
+        nltk.data.path[:] = [{str(tmp_path)!r}]
+        from src.utils.sentiment_analyzer import get_vader
+        try:
+            get_vader()
+        except LookupError:
+            print('LookupError')
+    """, SENTIMENT_OFFLINE='1', NLTK_DATA=str(tmp_path))
+
+    assert error == ['LookupError']
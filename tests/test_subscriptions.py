@@ -0,0 +1,99 @@
+import json
+import random
+import pytest
+from src.utils.matching import CriteriaMatcher
+from src.utils.notifications import JobNotifier
+from src.utils.subscriptions import Subscriber, SubscriptionIndex
+
+@pytest.fixture
+def index():
+    return SubscriptionIndex([
+        Subscriber('data', 'data@example.com', keywords=['Python', 'pandas'], locations=['Remote']),
+        Subscriber('web', 'web@example.com', keywords=['django', 'python'], companies=['Tech Corp']),
+        Subscriber('jvm', 'jvm@example.com', keywords=['java']),
+    ])
+
+def test_route_finds_every_matching_subscriber(index):
+    """Test that one job is routed to each subscriber it matches, with their own rules."""
+    job = {'title': 'Python Developer', 'description': 'Django and pandas', 'location': 'Remote',
+           'company': 'Other Corp'}
+
+    assert index.route(job) == {
+        'data': {'keywords': ['Python', 'pandas'], 'locations': ['Remote']},
+        'web': {'keywords': ['django', 'python']},
+    }
+
+def test_route_many_groups_jobs_by_subscriber(index):
+    """Test that jobs are grouped per subscriber in job order."""
+    jobs = [
+        {'title': 'Java Engineer', 'company': 'Tech Corp'},
+        {'title': 'Python Engineer'},
+        {'title': 'Go Engineer'},
+    ]
+
+    digests = index.route_many(jobs)
+
+    assert [job['title'] for job, _ in digests['web']] == ['Java Engineer', 'Python Engineer']
+    assert [job['title'] for job, _ in digests['jvm']] == ['Java Engineer']
+    assert [job['title'] for job, _ in digests['data']] == ['Python Engineer']
+
+def test_add_and_remove_update_routing(index):
+    """Test that replacing and removing subscribers updates the index."""
+    job = {'title': 'Java Engineer'}
+    assert list(index.route(job)) == ['jvm']
+
+    index.add(Subscriber('jvm', 'jvm@example.com', keywords=['kotlin']))
+    assert index.route(job) == {}
+    assert index.remove('jvm').keywords == ['kotlin']
+    assert index.remove('jvm') is None
+    assert 'jvm' not in index and len(index) == 2
+    assert index.route({'title': 'Kotlin Engineer'}) == {}
+
+def test_route_agrees_with_per_subscriber_matching():
+    """Test that the index routes exactly as matching each subscriber separately would."""
+    rng = random.Random(3)
+    vocabulary = ['python', 'java', 'go', 'rust', 'remote', 'austin', 'acme', 'globex', 'data', 'web']
+    subscribers = [
+        Subscriber(f's{number}', f's{number}@example.com',
+                   keywords=rng.sample(vocabulary, 2), locations=rng.sample(vocabulary, 1),
+                   companies=rng.sample(vocabulary, rng.randint(0, 1)))
+        for number in range(50)
+    ]
+    index = SubscriptionIndex(subscribers)
+
+    for _ in range(100):
+        job = {field: ' '.join(rng.sample(vocabulary, 2)) for field in ('title', 'description', 'location', 'company')}
+        expected = {}
+        for subscriber in subscribers:
+            rules = CriteriaMatcher(**subscriber.rules()).matches(job)
+            if rules:
+                expected[subscriber.subscriber_id] = rules
+        assert index.route(job) == expected
+
+def test_subscriber_needs_id_and_email():
+    """Test that config entries without an id or email are rejected."""
+    with pytest.raises(ValueError):
+        Subscriber.from_dict({'id': 'team', 'keywords': ['python']})
+
+def test_notifier_sends_each_subscriber_their_digest(tmp_path, monkeypatch):
+    """Test that the notifier sends one email per subscriber with only their matches."""
+    monkeypatch.chdir(tmp_path)
+    config = tmp_path / 'notifications.json'
+    config.write_text(json.dumps({
+        'email': {'enabled': False, 'to_email': 'me@example.com'},
+        'keywords': ['python'], 'locations': [], 'companies': [],
+        'subscribers': [{'id': 'jvm', 'email': 'jvm@example.com', 'keywords': ['java']}],
+    }))
+    notifier = JobNotifier(str(config))
+    sent = []
+    monkeypatch.setattr(notifier, '_send_email', lambda subject, body, to_email=None: sent.append((to_email, subject)))
+
+    jobs = [
+        {'title': 'Python Developer', 'url': 'https://example.com/1'},
+        {'title': 'Java and Python Developer', 'url': 'https://example.com/2'},
+        {'title': 'Go Developer', 'url': 'https://example.com/3'},
+    ]
+
+    assert notifier.check_new_jobs(jobs) == jobs[:2]
+    assert sorted(sent) == [('jvm@example.com', 'New Job Matches Found: 1'),
+                            ('me@example.com', 'New Job Matches Found: 2')]
@@ -0,0 +1,62 @@
+import threading
+import time
+import src.sweep
+from src.sweep import run_sweep
+
+class FakeScrape:
+    """Stands in for scrape_jobs, recording how many searches run on each platform at once."""
+
+    def __init__(self, delays):
+        """
+        Args:
+            delays (Dict[str, float]): Seconds each query's search takes
+        """
+        self.delays = delays
+        self.running = {}
+        self.max_running = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, platform, query, location, max_pages, **kwargs):
+        with self._lock:
+            self.running[platform] = self.running.get(platform, 0) + 1
+            self.max_running[platform] = max(self.max_running.get(platform, 0), self.running[platform])
+        time.sleep(self.delays[query])
+        with self._lock:
+            self.running[platform] -= 1
+        return [{'title': f'{platform} {query} {location}'}]
+
+def test_sweep_respects_per_platform_concurrency(monkeypatch):
+    """Test that no platform runs more searches at once than its limit, whatever the key's case."""
+    scrape = FakeScrape({f'q{n}': 0.05 for n in range(6)})
+    monkeypatch.setattr(src.sweep, 'scrape_jobs', scrape)
+    matrix = {
+        'platforms': ['Indeed', 'linkedin'],
+        'queries': [f'q{n}' for n in range(6)],
+        'locations': ['Remote'],
+        'concurrency': {'Indeed': 3, 'LinkedIn': 2},
+    }
+
+    jobs = run_sweep(matrix, use_cache=False)
+
+    assert len(jobs) == 12
+    assert scrape.max_running == {'indeed': 3, 'linkedin': 2}
+
+def test_sweep_returns_results_in_matrix_order(monkeypatch):
+    """Test that jobs come back in platform x query x location order, not completion order."""
+    scrape = FakeScrape({'slow': 0.2, 'fast': 0})
+    monkeypatch.setattr(src.sweep, 'scrape_jobs', scrape)
+    matrix = {
+        'platforms': ['indeed', 'linkedin'],
+        'queries': ['slow', 'fast'],
+        'locations': ['Remote', 'Berlin'],
+        'concurrency': {'indeed': 4, 'linkedin': 4},
+    }
+
+    jobs = run_sweep(matrix, use_cache=False)
+
+    assert [job['title'] for job in jobs] == [
+        f'{platform} {query} {location}'
+        for platform in ('indeed', 'linkedin') for query in ('slow', 'fast') for location in ('Remote', 'Berlin')
+    ]
+    assert jobs[0]['search_query'] == 'slow'
+    assert jobs[0]['search_location'] == 'Remote'
@@ -0,0 +1,55 @@
+import re
+import numpy as np
+import pandas as pd
+import pytest
+from src.utils.text import clean_series, clean_text, clean_texts
+
+def legacy_clean_text(text):
+    """Reference implementation clean_text must stay equivalent to."""
+    if not isinstance(text, str):
+        return str(text)
+    text = re.sub(r'\s+', ' ', text)
+    text = re.sub(r'[^\w\s.,$]', '', text)
+    return text.strip()
+
+SAMPLES = [
+    'Python Developer',
+    '  Senior  Python\tDeveloper\n',
+    'SOFTWARE DEVELOPER - JUNIOR  0415202566741',
+    '$80,000 - $100,000 a year',
+    'Stadium Operations Assistant (Part-Time)!',
+    'Café Crème — Zürich office',
+    'a\x1cb\x00c',
+    ' - leading and trailing - ',
+    '',
+    'Not specified',
+]
+
+@pytest.mark.parametrize('text', SAMPLES)
+def test_clean_text_matches_legacy(text):
+    """Test that the fast paths give the same result as the original two-regex version."""
+    assert clean_text(text) == legacy_clean_text(text)
+
+def test_clean_text_non_string():
+    """Test that non-string values are converted to strings."""
+    assert clean_text(42) == '42'
+    assert clean_text(None) == 'None'
+
+def test_clean_texts_preserves_order():
+    """Test that batch cleaning returns one cleaned value per input, in order."""
+    assert clean_texts(SAMPLES + SAMPLES[:3]) == [legacy_clean_text(text) for text in SAMPLES + SAMPLES[:3]]
+
+def test_clean_texts_does_not_mix_equal_values_of_different_types():
+    """Test that values comparing equal across types are each cleaned on their own."""
+    assert clean_texts([1, 1.0, True]) == ['1', '1.0', 'True']
+
+def test_clean_series_keeps_index_and_missing_values():
+    """Test that Series cleaning keeps the index and name and leaves NaN missing."""
+    series = pd.Series(['  Tech  Corp ', np.nan, 'Tech Corp!'], index=[10, 11, 12], name='company')
+
+    cleaned = clean_series(series)
+
+    assert cleaned.name == 'company'
+    assert list(cleaned.index) == [10, 11, 12]
+    assert cleaned[10] == cleaned[12] == 'Tech Corp'
+    assert pd.isna(cleaned[11])
@@ -0,0 +1,72 @@
+import pytest
+from src.utils.helpers import JsonLinesWriter
+from src.utils.urls import canonicalize_url, job_id, job_key, validate_url
+
+@pytest.mark.parametrize('url,valid', [
+    ('https://www.indeed.com/jobs?q=python', True),
+    ('http://localhost:8000/jobs', True),
+    ('http://127.0.0.1/', True),
+    ('ftp://example.com/file', False),
+    ('not a url', False),
+])
+def test_validate_url(url, valid):
+    """Test that only http(s) URLs with a host are accepted."""
+    assert validate_url(url) is valid
+
+def test_canonicalize_strips_tracking_and_sorts_params():
+    """Test that tracking parameters are dropped and the rest are sorted."""
+    url = 'https://Example.COM:443/careers/?utm_source=x&b=2&fbclid=abc&a=1#apply'
+
+    assert canonicalize_url(url) == 'https://example.com/careers?a=1&b=2'
+
+def test_canonicalize_keeps_non_default_port():
+    """Test that only the scheme's default port is removed."""
+    assert canonicalize_url('http://example.com:8080/jobs') == 'http://example.com:8080/jobs'
+
+def test_indeed_link_formats_agree():
+    """Test that Indeed redirect and view links reduce to one job ID."""
+    click = 'https://www.indeed.com/rc/clk?jk=4A1B2C3D4E5F6A7B&from=serp&vjs=3'
+    view = 'https://www.indeed.com/viewjob?jk=4a1b2c3d4e5f6a7b'
+
+    assert canonicalize_url(click) == canonicalize_url(view) == view
+    assert job_id(click) == job_id(view) == 'indeed:4a1b2c3d4e5f6a7b'
+
+def test_indeed_search_page_is_not_a_job():
+    """Test that a search page previewing a job is not collapsed into that job."""
+    url = 'https://www.indeed.com/jobs?q=python&vjk=4a1b2c3d4e5f6a7b'
+
+    assert job_id(url) is None
+    assert canonicalize_url(url) == 'https://www.indeed.com/jobs?q=python&vjk=4a1b2c3d4e5f6a7b'
+
+def test_platform_tracking_params_only_dropped_from_job_views():
+    """Test that search pages differing in pageNum or from stay distinct, e.g. as cache keys."""
+    first = 'https://www.linkedin.com/jobs/search/?keywords=python&pageNum=1&trk=public_jobs'
+    second = 'https://www.linkedin.com/jobs/search/?keywords=python&pageNum=2'
+
+    assert canonicalize_url(first) == 'https://www.linkedin.com/jobs/search?keywords=python&pageNum=1'
+    assert canonicalize_url(first) != canonicalize_url(second)
+    assert canonicalize_url('https://example.com/news?from=2024-01-01') == 'https://example.com/news?from=2024-01-01'
+    assert canonicalize_url('https://www.linkedin.com/jobs/view/?position=3&trk=x') == \
+        'https://www.linkedin.com/jobs/view'
+    assert canonicalize_url('https://www.indeed.com/viewjob?from=serp&tk=1') == 'https://www.indeed.com/viewjob'
+
+def test_linkedin_slug_url_reduces_to_id():
+    """Test that LinkedIn slugged and tracked links reduce to the numeric job ID."""
+    url = 'https://uk.linkedin.com/jobs/view/python-developer-at-acme-3912345678?refId=abc&trk=public_jobs'
+
+    assert job_id(url) == 'linkedin:3912345678'
+    assert canonicalize_url(url) == 'https://uk.linkedin.com/jobs/view/3912345678'
+
+def test_job_key_fallbacks():
+    """Test that job_key prefers the job ID, then the canonical URL."""
+    assert job_key({'job_id': 'indeed:abc', 'url': 'https://example.com'}) == 'indeed:abc'
+    assert job_key({'url': 'https://example.com/job/1/?utm_medium=email'}) == 'https://example.com/job/1'
+    assert job_key({'title': 'Engineer'}) is None
+
+def test_json_lines_writer_skips_tracking_variants(tmp_path):
+    """Test that the writer treats links differing only in tracking as one job."""
+    path = tmp_path / 'jobs.jsonl'
+    with JsonLinesWriter(str(path)) as writer:
+        assert writer.write({'url': 'https://www.indeed.com/rc/clk?jk=4a1b2c3d4e5f6a7b&from=serp'})
+        assert not writer.write({'url': 'https://www.indeed.com/viewjob?jk=4a1b2c3d4e5f6a7b&tk=1'})
+        assert writer.written == 1
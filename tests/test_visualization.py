@@ -0,0 +1,76 @@
+import matplotlib
+matplotlib.use('Agg')
+import pandas as pd
+import pytest
+from src.utils.visualization import JobVisualizer
+
+@pytest.fixture
+def jobs():
+    sentiment = {'textblob_score': 0.2, 'vader_scores': {'compound': 0.5}, 'spacy_score': 0.1,
+                 'overall_sentiment': 'positive'}
+    return [
+        {'title': 'Python Developer', 'company': 'Tech Corp', 'location': 'Remote', 'job_type': 'Full-time',
+         'salary': '$120,000', 'description': 'Python and Django', 'posted_date': '2025-04-01',
+         'sentiment_analysis': sentiment},
+        {'title': 'Data Engineer', 'company': 'Tech Corp', 'location': 'Nashville, TN', 'job_type': 'Contract',
+         'salary': 'Not specified', 'description': 'Spark pipelines', 'posted_date': 'Posted 3 days ago',
+         'sentiment_analysis': sentiment},
+        {'title': 'Java Developer', 'company': 'Other Corp', 'location': 'Remote', 'job_type': 'Full-time',
+         'salary': '', 'description': 'Java services', 'posted_date': '2025-04-03'},
+    ]
+
+@pytest.fixture
+def visualizer(tmp_path):
+    return JobVisualizer(str(tmp_path))
+
+def test_frame_is_typed_and_built_once(visualizer, jobs):
+    """Test that the same jobs share one frame of the plotted fields with categorical columns."""
+    frame = visualizer.frame(jobs)
+
+    assert visualizer.frame(jobs) is frame
+    assert 'title' not in frame.columns
+    for column in ('company', 'location', 'job_type'):
+        assert frame[column].dtype == 'category'
+
+def test_counts_are_memoized_per_jobs(visualizer, jobs):
+    """Test that counts are computed once and recomputed for different or grown jobs."""
+    counts = visualizer._value_counts(jobs, 'company')
+
+    assert counts.to_dict() == {'Tech Corp': 2, 'Other Corp': 1}
+    assert visualizer._value_counts(jobs, 'company') is counts
+
+    jobs.append({'company': 'New Corp'})
+    assert visualizer._value_counts(jobs, 'company')['New Corp'] == 1
+    assert visualizer._value_counts(list(jobs[:1]), 'company').to_dict() == {'Tech Corp': 1}
+
+def test_sentiment_is_flattened_once(visualizer, jobs):
+    """Test that nested sentiment analyses become typed columns, null where a job was not analyzed."""
+    sentiment = visualizer._sentiment(jobs)
+
+    assert sentiment['vader_compound'].tolist()[:2] == [0.5, 0.5]
+    assert sentiment['textblob_score'].isna().tolist() == [False, False, True]
+    assert visualizer._value_counts(jobs, 'overall_sentiment').to_dict() == {'positive': 2}
+    assert visualizer._sentiment(jobs) is sentiment
+
+def test_dataset_frames_are_accepted(visualizer):
+    """Test that a flat frame as read from the Parquet dataset is used without modifying it."""
+    dataset = pd.DataFrame({
+        'company': ['Tech Corp', 'Tech Corp'], 'location': ['Remote', None],
+        'textblob_score': [0.1, None], 'vader_compound': [0.2, None], 'spacy_score': [0.0, None],
+        'overall_sentiment': pd.Categorical(['positive', None]),
+    })
+
+    assert visualizer._value_counts(dataset, 'location').to_dict() == {'Remote': 1}
+    assert visualizer._sentiment(dataset)['textblob_score'].tolist()[0] == 0.1
+    assert dataset['company'].dtype == object
+
+def test_generate_all_visualizations_shares_frame(visualizer, jobs, tmp_path):
+    """Test that every chart is drawn from a single frame and its memoized aggregates."""
+    frame = visualizer.frame(jobs)
+    visualizer.generate_all_visualizations(jobs)
+
+    assert visualizer.frame(jobs) is frame
+    charts = {path.name.rsplit('_', 2)[0] for path in tmp_path.glob('*.png')}
+    assert charts == {'jobs_by_company', 'jobs_by_location', 'job_types', 'word_cloud', 'salary_ranges',
+                      'sentiment_trends'}
+    assert visualizer._aggregates['salary_values'].tolist() == [120000.0]